@@ -44,5 +44,23 @@ echo "  API docs available at: http://localhost:8000/docs"
 echo "  Development frontend: http://localhost:8000/public/pipeline/studiotools/index.html"
 echo "--------------------------------------------------------"
 
-# Run FastAPI backend using uvicorn
+# Run FastAPI backend using uvicorn.
+# `./launch.sh --production` (or STUDIOTOOLS_MODE=production) serves with one worker per core and no
+# auto-reload. Workers share session queues, the project registry and thumbnail renders through
+# the sqlite state backend.
+MODE="${STUDIOTOOLS_MODE:-development}"
+if [ "$1" = "--production" ]; then
+    MODE="production"
+fi
+
+if [ "$MODE" = "production" ]; then
+    WORKERS="${STUDIOTOOLS_WORKERS:-$(nproc)}"
+    export STUDIOTOOLS_STATE_BACKEND="${STUDIOTOOLS_STATE_BACKEND:-sqlite}"
+    # Per-process budgets, every worker has its own thumbnail pool and stage cache
+    export STUDIOTOOLS_THUMBNAIL_WORKERS="${STUDIOTOOLS_THUMBNAIL_WORKERS:-1}"
+    export STUDIOTOOLS_STAGE_CACHE_MB="${STUDIOTOOLS_STAGE_CACHE_MB:-$(( 16384 / WORKERS > 256 ? 16384 / WORKERS : 256 ))}"
+    echo "  Production mode: $WORKERS workers, $STUDIOTOOLS_STATE_BACKEND state backend"
+    exec python -m uvicorn src.backend.main:app --host 0.0.0.0 --port 8000 --workers "$WORKERS"
+fi
+
 python -m uvicorn src.backend.main:app --host 0.0.0.0 --port 8000 --reload
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { 
   Folder, 
   FolderPlus,
@@ -29,8 +29,18 @@ interface ProjectFile {
   category: string;
   ext: string;
   thumbnailPath?: string;
+  thumbnailState?: 'ready' | 'pending' | 'failed';
   appVersion?: string;
   application?: string;
+  // Published USD only, from the summary sidecar once the file was summarized
+  summary?: {
+    primCount: number;
+    bbox: { min: number[]; max: number[] } | null;
+    dominantGeometry: string | null;
+    defaultPrim: string | null;
+    startTimeCode: number;
+    endTimeCode: number;
+  } | null;
 }
 
 interface TreeNode {
@@ -40,6 +50,8 @@ interface TreeNode {
   subtype: string;
   children: TreeNode[];
   files: ProjectFile[];
+  // Task nodes only: highest wip version per application folder and extension
+  latestVersions?: Record<string, Record<string, number>>;
 }
 
 interface Application {
@@ -47,10 +59,76 @@ interface Application {
   appType: string;
   executable: string;
   installed: boolean;
+  versions?: { version: string | null; executable: string }[];
   extensions: string[];
   icon: string;
 }
 
+// Deltas pushed by /api/project-tree/events
+type TreeChange =
+  | { op: 'updateNode'; path: string; node: Pick<TreeNode, 'name' | 'type' | 'subtype' | 'latestVersions'> }
+  | { op: 'addNode'; parentPath: string; index: number; node: TreeNode }
+  | { op: 'removeNode'; path: string }
+  | { op: 'files'; path: string; added: ProjectFile[]; removed: string[]; changed: ProjectFile[] };
+
+// Tree polling interval used only when the event stream is unavailable
+const TREE_POLL_INTERVAL = 3000;
+
+const latestAppVersion = (node: TreeNode, appType: string) => {
+  const versions = Object.values(node.latestVersions?.[appType] ?? {});
+  return versions.length > 0 ? Math.max(...versions) : null;
+};
+
+const isWithin = (path: string, ancestor: string) =>
+  path === ancestor || path.startsWith(`${ancestor}/`) || path.startsWith(`${ancestor}\\`);
+
+const findTreeNode = (node: TreeNode, path: string): TreeNode | null => {
+  if (node.path === path) return node;
+  for (const child of node.children) {
+    if (isWithin(path, child.path)) return findTreeNode(child, path);
+  }
+  return null;
+};
+
+// Returns a copy of the tree with the node at path replaced, only cloning the nodes along the way
+const updateTreeNode = (node: TreeNode, path: string, update: (target: TreeNode) => TreeNode): TreeNode => {
+  if (node.path === path) return update(node);
+  if (!isWithin(path, node.path)) return node;
+  return { ...node, children: node.children.map(child => updateTreeNode(child, path, update)) };
+};
+
+const applyTreeChanges = (tree: TreeNode, changes: TreeChange[]): TreeNode =>
+  changes.reduce((current, change) => {
+    switch (change.op) {
+      case 'updateNode':
+        return updateTreeNode(current, change.path, node => ({ ...node, ...change.node }));
+      case 'addNode':
+        return updateTreeNode(current, change.parentPath, node => {
+          const children = node.children.filter(child => child.path !== change.node.path);
+          children.splice(change.index, 0, change.node);
+          return { ...node, children };
+        });
+      case 'removeNode': {
+        const parentPath = change.path.substring(0, Math.max(change.path.lastIndexOf('/'), change.path.lastIndexOf('\\')));
+        return updateTreeNode(current, parentPath, node => ({
+          ...node,
+          children: node.children.filter(child => child.path !== change.path)
+        }));
+      }
+      case 'files':
+        return updateTreeNode(current, change.path, node => {
+          const removed = new Set(change.removed);
+          const changed = new Map(change.changed.map(f => [f.absolutePath, f]));
+          const files = node.files
+            .filter(f => !removed.has(f.absolutePath))
+            .map(f => changed.get(f.absolutePath) || f);
+          return { ...node, files: [...files, ...change.added] };
+        });
+      default:
+        return current;
+    }
+  }, tree);
+
 export default function App() {
   // Projects states
   const [projects, setProjects] = useState<Project[]>([]);
@@ -83,6 +161,9 @@ export default function App() {
   const [contextMenu, setContextMenu] = useState<{ x: number; y: number; node: TreeNode } | null>(null);
   const [assetContextMenu, setAssetContextMenu] = useState<{ x: number; y: number; file: ProjectFile } | null>(null);
 
+  // Last ETag seen per tree URL, sent back as If-None-Match so unchanged trees come back as 304
+  const treeEtags = useRef<Record<string, string>>({});
+
   useEffect(() => {
     fetchProjects();
   }, []);
@@ -130,14 +211,50 @@ export default function App() {
 
   useEffect(() => {
     if (!activeProject) return;
-    
-    // Background polling: silently refresh the project tree every 3 seconds to auto-refresh
-    const interval = setInterval(() => {
-      fetchProjectTree(activeProject.path, true);
-    }, 3000);
-    
-    return () => clearInterval(interval);
-  }, [activeProject, selectedNode]);
+
+    // Background polling: silently refresh the whole project tree, fallback when streaming isn't available
+    let interval: number | undefined;
+    const startPolling = () => {
+      if (interval !== undefined) return;
+      interval = window.setInterval(() => {
+        fetchProjectTree(activeProject.path, true);
+      }, TREE_POLL_INTERVAL);
+    };
+
+    if (typeof EventSource === 'undefined') {
+      startPolling();
+      return () => window.clearInterval(interval);
+    }
+
+    // The server pushes a full snapshot on (re)connect, then only the nodes and files that changed
+    const source = new EventSource(`/api/project-tree/events?path=${encodeURIComponent(activeProject.path)}`);
+    source.addEventListener('tree', (e: MessageEvent) => {
+      setProjectTree(JSON.parse(e.data));
+      if (interval !== undefined) {
+        window.clearInterval(interval);
+        interval = undefined;
+      }
+    });
+    source.addEventListener('delta', (e: MessageEvent) => {
+      const { changes } = JSON.parse(e.data);
+      setProjectTree(prev => (prev ? applyTreeChanges(prev, changes) : prev));
+    });
+    source.onerror = () => {
+      // EventSource retries on its own, only give up on it when the browser closed the stream for good
+      if (source.readyState === EventSource.CLOSED) startPolling();
+    };
+
+    return () => {
+      source.close();
+      window.clearInterval(interval);
+    };
+  }, [activeProject]);
+
+  // Keep the selection pointing at the current node object whenever the tree is replaced or patched
+  useEffect(() => {
+    if (!projectTree) return;
+    setSelectedNode(prev => (prev ? findTreeNode(projectTree, prev.path) || projectTree : projectTree));
+  }, [projectTree]);
 
   const showToast = (message: string, type: 'success' | 'error' = 'success') => {
     setToast({ message, type });
@@ -157,31 +274,42 @@ export default function App() {
     }
   };
 
+  // Fetches a tree URL conditionally: resolves to null when the server answers 304 Not Modified
+  const fetchTreeJson = async (url: string): Promise<TreeNode | null> => {
+    const etag = treeEtags.current[url];
+    const response = await fetch(url, {
+      cache: 'no-store',
+      headers: etag ? { 'If-None-Match': etag } : undefined
+    });
+    if (response.status === 304) return null;
+    if (!response.ok) throw new Error(`Tree request failed with ${response.status}`);
+    const newEtag = response.headers.get('ETag');
+    if (newEtag) treeEtags.current[url] = newEtag;
+    return response.json();
+  };
+
+  // Re-fetches a single branch after a change below it and splices it into the current tree
+  const refreshBranch = async (projectPath: string, branchPath: string) => {
+    try {
+      const data = await fetchTreeJson(`/api/project-tree?path=${encodeURIComponent(projectPath)}&subtreePath=${encodeURIComponent(branchPath)}`);
+      if (data) {
+        setProjectTree(prev => (prev ? updateTreeNode(prev, branchPath, () => data) : prev));
+        setExpandedNodes(prev => ({ ...prev, [branchPath]: true }));
+      }
+    } catch (err) {
+      fetchProjectTree(projectPath, true);
+    }
+  };
+
   const fetchProjectTree = async (path: string, silent = false) => {
     if (!silent) setLoading(true);
     try {
-      const response = await fetch(`/api/project-tree?path=${encodeURIComponent(path)}`);
-      if (response.ok) {
-        const data = await response.json();
+      const data = await fetchTreeJson(`/api/project-tree?path=${encodeURIComponent(path)}`);
+      if (data) {
+        // Selection is retained (or defaulted to the root) by the projectTree effect
         setProjectTree(data);
         // Expand root by default
         setExpandedNodes(prev => ({ ...prev, [data.path]: true }));
-        
-        // Retain selection if exists, else select root
-        if (selectedNode) {
-          const findNode = (node: TreeNode): TreeNode | null => {
-            if (node.path === selectedNode.path) return node;
-            for (const child of node.children) {
-              const found = findNode(child);
-              if (found) return found;
-            }
-            return null;
-          };
-          const updated = findNode(data);
-          setSelectedNode(updated || data);
-        } else {
-          setSelectedNode(data);
-        }
       }
     } catch (err) {
       if (!silent) showToast('Failed to load project structure', 'error');
@@ -231,13 +359,14 @@ export default function App() {
   const handleCreateFolder = async (e: React.FormEvent) => {
     e.preventDefault();
     if (!selectedNode || !newFolderName) return;
+    const parentPath = selectedNode.path;
 
     try {
       const response = await fetch('/api/folders', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
-          parentPath: selectedNode.path,
+          parentPath,
           name: newFolderName,
           type: newFolderType,
           subtype: newFolderSubtype
@@ -247,7 +376,7 @@ export default function App() {
         showToast('Folder created!');
         setNewFolderName('');
         setIsFolderModalOpen(false);
-        if (activeProject) fetchProjectTree(activeProject.path);
+        if (activeProject) refreshBranch(activeProject.path, parentPath);
       } else {
         const err = await response.json();
         showToast(err.detail || 'Failed to create folder', 'error');
@@ -260,13 +389,14 @@ export default function App() {
   const handleCreateTask = async (e: React.FormEvent) => {
     e.preventDefault();
     if (!selectedNode || !newTaskName) return;
+    const parentPath = selectedNode.path;
 
     try {
       const response = await fetch('/api/tasks', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
-          parentPath: selectedNode.path,
+          parentPath,
           name: newTaskName,
           subtype: newTaskSubtype
         })
@@ -275,7 +405,7 @@ export default function App() {
         showToast('Task area successfully initialized!');
         setNewTaskName('');
         setIsTaskModalOpen(false);
-        if (activeProject) fetchProjectTree(activeProject.path);
+        if (activeProject) refreshBranch(activeProject.path, parentPath);
       } else {
         const err = await response.json();
         showToast(err.detail || 'Failed to create task', 'error');
@@ -390,7 +520,7 @@ export default function App() {
       });
       
       if (response.ok) {
-        showToast(`Regenerated thumbnail for ${file.name}!`);
+        showToast(`Queued thumbnail regeneration for ${file.name}`);
         if (activeProject) fetchProjectTree(activeProject.path, true);
       } else {
         const err = await response.json();
@@ -443,7 +573,7 @@ export default function App() {
       const response = await fetch(`/api/usd/create?path=${encodeURIComponent(usdPath)}`, { method: 'POST' });
       if (response.ok) {
         showToast('Created base USD asset!');
-        if (activeProject) fetchProjectTree(activeProject.path);
+        if (activeProject) refreshBranch(activeProject.path, selectedNode.path);
       } else {
         showToast('Failed to create base USD asset', 'error');
       }
@@ -634,6 +764,7 @@ export default function App() {
                         <div className="app-grid">
                           {applications.map(app => {
                             const isLaunching = launchingApp === app.name;
+                            const latestVersion = latestAppVersion(selectedNode, app.appType);
                             return (
                               <div 
                                 key={app.name} 
@@ -648,6 +779,7 @@ export default function App() {
                                 <span className="app-card-title">{app.name}</span>
                                 <span className="app-card-status">
                                   {isLaunching ? 'Launching...' : (app.installed ? 'Launch App' : 'Not Installed')}
+                                  {latestVersion !== null && ` · v${String(latestVersion).padStart(3, '0')}`}
                                 </span>
                               </div>
                             );
@@ -854,7 +986,7 @@ export default function App() {
                                               className="showcase-image"
                                             />
                                           ) : (
-                                            // Geometric fallback for non-USD assets
+                                            // Geometric fallback for non-USD assets and thumbnails still rendering
                                             <div style={{ 
                                               height: '100%', 
                                               width: '100%', 
@@ -868,6 +1000,10 @@ export default function App() {
                                             }}>
                                               <File size={32} style={{ color: 'var(--text-secondary)' }} />
                                               <span style={{ fontSize: '11px', fontFamily: 'var(--font-mono)' }}>{currentFile.name}</span>
+                                              {currentFile.thumbnailState === 'pending' && (
+                                                // Rendered by the background queue, picked up by a later tree refresh
+                                                <span style={{ fontSize: '10px', color: 'var(--color-usd)', letterSpacing: '0.05em' }}>RENDERING PREVIEW...</span>
+                                              )}
                                             </div>
                                           )}
                                           
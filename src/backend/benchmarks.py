@@ -0,0 +1,122 @@
+"""Micro-benchmarks for the backend hot paths.
+
+Run from the repository root, e.g. `python -m src.backend.benchmarks thumbnails`.
+"""
+import io
+import time
+import argparse
+
+def _time_per_call(fn, repeat: int) -> float:
+    fn()  # warm-up (fonts, imports, caches)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+def bench_thumbnails(repeat: int):
+    """Per-thumbnail render time with the cached base layer against redrawing it every time, plus PNG encode cost."""
+    from . import thumbnail_generator as tg
+
+    def uncached(shape):
+        tg._static_layer.cache_clear()
+        return tg.render_usd_thumbnail(shape)
+
+    print(f"{'shape':<10}{'uncached ms':>13}{'cached ms':>11}{'speedup':>10}")
+    for shape in ["sphere", "cube", "cylinder", "cone", "mesh"]:
+        cold = _time_per_call(lambda: uncached(shape), repeat)
+        warm = _time_per_call(lambda: tg.render_usd_thumbnail(shape), repeat)
+        print(f"{shape:<10}{cold * 1000:>13.1f}{warm * 1000:>11.1f}{cold / warm:>9.1f}x")
+
+    # PNG encoding is paid once per thumbnail on top of rendering
+    image = tg.render_usd_thumbnail("sphere")
+    for level in [6, tg.PNG_COMPRESS_LEVEL]:
+        buf = io.BytesIO()
+        encode = _time_per_call(lambda: image.save(io.BytesIO(), "PNG", compress_level=level), repeat)
+        image.save(buf, "PNG", compress_level=level)
+        print(f"png compress_level={level}: {encode * 1000:.1f} ms, {len(buf.getvalue()) // 1024} KB")
+
+def _triangulate_faces_loop(counts, indices):
+    # Per-face Python loop the inspector used before the vectorized version, kept as the reference
+    triangulated_indices = []
+    index_offset = 0
+    for count in counts:
+        face_indices = indices[index_offset : index_offset + count]
+        index_offset += count
+        for i in range(1, count - 1):
+            triangulated_indices.append(face_indices[0])
+            triangulated_indices.append(face_indices[i])
+            triangulated_indices.append(face_indices[i + 1])
+    return triangulated_indices
+
+def _random_polygon_mesh(face_count: int, seed: int = 0):
+    """Mixed triangles, quads and n-gons with a sprinkling of degenerate (<3 vertex) faces, as Vt arrays."""
+    import numpy as np
+    from pxr import Vt
+
+    rng = np.random.default_rng(seed)
+    counts = rng.choice([1, 2, 3, 4, 4, 4, 5, 8], size=face_count).astype(np.int32)
+    indices = rng.integers(0, face_count, size=int(counts.sum()), dtype=np.int32)
+    return Vt.IntArray.FromNumpy(counts), Vt.IntArray.FromNumpy(indices)
+
+def bench_triangulation(repeat: int):
+    """Fan triangulation of mixed n-gon meshes: the per-face Python loop against the vectorized NumPy pass."""
+    import numpy as np
+    from .usd_utils import _triangulate_faces
+
+    print(f"{'faces':>10}{'loop ms':>12}{'numpy ms':>12}{'speedup':>10}")
+    for face_count in [100_000, 1_000_000]:
+        counts, indices = _random_polygon_mesh(face_count)
+        expected = _triangulate_faces_loop(counts, indices)
+        if not np.array_equal(_triangulate_faces(counts, indices), expected):
+            raise AssertionError(f"vectorized triangulation differs from the loop on {face_count} faces")
+
+        # The loop takes seconds on dense meshes, a couple of runs is plenty
+        legacy = _time_per_call(lambda: _triangulate_faces_loop(counts, indices), max(1, repeat // 10))
+        fast = _time_per_call(lambda: _triangulate_faces(counts, indices), repeat)
+        print(f"{face_count:>10}{legacy * 1000:>12.1f}{fast * 1000:>12.1f}{legacy / fast:>9.1f}x")
+
+def bench_metadata(repeat: int):
+    """Reading a few thousand YAML cards: PyYAML's pure Python loader, the libyaml loader, and memoized re-reads."""
+    import os
+    import tempfile
+    import yaml
+    from . import metadata_io
+
+    card_count = 3000
+    with tempfile.TemporaryDirectory() as root:
+        paths = []
+        for i in range(card_count):
+            path = os.path.join(root, f"card_{i:05d}.yaml")
+            metadata_io.write_card(path, {
+                "name": f"sh{i:04d}", "path": path, "type": "task", "subtype": "model", "date": "2026-01-01T00:00:00",
+                "application": "blender", "version": "4.2", "shape": "sphere", "frames": {"start": 1001, "end": 1100}
+            }, sort_keys=False, default_flow_style=False)
+            paths.append(path)
+
+        def read_all(loader):
+            for path in paths:
+                with open(path, "r", encoding="utf-8") as f:
+                    yaml.load(f, Loader=loader)
+
+        runs = max(1, repeat // 10)
+        pure = _time_per_call(lambda: read_all(yaml.SafeLoader), runs)
+        fast = _time_per_call(lambda: read_all(metadata_io.SafeLoader), runs)
+        memoized = _time_per_call(lambda: [metadata_io.read_card(path) for path in paths], repeat)
+
+    print(f"{card_count} cards, libyaml {'available' if metadata_io.HAS_LIBYAML else 'missing (fallback loader)'}")
+    print(f"{'pure python':<14}{pure * 1000:>10.1f} ms")
+    print(f"{'libyaml':<14}{fast * 1000:>10.1f} ms{pure / fast:>9.1f}x")
+    print(f"{'memoized':<14}{memoized * 1000:>10.1f} ms{pure / memoized:>9.1f}x")
+
+BENCHMARKS = {
+    "thumbnails": bench_thumbnails,
+    "triangulation": bench_triangulation,
+    "metadata": bench_metadata,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Studio Tools backend micro-benchmarks")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args.repeat)
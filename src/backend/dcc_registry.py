@@ -0,0 +1,153 @@
+import os
+import re
+import glob
+import time
+import threading
+
+# Full rescans happen at least this often, installs landing in unwatched folders show up by then
+REFRESH_INTERVAL = float(os.environ.get("STUDIOTOOLS_DCC_REFRESH", "300"))
+
+# How often the install folders are stat'ed for changes between full rescans
+WATCH_INTERVAL = 10.0
+
+BLENDER_PATHS = ["/usr/bin/blender", "/snap/bin/blender", "/usr/local/bin/blender"]
+BLENDER_GLOB = "/opt/blender*/blender"
+HOUDINI_GLOB = "/opt/hfs*"
+NUKE_GLOBS = ["/usr/local/Nuke*", "/opt/Nuke*"]
+
+# Folders whose entries change when a DCC is installed or removed
+WATCHED_DIRS = ["/usr/bin", "/snap/bin", "/usr/local/bin", "/usr/local", "/opt"]
+
+VERSION_RE = re.compile(r"(\d+(?:\.\d+)*(?:v\d+)?)")
+
+
+def _version_from(path: str):
+    match = VERSION_RE.search(os.path.basename(path.rstrip("/")))
+    return match.group(1) if match else None
+
+
+def _scan_blender() -> list:
+    installs = [{"version": None, "executable": path} for path in BLENDER_PATHS if os.path.isfile(path)]
+    for exe in sorted(glob.glob(BLENDER_GLOB)):
+        if os.path.isfile(exe):
+            installs.append({"version": _version_from(os.path.dirname(exe)), "executable": exe})
+    return installs
+
+
+def _scan_houdini() -> list:
+    installs = []
+    for path in sorted(glob.glob(HOUDINI_GLOB)):
+        exe = os.path.join(path, "bin", "houdini")
+        if os.path.isfile(exe):
+            installs.append({"version": _version_from(path), "executable": exe})
+    return installs
+
+
+def _scan_nuke() -> list:
+    installs = []
+    for pattern in NUKE_GLOBS:
+        for path in sorted(glob.glob(pattern)):
+            matches = glob.glob(os.path.join(path, "Nuke*"))
+            if matches and os.path.isfile(matches[0]):
+                installs.append({"version": _version_from(path), "executable": matches[0]})
+    return installs
+
+
+# name, appType, scanner, extensions, icon. The first install found is the default, as before.
+DCCS = [
+    ("Blender", "blender", _scan_blender, ["blend"], "blender"),
+    ("Houdini", "houdini", _scan_houdini, ["hip", "hipnc"], "houdini"),
+    ("Nuke", "nuke", _scan_nuke, ["nk"], "nuke"),
+]
+
+
+class DCCRegistry:
+    """Installed DCC applications, discovered off the request path.
+
+    A background thread rescans the install locations every REFRESH_INTERVAL, and sooner when
+    one of the watched install folders changes. Requests are answered from the last scan, so
+    probing (slow on network-mounted /opt) is never paid by an API call after the first scan.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._applications = None
+        self._scanned_at = 0.0
+        self._watched = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def ready(self) -> bool:
+        return self._applications is not None
+
+    def applications(self) -> list:
+        """Returns the discovered DCCs, scanning right away if no scan completed yet."""
+        applications = self._applications
+        if applications is None:
+            applications = self.refresh()
+        return applications
+
+    def refresh(self) -> list:
+        """Rescans every install location and returns the new list."""
+        watched = self._watched_signature()
+        applications = []
+        for name, app_type, scan, extensions, icon in DCCS:
+            try:
+                installs = scan()
+            except OSError as e:
+                print(f"Failed to scan for {name}: {e}")
+                installs = []
+            applications.append({
+                "name": name,
+                "appType": app_type,
+                "executable": installs[0]["executable"] if installs else f"mock_{app_type}",
+                "installed": bool(installs),
+                "versions": installs,
+                "extensions": extensions,
+                "icon": icon
+            })
+        with self._lock:
+            self._applications = applications
+            self._scanned_at = time.monotonic()
+            self._watched = watched
+        return applications
+
+    def start(self):
+        """Starts the background refresh thread, the first scan runs right away."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="studiotools-dcc-registry", daemon=True)
+            self._thread.start()
+
+    def shutdown(self):
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=1.0)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                stale = self._applications is None or time.monotonic() - self._scanned_at >= REFRESH_INTERVAL
+                if stale or self._watched_signature() != self._watched:
+                    self.refresh()
+            except Exception as e:
+                print(f"DCC discovery failed: {e}")
+            self._stop.wait(WATCH_INTERVAL)
+
+    @staticmethod
+    def _watched_signature() -> tuple:
+        signature = []
+        for path in WATCHED_DIRS:
+            try:
+                signature.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+
+dcc_registry = DCCRegistry()
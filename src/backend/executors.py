@@ -0,0 +1,131 @@
+import os
+import asyncio
+import functools
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+
+# Pool sizes can be tuned per host. Filesystem work is mostly waiting on (network) disks, USD work
+# holds the GIL for long stretches while composing, launches only spawn a process and return.
+FILESYSTEM_WORKERS = int(os.environ.get("STUDIOTOOLS_FS_WORKERS", "8"))
+USD_WORKERS = int(os.environ.get("STUDIOTOOLS_USD_WORKERS", "4"))
+LAUNCH_WORKERS = int(os.environ.get("STUDIOTOOLS_LAUNCH_WORKERS", "2"))
+
+# Threads writing the folders and YAML cards of batch creations, shared by every batch in flight
+BATCH_WORKERS = int(os.environ.get("STUDIOTOOLS_BATCH_WORKERS", "16"))
+
+# Requests allowed to wait for a busy pool, per worker. Beyond that callers get a 503 right away
+# instead of piling up behind work that will time out on the client anyway.
+QUEUE_PER_WORKER = int(os.environ.get("STUDIOTOOLS_POOL_QUEUE_PER_WORKER", "16"))
+
+# Seconds suggested to clients turned away from a saturated pool
+RETRY_AFTER = 2
+
+
+def spawn_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool for CPU heavy or crash prone work (thumbnail renders, stage validation). Workers
+    are spawned rather than forked, a fork would copy the server's threads, locks and open files.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class PoolSaturated(Exception):
+    """Raised when a pool already has as many calls running and queued as it accepts."""
+
+    def __init__(self, pool_name: str):
+        super().__init__(f"The {pool_name} pool is saturated, retry shortly")
+        self.pool_name = pool_name
+
+
+class WorkPool:
+    """Named thread pool running one class of blocking work off the event loop.
+
+    Each pool has its own workers and its own bound on calls in flight (running plus queued), so
+    slow USD compositions cannot starve tree scans or launches, and none of them can delay the
+    endpoints that answer straight from memory on the event loop.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queued: int = None):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.max_in_flight = self.max_workers + (max_queued if max_queued is not None else self.max_workers * QUEUE_PER_WORKER)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"studiotools-{name}")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def run(self, fn, *args, **kwargs):
+        """Runs fn(*args, **kwargs) on the pool and returns its result, raising PoolSaturated when full."""
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                self.rejected += 1
+                raise PoolSaturated(self.name)
+            self._in_flight += 1
+        try:
+            future = self._executor.submit(functools.partial(fn, *args, **kwargs))
+        except RuntimeError:
+            # Shut down while the server is stopping
+            self._release(None)
+            raise
+        # Released when the call actually ends, a client hanging up doesn't free its worker
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def map(self, fn, items) -> list:
+        """
+        Runs fn(*item) for every item and waits for all of them, returning their (done) futures.
+        Called from a worker of another pool. A whole map counts as one call towards the pool's bound,
+        its items queue for the pool's threads like every other call.
+        """
+        with self._lock:
+            if self._in_flight >= self.max_in_flight:
+                self.rejected += 1
+                raise PoolSaturated(self.name)
+            self._in_flight += 1
+        try:
+            futures = [self._executor.submit(fn, *item) for item in items]
+            wait(futures)
+            return futures
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self.completed += 1
+
+    def _release(self, future):
+        with self._lock:
+            self._in_flight -= 1
+            if future is not None and not future.cancelled():
+                self.completed += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "maxInFlight": self.max_in_flight,
+                "inFlight": self._in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+filesystem_pool = WorkPool("filesystem", FILESYSTEM_WORKERS)
+usd_pool = WorkPool("usd", USD_WORKERS)
+launch_pool = WorkPool("launch", LAUNCH_WORKERS)
+# Batches are mapped onto it from the filesystem pool, one in flight per thread at most
+batch_pool = WorkPool("batch", BATCH_WORKERS, max_queued=0)
+
+WORK_POOLS = (filesystem_pool, usd_pool, launch_pool, batch_pool)
+
+
+def pool_stats() -> dict:
+    return {pool.name: pool.stats() for pool in WORK_POOLS}
+
+
+def shutdown_pools():
+    for pool in WORK_POOLS:
+        pool.shutdown()
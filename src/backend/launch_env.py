@@ -0,0 +1,140 @@
+import os
+import time
+import shutil
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+# Repository root, exported to the DCCs as STUDIOTOOLS so their plugins can find each other
+STUDIOTOOLS_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Terminal emulators tried in order for a persistent console next to the DCC
+TERMINALS = ["x-terminal-emulator", "gnome-terminal", "ptyxis", "konsole", "xterm"]
+
+# Launch traces kept in memory for /api/launch/traces
+MAX_LAUNCH_TRACES = 200
+
+_lock = threading.Lock()
+_base_envs = {}  # app type -> environment shared by every launch of that app
+_terminal = None # (PATH it was resolved against, terminal path or None)
+
+
+def base_environment(app_type: str) -> dict:
+    """
+    The environment every launch of app_type starts from: the server's environment without the
+    virtual environment leaks that break a DCC's own Python, plus the StudioTools plugin paths.
+    Built once per app type. Callers get a shared dict and must copy it before changing it.
+    """
+    with _lock:
+        env = _base_envs.get(app_type)
+        if env is not None:
+            return env
+
+    env = os.environ.copy()
+    # Clean virtual environment leaks to prevent DCC internal Python conflicts
+    env.pop("PYTHONPATH", None)
+    env.pop("PYTHONHOME", None)
+    env.pop("VIRTUAL_ENV", None)
+
+    # Clean VIRTUAL_ENV paths from PATH
+    if "PATH" in env:
+        paths = env["PATH"].split(os.pathsep)
+        env["PATH"] = os.pathsep.join(p for p in paths if ".venv" not in p)
+
+    env["STUDIOTOOLS"] = STUDIOTOOLS_ROOT
+
+    # Register custom Houdini path to load our menus and startup script
+    if app_type == "houdini":
+        plugin_dir = os.path.join(STUDIOTOOLS_ROOT, "plugins", "houdini_studiotools")
+        env["HOUDINI_PATH"] = f"{plugin_dir}:&"
+
+    with _lock:
+        _base_envs[app_type] = env
+    return env
+
+
+def task_environment(app_type: str, task_path: str) -> dict:
+    """The launch environment of one task: the cached base environment with the task variables laid over it."""
+    return {
+        **base_environment(app_type),
+        "ST_PROJECT": task_path, # approximate project folder by walking up
+        "ST_TASK": os.path.basename(task_path),
+        "ST_TASKAREA": os.path.basename(os.path.dirname(task_path)),
+        "ST_CWD": task_path
+    }
+
+
+def startup_arguments(app_type: str) -> list:
+    """Extra DCC arguments loading the StudioTools startup integration."""
+    # Register custom Blender startup script integration
+    if app_type == "blender":
+        startup_script = os.path.join(STUDIOTOOLS_ROOT, "plugins", "blender_studiotools", "scripts", "startup.py")
+        if os.path.exists(startup_script):
+            return ["--python", startup_script]
+    return []
+
+
+def find_terminal():
+    """Returns the first available terminal emulator, resolved once per PATH."""
+    global _terminal
+    path_env = os.environ.get("PATH", "")
+    cached = _terminal
+    if cached is not None and cached[0] == path_env:
+        return cached[1]
+
+    found = None
+    for term in TERMINALS:
+        found = shutil.which(term)
+        if found:
+            break
+    _terminal = (path_env, found)
+    return found
+
+
+def clear_launch_cache():
+    """Forgets the cached environments and terminal, e.g. after software was installed on the host."""
+    global _terminal
+    with _lock:
+        _base_envs.clear()
+        _terminal = None
+
+
+class LaunchTrace:
+    """Wall time of each phase of one launch, kept in launch_traces once finished."""
+
+    def __init__(self, app_name: str, app_type: str, task_path: str):
+        self.record = {
+            "appName": app_name,
+            "appType": app_type,
+            "taskPath": task_path,
+            "started": datetime.now().isoformat(),
+            "phases": {},
+            "totalMs": None,
+            "status": None
+        }
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record["phases"][name] = round((time.perf_counter() - start) * 1000, 3)
+
+    def finish(self, status: str) -> dict:
+        self.record["totalMs"] = round((time.perf_counter() - self._start) * 1000, 3)
+        self.record["status"] = status
+        with _lock:
+            launch_traces.append(self.record)
+        return self.record
+
+
+launch_traces = deque(maxlen=MAX_LAUNCH_TRACES)
+
+
+def recent_launch_traces() -> list:
+    """Finished launch traces, newest first."""
+    with _lock:
+        return list(reversed(launch_traces))
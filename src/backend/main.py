@@ -1,17 +1,32 @@
 import os
 import sys
-import yaml
-import glob
-import subprocess
+import json
+import asyncio
+import shutil
+import sqlite3
 from datetime import datetime
 from typing import List, Optional
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel
 
-from .usd_utils import inspect_usd_stage, create_empty_usd
-from .thumbnail_generator import generate_usd_thumbnail
+from .usd_utils import inspect_usd_stage, create_empty_usd, read_mesh_buffers, open_usd_stage, get_prim_children, get_prim_details, set_payload_loaded, get_usd_summary, INSPECT_LOAD_POLICY
+from .thumbnail_queue import thumbnail_queue
+from .stage_cache import stage_cache
+from .project_index import get_project_index, invalidate_path, publish_details, clean_asset_name
+from .version_index import task_versions
+from .tree_events import get_project_watcher, KEEPALIVE_INTERVAL
+from .session_commands import session_commands, SessionQueueFull
+from .shared_state import state_backend
+from .dcc_registry import dcc_registry
+from .process_supervisor import process_supervisor
+from .launch_env import task_environment, startup_arguments, find_terminal, clear_launch_cache, LaunchTrace, recent_launch_traces
+from .metadata_io import read_card, write_card
+from .usd_summary import read_summary
+from .publish_validation import publish_validator, REPORT_STATUSES
+from .executors import filesystem_pool, usd_pool, launch_pool, batch_pool, pool_stats, shutdown_pools, PoolSaturated, RETRY_AFTER
 
 app = FastAPI(title="Studio Tools API", version="2.0.0")
 
@@ -30,6 +45,12 @@ PROJECTS_CONFIG = os.path.join(SETTINGS_DIR, "projects.yaml")
 # Make sure settings directory exists
 os.makedirs(SETTINGS_DIR, exist_ok=True)
 
+# Blocking work runs on the dedicated pools in executors.py, endpoints are async and only await it.
+# A saturated pool turns requests away rather than queueing them without bound.
+@app.exception_handler(PoolSaturated)
+async def pool_saturated_handler(request: Request, exc: PoolSaturated):
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": str(RETRY_AFTER)})
+
 class ProjectModel(BaseModel):
     name: str
     path: str
@@ -45,6 +66,16 @@ class TaskCreate(BaseModel):
     name: str
     subtype: str # model, rig, fx, etc.
 
+class BatchNode(BaseModel):
+    name: str
+    type: str = "folder" # folder, taskarea, task
+    subtype: str = "custom"
+    children: List["BatchNode"] = []
+
+class BatchCreate(BaseModel):
+    parentPath: str
+    nodes: List[BatchNode]
+
 class LaunchRequest(BaseModel):
     appName: str
     appType: str
@@ -55,22 +86,27 @@ class LaunchRequest(BaseModel):
 # --- Helper Functions ---
 
 def load_projects_list() -> List[dict]:
-    if not os.path.isfile(PROJECTS_CONFIG):
-        return []
-    try:
-        with open(PROJECTS_CONFIG, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-            return data.get("projects", [])
-    except Exception:
+    data = read_card(PROJECTS_CONFIG)
+    if not isinstance(data, dict):
         return []
+    # A copy, the parsed card is shared with every other reader
+    return list(data.get("projects", []))
 
 def save_projects_list(projects: List[dict]):
     try:
-        with open(PROJECTS_CONFIG, "w", encoding="utf-8") as f:
-            yaml.safe_dump({"projects": projects}, f, sort_keys=False, default_flow_style=False)
+        # Written aside and renamed, other workers may be reading the list meanwhile
+        write_card(PROJECTS_CONFIG, {"projects": projects}, sort_keys=False, default_flow_style=False)
     except Exception as e:
         print(f"Failed to save projects list: {e}")
 
+def register_project(name: str, path: str):
+    # Read-modify-write of the shared list, serialized across threads and server workers
+    with state_backend.lock("projects"):
+        projects = load_projects_list()
+        if not any(p["path"] == path for p in projects):
+            projects.append({"name": name, "path": path})
+            save_projects_list(projects)
+
 def create_folder_yaml(path: str, name: str, node_type: str, subtype: str):
     os.makedirs(path, exist_ok=True)
     config_path = os.path.join(path, "folder.yaml")
@@ -81,51 +117,43 @@ def create_folder_yaml(path: str, name: str, node_type: str, subtype: str):
         "subtype": subtype,
         "date": datetime.now().isoformat()
     }
-    with open(config_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False, default_flow_style=False)
+    write_card(config_path, data, sort_keys=False, default_flow_style=False)
+
+def create_task_folder(path: str, name: str, subtype: str):
+    # Create task folder with YAML
+    create_folder_yaml(path, name, "task", subtype)
+
+    # Create standard folders
+    for folder in ["wip", "versions", "published"]:
+        os.makedirs(os.path.join(path, folder), exist_ok=True)
 
 def get_latest_task_version(task_path: str) -> int:
-    version = 1
-    wip_dir = os.path.join(task_path, "wip")
-    if not os.path.exists(wip_dir):
-        return version
-        
-    for app_folder in os.listdir(wip_dir):
-        joint_folder = os.path.join(wip_dir, app_folder)
-        if os.path.isdir(joint_folder):
-            for file_name in os.listdir(joint_folder):
-                # Simple version extraction like v001
-                import re
-                match = re.search(r"[._-]?v(\d+)", file_name, re.IGNORECASE)
-                if match:
-                    version = max(version, int(match.group(1)))
-    return version
+    return task_versions.latest_version(task_path)
 
 # --- API Endpoints ---
 
 @app.get("/api/projects")
-def get_projects():
+async def get_projects():
     """Lists all registered VFX projects."""
-    return load_projects_list()
+    return await filesystem_pool.run(load_projects_list)
 
 @app.post("/api/projects")
-def create_project(project: ProjectModel):
+async def create_project(project: ProjectModel):
     """Creates a new project directory structure and registers it."""
+    return await filesystem_pool.run(_create_project, project)
+
+def _create_project(project: ProjectModel):
     path = os.path.abspath(project.path)
     if os.path.exists(os.path.join(path, "project.yaml")):
         # Register if already exists
-        projects = load_projects_list()
-        if not any(p["path"] == path for p in projects):
-            projects.append({"name": project.name, "path": path})
-            save_projects_list(projects)
+        register_project(project.name, path)
         return {"status": "success", "message": "Project already existed and was registered", "path": path}
 
     try:
         os.makedirs(path, exist_ok=True)
         # Create project.yaml
         project_config = os.path.join(path, "project.yaml")
-        with open(project_config, "w", encoding="utf-8") as f:
-            yaml.safe_dump({"name": project.name, "path": path, "created": datetime.now().isoformat()}, f)
+        write_card(project_config, {"name": project.name, "path": path, "created": datetime.now().isoformat()})
 
         # Create default subfolders
         default_folders = [
@@ -139,242 +167,222 @@ def create_project(project: ProjectModel):
             create_folder_yaml(folder_path, folder["name"], folder["type"], folder["subtype"])
 
         # Register project
-        projects = load_projects_list()
-        if not any(p["path"] == path for p in projects):
-            projects.append({"name": project.name, "path": path})
-            save_projects_list(projects)
+        register_project(project.name, path)
 
         return {"status": "success", "message": "Project created successfully", "path": path}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create project: {str(e)}")
 
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True when an If-None-Match header lists etag (weak comparison, as RFC 9110 asks for GET)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
 @app.get("/api/project-tree")
-def get_project_tree(path: str):
-    """Recursively builds the project folder/task hierarchy."""
+async def get_project_tree(path: str, request: Request, subtreePath: Optional[str] = None, depth: Optional[int] = None):
+    """Returns the project folder/task hierarchy (or one branch of it) from the cached, incrementally updated project index."""
+    body, etag = await filesystem_pool.run(_project_tree_json, path, subtreePath, depth)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _project_tree_json(path: str, subtree_path: Optional[str], depth: Optional[int]):
     if not os.path.exists(path):
         raise HTTPException(status_code=404, detail="Project path not found")
+    body, etag = get_project_index(path).get_tree_json(subtree_path, depth)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Subtree path not found in project")
+    return body, etag
+
+@app.get("/api/project-tree/events")
+async def get_project_tree_events(path: str):
+    """Streams the project tree as Server-Sent Events: a full snapshot on connect, then only deltas."""
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Project path not found")
+    watcher = get_project_watcher(path)
+    queue, tree = await watcher.subscribe()
 
-    def build_tree(current_path: str):
-        name = os.path.basename(current_path)
-        if not name:
-            name = current_path
-            
-        node_type = "folder"
-        subtype = "custom"
-        
-        project_yaml = os.path.join(current_path, "project.yaml")
-        folder_yaml = os.path.join(current_path, "folder.yaml")
-        
-        if os.path.isfile(project_yaml):
-            node_type = "project"
-        elif os.path.isfile(folder_yaml):
-            try:
-                with open(folder_yaml, "r") as f:
-                    data = yaml.safe_load(f) or {}
-                    node_type = data.get("type", "folder")
-                    subtype = data.get("subtype", "custom")
-            except Exception:
-                pass
-
-        # Find USD and other files if it's a task or folder
-        files = []
-        if node_type == "task":
-            for sub in ["wip", "versions", "published"]:
-                sub_dir = os.path.join(current_path, sub)
-                if os.path.exists(sub_dir):
-                    for root, _, filenames in os.walk(sub_dir):
-                        for f in filenames:
-                            # Skip pipeline metadata cards and Blender backup files from being shown in workspace lists
-                            import re
-                            if f.endswith((".yaml", ".yml")) or re.search(r"\.blend\d+$", f):
-                                continue
-                            full_f = os.path.join(root, f)
-                            rel_f = os.path.relpath(full_f, current_path)
-                            ext = os.path.splitext(f)[-1].lstrip(".")
-                            
-                            file_item = {
-                                "name": f,
-                                "relativePath": rel_f,
-                                "absolutePath": full_f,
-                                "category": sub,
-                                "ext": ext
-                            }
-                            
-                            # Automatically generate thumbnail on-the-fly for published USD deliverables
-                            if sub == "published" and ext in ["usd", "usda", "usdc"]:
-                                app = "blender"
-                                app_version = ""
-                                shape = "mesh"
-                                meta_path = os.path.join(root, "metadata.yaml")
-                                if os.path.exists(meta_path):
-                                    try:
-                                        with open(meta_path, "r", encoding="utf-8") as mf:
-                                            meta = yaml.safe_load(mf) or {}
-                                            app = meta.get("application", "blender")
-                                            app_version = meta.get("application_version", "")
-                                            # Guess shape based on exported objects
-                                            objs = meta.get("exported_root_objects", [])
-                                            if objs:
-                                                obj0 = str(objs[0]).lower()
-                                                if "sphere" in obj0:
-                                                    shape = "sphere"
-                                                elif "cube" in obj0:
-                                                    shape = "cube"
-                                                elif "cylinder" in obj0:
-                                                    shape = "cylinder"
-                                                elif "cone" in obj0:
-                                                    shape = "cone"
-                                    except Exception:
-                                        pass
-                                
-                                file_item["application"] = app
-                                file_item["appVersion"] = app_version if app_version else None
-                                
-                                thumb_path = os.path.join(root, "thumbnail.png")
-                                if not os.path.exists(thumb_path):
-                                    try:
-                                        # Use base asset name from filename for clean HUD display
-                                        asset_display = os.path.splitext(f)[0]
-                                        # Remove _v\d+ suffix for clean HUD title
-                                        clean_asset_display = re.sub(r"_v\d+$", "", asset_display)
-                                        generate_usd_thumbnail(thumb_path, shape=shape, asset_name=clean_asset_display, app_name=app)
-                                    except Exception as te:
-                                        print(f"Failed to generate thumbnail for {f}: {te}")
-                                
-                                if os.path.exists(thumb_path):
-                                    file_item["thumbnailPath"] = thumb_path
-                                    
-                            files.append(file_item)
-
-        # Recurse children
-        children = []
+    async def stream():
         try:
-            for item in os.listdir(current_path):
-                # Ignore hidden directories and build outputs
-                if item.startswith(".") or item in ["__pycache__", "wip", "versions", "published"]:
+            yield f"event: tree\ndata: {json.dumps(tree)}\n\n"
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
                     continue
-                item_path = os.path.join(current_path, item)
-                if os.path.isdir(item_path):
-                    # Check if it has folder.yaml or project.yaml
-                    if os.path.exists(os.path.join(item_path, "folder.yaml")) or os.path.exists(os.path.join(item_path, "project.yaml")):
-                        children.append(build_tree(item_path))
-        except Exception:
-            pass
-
-        return {
-            "name": name,
-            "path": current_path,
-            "type": node_type,
-            "subtype": subtype,
-            "children": children,
-            "files": files
-        }
+                yield f"event: delta\ndata: {json.dumps(payload)}\n\n"
+        finally:
+            watcher.unsubscribe(queue)
 
-    return build_tree(path)
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
 
 @app.post("/api/folders")
-def create_folder(req: FolderCreate):
+async def create_folder(req: FolderCreate):
     """Creates a subfolder or task area with metadata."""
+    return await filesystem_pool.run(_create_folder, req)
+
+def _create_folder(req: FolderCreate):
     full_path = os.path.join(req.parentPath, req.name)
     if os.path.exists(full_path):
         raise HTTPException(status_code=400, detail="Path already exists")
 
     try:
         create_folder_yaml(full_path, req.name, req.type, req.subtype)
+        invalidate_path(full_path)
         return {"status": "success", "path": full_path}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/tasks")
-def create_task(req: TaskCreate):
+async def create_task(req: TaskCreate):
     """Creates a VFX pipeline task, creating the standard wip/versions/published subfolders."""
+    return await filesystem_pool.run(_create_task, req)
+
+def _create_task(req: TaskCreate):
     full_path = os.path.join(req.parentPath, req.name)
     if os.path.exists(full_path):
         raise HTTPException(status_code=400, detail="Task path already exists")
 
     try:
-        # Create task folder with YAML
-        create_folder_yaml(full_path, req.name, "task", req.subtype)
-        
-        # Create standard folders
-        for folder in ["wip", "versions", "published"]:
-            os.makedirs(os.path.join(full_path, folder), exist_ok=True)
-            
+        create_task_folder(full_path, req.name, req.subtype)
+        invalidate_path(full_path)
         return {"status": "success", "path": full_path}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/applications")
-def get_applications(projectPath: str):
-    """Scans the system for applications and returns available tools for launch."""
-    apps = []
-    
-    # 1. Blender
-    blender_exe = None
-    for path in ["/usr/bin/blender", "/snap/bin/blender", "/usr/local/bin/blender"]:
-        if os.path.isfile(path):
-            blender_exe = path
-            break
-            
-    apps.append({
-        "name": "Blender",
-        "appType": "blender",
-        "executable": blender_exe or "mock_blender",
-        "installed": blender_exe is not None,
-        "extensions": ["blend"],
-        "icon": "blender"
-    })
-    
-    # 2. Houdini
-    houdini_exe = None
-    for path in sorted(glob.glob("/opt/hfs*")):
-        exe = os.path.join(path, "bin", "houdini")
-        if os.path.isfile(exe):
-            houdini_exe = exe
+# Nodes a single batch may create, a full show (hundreds of shots times their tasks) fits comfortably
+MAX_BATCH_NODES = 20000
+
+# Node types a batch can create
+BATCH_NODE_TYPES = ("folder", "taskarea", "task")
+
+@app.post("/api/batch/create")
+async def create_batch(req: BatchCreate):
+    """Creates a whole hierarchy of folders, task areas and tasks in one go, all or nothing."""
+    return await filesystem_pool.run(_create_batch, req)
+
+def _create_batch(req: BatchCreate):
+    parent = os.path.abspath(req.parentPath)
+    if not os.path.isdir(parent):
+        raise HTTPException(status_code=404, detail="Parent path not found")
+
+    # Flatten breadth first (the list grows while iterated), checking every node before touching the disk
+    flat = []  # (path, BatchNode)
+    results = []
+    seen = set()
+    pending = [(parent, node) for node in req.nodes]
+    for parent_path, node in pending:
+        path = os.path.join(parent_path, node.name)
+        error = None
+        if not node.name or node.name in (".", "..") or os.sep in node.name or "/" in node.name:
+            error = "Invalid name"
+        elif node.type not in BATCH_NODE_TYPES:
+            error = f"Unknown type {node.type}, expected one of {', '.join(BATCH_NODE_TYPES)}"
+        elif path in seen:
+            error = "Duplicate path in batch"
+        elif parent_path == parent and os.path.exists(path):
+            error = "Path already exists"
+        seen.add(path)
+        flat.append((path, node))
+        results.append({"path": path, "type": node.type, "status": "error" if error else "pending", **({"detail": error} if error else {})})
+        pending.extend((path, child) for child in node.children)
+        if len(flat) > MAX_BATCH_NODES:
+            raise HTTPException(status_code=400, detail=f"Batches are limited to {MAX_BATCH_NODES} nodes")
+
+    if any(result["status"] == "error" for result in results):
+        for result in results:
+            if result["status"] == "pending":
+                result["status"] = "skipped"
+        raise HTTPException(status_code=400, detail={"message": "Batch rejected, nothing was created", "results": results})
+
+    # Top level folders are made first, one by one. mkdir fails when another request created one of
+    # them since the check above, so a rollback only ever removes folders this batch made itself.
+    roots = []
+    failed = False
+    for result, (path, node) in zip(results, flat):
+        if os.path.dirname(path) != parent:
+            continue
+        try:
+            os.mkdir(path)
+        except OSError as e:
+            failed = True
+            result["status"] = "error"
+            result["detail"] = str(e)
             break
-            
-    apps.append({
-        "name": "Houdini",
-        "appType": "houdini",
-        "executable": houdini_exe or "mock_houdini",
-        "installed": houdini_exe is not None,
-        "extensions": ["hip", "hipnc"],
-        "icon": "houdini"
-    })
+        roots.append(path)
+        result["status"] = "created"
+
+    if not failed:
+        def create(path: str, node: BatchNode):
+            # makedirs creates missing parents, so nodes don't have to wait for each other
+            if node.type == "task":
+                create_task_folder(path, node.name, node.subtype)
+            else:
+                create_folder_yaml(path, node.name, node.type, node.subtype)
 
-    # 3. Nuke
-    nuke_exe = None
-    for path in sorted(glob.glob("/usr/local/Nuke*")) + sorted(glob.glob("/opt/Nuke*")):
-        exe = os.path.join(path, "Nuke*")
-        matches = glob.glob(exe)
-        if matches and os.path.isfile(matches[0]):
-            nuke_exe = matches[0]
-            break
-            
-    apps.append({
-        "name": "Nuke",
-        "appType": "nuke",
-        "executable": nuke_exe or "mock_nuke",
-        "installed": nuke_exe is not None,
-        "extensions": ["nk"],
-        "icon": "nuke"
-    })
+        futures = batch_pool.map(create, flat)
+        for result, future in zip(results, futures):
+            error = future.exception()
+            if error is None:
+                result["status"] = "created"
+            else:
+                failed = True
+                result["status"] = "error"
+                result["detail"] = str(error)
+
+    if failed:
+        # Everything else sits below the top level folders this batch made
+        for path in roots:
+            shutil.rmtree(path, ignore_errors=True)
+        for result in results:
+            if result["status"] == "created":
+                result["status"] = "rolledBack"
+            elif result["status"] == "pending":
+                result["status"] = "skipped"
+        raise HTTPException(status_code=500, detail={"message": "Batch failed and was rolled back", "results": results})
+
+    # One invalidation for the whole batch, every new node sits under the parent
+    invalidate_path(parent)
+    return {"status": "success", "created": len(results), "results": results}
+
+@app.get("/api/applications")
+async def get_applications(projectPath: str, refresh: bool = False):
+    """Returns the installed DCC applications (every version found) and built-in tools available for launch."""
+    if refresh:
+        apps = await filesystem_pool.run(_refresh_applications)
+    elif not dcc_registry.ready:
+        apps = await filesystem_pool.run(dcc_registry.refresh)
+    else:
+        apps = dcc_registry.applications()
 
     # Add a built-in interactive USD Web Editor
-    apps.append({
+    return [*apps, {
         "name": "USD Inspector",
         "appType": "usd_web",
         "executable": "web_viewer",
         "installed": True,
         "extensions": ["usd", "usda", "usdc"],
         "icon": "usd"
-    })
+    }]
 
-    return apps
+def _refresh_applications():
+    # An explicit refresh usually follows an install, which can change PATH lookups and environments too
+    clear_launch_cache()
+    return dcc_registry.refresh()
 
 @app.post("/api/launch")
-def launch_application(req: LaunchRequest):
+async def launch_application(req: LaunchRequest):
     """Launches the selected application in the context of the task, resolving version files."""
+    return await launch_pool.run(_launch_application, req)
+
+def _launch_application(req: LaunchRequest):
     # Handle mock launches for testing environments gracefully
     if "mock_" in req.executable:
         return {
@@ -388,112 +396,176 @@ def launch_application(req: LaunchRequest):
 
     if not os.path.exists(req.executable):
         raise HTTPException(status_code=404, detail=f"Executable not found at: {req.executable}")
+    trace = LaunchTrace(req.appName, req.appType, req.taskPath)
     try:
-        if req.preload:
-            launch_file = os.path.abspath(req.preload)
-            # Ensure the preload file exists
-            if not os.path.exists(launch_file):
-                raise HTTPException(status_code=404, detail=f"Preload file not found: {req.preload}")
-        else:
-            # Determine latest task version
-            version = get_latest_task_version(req.taskPath)
-            ext = "blend" if req.appType == "blender" else ("hip" if req.appType == "houdini" else "nk")
-            
-            file_name = f"scene_v{version:03d}.{ext}"
-            
-            # Prepare wip directory structure
-            wip_dir = os.path.join(req.taskPath, "wip")
-            app_dir = os.path.join(wip_dir, req.appType)
-            os.makedirs(app_dir, exist_ok=True)
-            
-            launch_file = os.path.join(app_dir, file_name)
-        
+        with trace.phase("resolve"):
+            if req.preload:
+                launch_file = os.path.abspath(req.preload)
+                # Ensure the preload file exists
+                if not os.path.exists(launch_file):
+                    raise HTTPException(status_code=404, detail=f"Preload file not found: {req.preload}")
+            else:
+                # Determine latest task version
+                version = get_latest_task_version(req.taskPath)
+                ext = "blend" if req.appType == "blender" else ("hip" if req.appType == "houdini" else "nk")
 
-                
-        # Setup environment variables
-        env = os.environ.copy()
-        # Clean virtual environment leaks to prevent DCC internal Python conflicts
-        env.pop("PYTHONPATH", None)
-        env.pop("PYTHONHOME", None)
-        env.pop("VIRTUAL_ENV", None)
-        
-        # Clean VIRTUAL_ENV paths from PATH
-        if "PATH" in env:
-            paths = env["PATH"].split(os.pathsep)
-            cleaned_paths = [p for p in paths if ".venv" not in p]
-            env["PATH"] = os.pathsep.join(cleaned_paths)
-        
-        env["ST_PROJECT"] = req.taskPath # approximate project folder by walking up
-        env["ST_TASK"] = os.path.basename(req.taskPath)
-        env["ST_TASKAREA"] = os.path.basename(os.path.dirname(req.taskPath))
-        env["ST_CWD"] = req.taskPath
-        env["STUDIOTOOLS"] = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-
-        # Register custom Houdini path to load our menus and startup script
-        if req.appType == "houdini":
-            plugin_dir = os.path.join(env["STUDIOTOOLS"], "plugins", "houdini_studiotools")
-            env["HOUDINI_PATH"] = f"{plugin_dir}:&"
-        
-        # Only pass the launch file to the DCC if it already exists on disk and is non-empty (avoiding 0-byte corruptions).
-        # If it doesn't exist, we start the DCC empty and let its startup scripts initialize and save the new version.
-        if os.path.exists(launch_file) and os.path.getsize(launch_file) > 0:
-            command = [req.executable, launch_file]
-        else:
-            command = [command_item for command_item in [req.executable] if command_item]
-        
-        # Register custom Blender startup script integration
-        if req.appType == "blender":
-            plugin_dir = os.path.join(env["STUDIOTOOLS"], "plugins", "blender_studiotools")
-            startup_script = os.path.join(plugin_dir, "scripts", "startup.py")
-            if os.path.exists(startup_script):
-                command.extend(["--python", startup_script])
-        
-        # Try to launch with a persistent terminal emulator so the user can see console output and debug crashes
-        import shutil
-        import shlex
-        
-        terminals = ["x-terminal-emulator", "gnome-terminal", "ptyxis", "konsole", "xterm"]
-        found_term = None
-        for term in terminals:
-            path = shutil.which(term)
-            if path:
-                found_term = path
-                break
-        
-        if found_term:
-            cmd_str = " ".join(shlex.quote(arg) for arg in command)
-            # Build bash command that executes the DCC and keeps the terminal open on exit
-            bash_cmd = f"{cmd_str}; echo; echo '[StudioTools] {req.appName} exited with code $?'; read -p 'Press Enter to close terminal...'"
-            
-            term_name = os.path.basename(found_term)
-            if term_name in ["xterm"]:
-                launch_cmd = [found_term, "-T", f"StudioTools: {req.appName}", "-e", "bash", "-c", bash_cmd]
+                file_name = f"scene_v{version:03d}.{ext}"
+
+                # Prepare wip directory structure
+                wip_dir = os.path.join(req.taskPath, "wip")
+                app_dir = os.path.join(wip_dir, req.appType)
+                os.makedirs(app_dir, exist_ok=True)
+
+                launch_file = os.path.join(app_dir, file_name)
+
+        with trace.phase("env"):
+            # Cached per app type, only the task variables are laid over it per launch
+            env = task_environment(req.appType, req.taskPath)
+
+            # Only pass the launch file to the DCC if it already exists on disk and is non-empty (avoiding 0-byte corruptions).
+            # If it doesn't exist, we start the DCC empty and let its startup scripts initialize and save the new version.
+            if os.path.exists(launch_file) and os.path.getsize(launch_file) > 0:
+                command = [req.executable, launch_file]
             else:
-                launch_cmd = [found_term, "-T", f"StudioTools: {req.appName}", "--", "bash", "-c", bash_cmd]
-            
-            subprocess.Popen(launch_cmd, env=env, shell=False)
-            message = f"Application {req.appName} launched in a persistent terminal!"
-        else:
-            # Fallback to direct background process if no terminal emulator is found
-            subprocess.Popen(command, env=env, shell=False)
-            message = f"Application {req.appName} launched!"
-            
-        return {"status": "success", "message": message, "file": launch_file}
+                command = [command_item for command_item in [req.executable] if command_item]
+            command.extend(startup_arguments(req.appType))
+
+            # Try to launch with a persistent terminal emulator so the user can see console output and debug crashes
+            found_term = find_terminal()
+            if found_term:
+                message = f"Application {req.appName} launched in a persistent terminal!"
+            else:
+                # Fallback to direct background process if no terminal emulator is found
+                message = f"Application {req.appName} launched!"
+
+        with trace.phase("spawn"):
+            # The supervisor tracks the DCC process and holds the launch back while the host or app cap is reached
+            session = process_supervisor.launch(req.appName, req.appType, req.taskPath, command, env, key=launch_file, terminal=found_term)
+
+        if session.get("duplicate"):
+            message = f"{req.appName} is already {session['state']} for this task"
+        elif session["state"] == "queued":
+            message = f"{req.appName} is queued (position {session['queuePosition']}), too many sessions are running on this host"
+        return {"status": "success", "message": message, "file": launch_file, "session": session, "trace": trace.finish(session["state"])}
+    except HTTPException:
+        trace.finish("error")
+        raise
     except Exception as e:
+        trace.finish("error")
         raise HTTPException(status_code=500, detail=f"Failed to launch application: {str(e)}")
 
+@app.get("/api/dcc/sessions")
+async def get_dcc_sessions():
+    """Returns queued, running and recently exited DCC sessions with PID, resident memory and uptime."""
+    return {**process_supervisor.stats(), "sessions": await filesystem_pool.run(process_supervisor.sessions)}
+
+@app.delete("/api/dcc/sessions/{session_id}")
+async def cancel_dcc_session(session_id: str):
+    """Cancels a queued DCC launch, running sessions are never killed from here."""
+    if not process_supervisor.cancel(session_id):
+        raise HTTPException(status_code=404, detail="No queued launch with this id")
+    return {"status": "success"}
+
+@app.get("/api/launch/traces")
+async def get_launch_traces():
+    """Returns the timed phases (resolve, env, spawn) of recent launches, newest first."""
+    return recent_launch_traces()
+
 @app.get("/api/usd/inspect")
-def get_usd_inspect(path: str):
+async def get_usd_inspect(path: str):
     """Opens a USD file and returns its stage prim hierarchy and attributes."""
-    result = inspect_usd_stage(path)
+    result = await usd_pool.run(inspect_usd_stage, path)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+@app.get("/api/usd/summary")
+async def get_usd_file_summary(path: str):
+    """Returns the summary sidecar of a USD file (prim count, bounds, dominant geometry, default prim, time range), building it when missing."""
+    summary = await filesystem_pool.run(read_summary, path)
+    if summary is not None:
+        return summary
+    result = await usd_pool.run(get_usd_summary, path)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+@app.get("/api/usd/stage")
+async def get_usd_stage(path: str, limit: Optional[int] = None, load: str = INSPECT_LOAD_POLICY):
+    """Opens a USD stage (payloads unloaded by default) and returns its metadata with the first page of root prims."""
+    result = await usd_pool.run(open_usd_stage, path, limit, load)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+@app.get("/api/usd/children")
+async def get_usd_children(path: str, primPath: str, offset: int = 0, limit: Optional[int] = None, load: str = INSPECT_LOAD_POLICY):
+    """Returns one page of a prim's children from the open stage."""
+    result = await usd_pool.run(get_prim_children, path, primPath, offset, limit, load)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+@app.get("/api/usd/prim")
+async def get_usd_prim(path: str, primPath: str, load: str = INSPECT_LOAD_POLICY):
+    """Returns the variant sets, composition arcs and attributes of a single prim."""
+    result = await usd_pool.run(get_prim_details, path, primPath, load)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    return result
+
+class PayloadRequest(BaseModel):
+    path: str
+    primPath: str
+    loaded: bool
+    load: str = INSPECT_LOAD_POLICY
+
+@app.post("/api/usd/payload")
+async def post_usd_payload(req: PayloadRequest):
+    """Loads or unloads a payload on the cached stage and returns the prim's refreshed summary."""
+    result = await usd_pool.run(set_payload_loaded, req.path, req.primPath, req.loaded, req.load)
     if "error" in result:
         raise HTTPException(status_code=400, detail=result["error"])
     return result
 
+@app.get("/api/usd/cache/stats")
+async def get_usd_cache_stats():
+    """Returns hit/miss/eviction counters and budget usage of the server-side stage cache."""
+    if stage_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **stage_cache.stats()}
+
+# Chunk size used when streaming raw geometry buffers
+GEOMETRY_CHUNK_BYTES = 1 << 20
+
+@app.get("/api/usd/geometry")
+async def get_usd_geometry(path: str, primPath: str, load: str = INSPECT_LOAD_POLICY,
+                     maxTriangles: Optional[int] = None, stageTriangles: Optional[int] = None):
+    """Streams a Mesh prim's points then triangle indices (optionally a decimated LOD) as raw little-endian float32/uint32 buffers."""
+    result = await usd_pool.run(read_mesh_buffers, path, primPath, load, maxTriangles, stageTriangles)
+    if "error" in result:
+        raise HTTPException(status_code=400, detail=result["error"])
+    points, indices = result["points"], result["indices"]
+
+    # Slicing buffers already in memory is cheap, the chunks are produced on the event loop
+    async def iter_buffers():
+        for array in (points, indices):
+            view = memoryview(array).cast("B")
+            for start in range(0, len(view), GEOMETRY_CHUNK_BYTES):
+                yield bytes(view[start:start + GEOMETRY_CHUNK_BYTES])
+
+    return StreamingResponse(iter_buffers(), media_type="application/octet-stream", headers={
+        "Content-Length": str(points.nbytes + indices.nbytes),
+        "X-Point-Count": str(len(points)),
+        "X-Index-Count": str(len(indices)),
+        "X-Source-Triangles": str(result["sourceTriangles"]),
+        "X-Lod-Budget": str(result["lodBudget"]) if result["lodBudget"] else "full",
+    })
+
 @app.get("/api/usd/thumbnail")
-def get_usd_thumbnail(path: str):
+async def get_usd_thumbnail(path: str):
     """Serves a generated thumbnail PNG file from absolute disk path."""
-    if not os.path.exists(path):
+    if not await filesystem_pool.run(os.path.exists, path):
         raise HTTPException(status_code=404, detail="Thumbnail file not found")
     from fastapi.responses import FileResponse
     return FileResponse(path, media_type="image/png")
@@ -502,9 +574,11 @@ class ThumbnailRegenerateRequest(BaseModel):
     usdPath: str
 
 @app.post("/api/usd/thumbnail/regenerate")
-def post_usd_thumbnail_regenerate(req: ThumbnailRegenerateRequest):
-    """Deletes existing thumbnail and forces regeneration of high-res beauty preview thumbnail."""
-    import re
+async def post_usd_thumbnail_regenerate(req: ThumbnailRegenerateRequest):
+    """Deletes existing thumbnail and queues regeneration of high-res beauty preview thumbnail."""
+    return await filesystem_pool.run(_regenerate_thumbnail, req)
+
+def _regenerate_thumbnail(req: ThumbnailRegenerateRequest):
     usd_file = os.path.abspath(req.usdPath)
     if not os.path.exists(usd_file):
         raise HTTPException(status_code=404, detail="USD file not found")
@@ -522,47 +596,47 @@ def post_usd_thumbnail_regenerate(req: ThumbnailRegenerateRequest):
             print(f"Failed to delete old thumbnail: {e}")
             
     # Resolve metadata details just like in project tree scan
-    app = "blender"
-    shape = "mesh"
-    meta_path = os.path.join(root, "metadata.yaml")
-    if os.path.exists(meta_path):
-        try:
-            with open(meta_path, "r", encoding="utf-8") as mf:
-                meta = yaml.safe_load(mf) or {}
-                app = meta.get("application", "blender")
-                objs = meta.get("exported_root_objects", [])
-                if objs:
-                    obj0 = str(objs[0]).lower()
-                    if "sphere" in obj0:
-                        shape = "sphere"
-                    elif "cube" in obj0:
-                        shape = "cube"
-                    elif "cylinder" in obj0:
-                        shape = "cylinder"
-                    elif "cone" in obj0:
-                        shape = "cone"
-        except Exception:
-            pass
+    meta = read_card(os.path.join(root, "metadata.yaml"))
+    app, _, shape = publish_details(meta)
+    summary = read_summary(usd_file)
+    if summary and summary.get("dominantGeometry"):
+        shape = summary["dominantGeometry"]
             
-    try:
-        # Use base asset name from filename for clean HUD display
-        asset_display = os.path.splitext(f)[0]
-        clean_asset_display = re.sub(r"_v\d+$", "", asset_display)
-        generate_usd_thumbnail(thumb_path, shape=shape, asset_name=clean_asset_display, app_name=app)
-        return {"status": "success", "message": "Thumbnail regenerated successfully!", "thumbnailPath": thumb_path}
-    except Exception as te:
-        raise HTTPException(status_code=500, detail=f"Failed to generate thumbnail: {str(te)}")
+    # Render in the background queue, the tree reports the thumbnail as pending until it lands
+    state = thumbnail_queue.submit(thumb_path, shape=shape, asset_name=clean_asset_name(f), app_name=app, force=True, usd_path=usd_file)
+    invalidate_path(root)
+    return {"status": state, "message": "Thumbnail regeneration queued", "thumbnailPath": thumb_path}
 
 @app.post("/api/usd/create")
-def post_usd_create(path: str):
+async def post_usd_create(path: str):
     """Creates a new USD stage at the target path."""
-    result = create_empty_usd(path)
+    result = await usd_pool.run(create_empty_usd, path)
     if "error" in result:
         raise HTTPException(status_code=500, detail=result["error"])
+    invalidate_path(path)
     return result
 
 # --- Session command queues for active DCC sessions ---
-SESSION_COMMANDS = {}
+SESSION_WAITERS = {}  # session key -> set of asyncio.Event, one per parked long-poll
+
+# Upper bound of a long-poll, stays below the usual 60s proxy and client read timeouts
+MAX_POLL_WAIT = 30.0
+
+# Commands queued through another server worker can't set this worker's events, with a shared
+# state backend a watcher thread checks the store for outside changes this often and wakes the
+# parked polls of sessions that hold commands
+SHARED_POLL_INTERVAL = 0.05
+
+async def _session_store(fn, *args):
+    """Calls the session command store, on the filesystem pool when it is kept on disk."""
+    if session_commands.persistent:
+        return await filesystem_pool.run(fn, *args)
+    return fn(*args)
+
+def _wake_sessions(keys):
+    for key in keys:
+        for waiter in SESSION_WAITERS.get(key, ()):
+            waiter.set()
 
 class SessionCommand(BaseModel):
     appType: str
@@ -571,26 +645,117 @@ class SessionCommand(BaseModel):
     argument: str
 
 @app.post("/api/sessions/command")
-def queue_session_command(cmd: SessionCommand):
+async def queue_session_command(cmd: SessionCommand):
     """Queues a command for a running DCC session."""
     key = f"{cmd.appType}:{cmd.taskPath}"
-    if key not in SESSION_COMMANDS:
-        SESSION_COMMANDS[key] = []
-    SESSION_COMMANDS[key].append({
-        "command": cmd.command,
-        "argument": cmd.argument
-    })
+    try:
+        await _session_store(session_commands.enqueue, key, {
+            "command": cmd.command,
+            "argument": cmd.argument
+        })
+    except SessionQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    # Hand the command to parked polls right away
+    _wake_sessions([key])
     return {"status": "success", "message": "Command queued successfully!"}
 
 @app.get("/api/sessions/poll")
-def poll_session_commands(appType: str, taskPath: str):
-    """DCC calls this endpoint to retrieve and clear queued commands."""
+async def poll_session_commands(request: Request, appType: str, taskPath: str, wait: float = 0):
+    """DCC calls this endpoint to retrieve and clear queued commands, optionally waiting up to wait seconds for one."""
     key = f"{appType}:{taskPath}"
-    commands = SESSION_COMMANDS.get(key, [])
-    if commands:
-        SESSION_COMMANDS[key] = []
+    commands = await _session_store(session_commands.drain, key)
+    if not commands and wait > 0:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(wait, MAX_POLL_WAIT)
+        waiter = asyncio.Event()
+        SESSION_WAITERS.setdefault(key, set()).add(waiter)
+        try:
+            while not commands and loop.time() < deadline:
+                try:
+                    await asyncio.wait_for(waiter.wait(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    pass
+                waiter.clear()
+                # Commands drained for a DCC that hung up while parked would be written to a dead socket and lost
+                if await request.is_disconnected():
+                    break
+                commands = await _session_store(session_commands.drain, key)
+        finally:
+            waiters = SESSION_WAITERS.get(key)
+            waiters.discard(waiter)
+            if not waiters:
+                del SESSION_WAITERS[key]
     return {"commands": commands}
 
+@app.get("/api/sessions/stats")
+async def get_session_stats():
+    """Returns per-session queue depths and enqueue/delivery/expiry counters of the session command store."""
+    return await _session_store(session_commands.stats)
+
+# --- Publish validation ---
+class ValidationRun(BaseModel):
+    projectPath: str
+    force: bool = False
+
+@app.post("/api/validation/run")
+async def post_validation_run(req: ValidationRun):
+    """Starts a background validation of the project's published USD files, only changed files are re-scanned unless forced."""
+    return await filesystem_pool.run(_start_validation, req)
+
+def _start_validation(req: ValidationRun):
+    if not os.path.isdir(req.projectPath):
+        raise HTTPException(status_code=404, detail="Project path not found")
+    return publish_validator.start(req.projectPath, force=req.force)
+
+@app.get("/api/validation/status")
+async def get_validation_status(projectPath: str):
+    """Returns progress of the current or last validation run of a project."""
+    status = await filesystem_pool.run(publish_validator.status, projectPath)
+    if status is None:
+        raise HTTPException(status_code=404, detail="No validation run for this project")
+    return status
+
+@app.get("/api/validation/report")
+async def get_validation_report(projectPath: str, status: Optional[str] = None, sort: str = "path", descending: bool = False, limit: int = 100, offset: int = 0):
+    """Returns the stored validation results of a project, filtered by status and sorted by any stats column."""
+    if status is not None and status not in REPORT_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Unknown status {status}")
+    return await filesystem_pool.run(_validation_report, projectPath, status, sort, descending, max(1, min(limit, 1000)), max(0, offset))
+
+def _validation_report(project_path: str, status, sort: str, descending: bool, limit: int, offset: int):
+    if not os.path.isdir(project_path):
+        raise HTTPException(status_code=404, detail="Project path not found")
+    try:
+        report = publish_validator.report(project_path)
+        results = report.query(status, sort, descending, limit, offset)
+        return {"summary": report.summary(), **results}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except (OSError, sqlite3.Error) as e:
+        raise HTTPException(status_code=503, detail=f"Validation report unavailable: {e}")
+
+@app.get("/api/server/pools")
+async def get_server_pools():
+    """Returns the size, current load and rejection counters of each work pool."""
+    return pool_stats()
+
+@app.on_event("startup")
+def start_background_workers():
+    dcc_registry.start()
+    if state_backend.shared and session_commands.persistent:
+        loop = asyncio.get_running_loop()
+        session_commands.watch(lambda keys: loop.call_soon_threadsafe(_wake_sessions, keys), SHARED_POLL_INTERVAL)
+
+@app.on_event("shutdown")
+def shutdown_background_workers():
+    thumbnail_queue.shutdown()
+    dcc_registry.shutdown()
+    if session_commands.persistent:
+        session_commands.unwatch()
+    process_supervisor.shutdown()
+    publish_validator.shutdown()
+    shutdown_pools()
+
 # --- Serving Built Frontend ---
 # Verify if the built folder exists before mounting
 BUILD_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "public", "pipeline", "studiotools"))
@@ -601,11 +766,11 @@ if os.path.isdir(BUILD_DIR):
     # Root redirect
     from fastapi.responses import RedirectResponse
     @app.get("/")
-    def root():
+    async def root():
         return RedirectResponse(url="/public/pipeline/studiotools/index.html")
 else:
     @app.get("/")
-    def root():
+    async def root():
         return {
             "message": "FastAPI is running! The React frontend is not compiled yet.",
             "hint": "Please run `npm run build` in the workspace to compile the frontend and place it in `/public/pipeline/studiotools`."
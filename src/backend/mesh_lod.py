@@ -0,0 +1,112 @@
+import os
+import hashlib
+import numpy as np
+
+from .metadata_io import write_atomic
+
+# Hidden folder next to the USD file holding preview LODs, the project index skips hidden entries
+LOD_CACHE_DIR = ".lod"
+
+# Budgets are rounded down to a power of two so slightly different requests share one cached LOD
+MIN_TRIANGLE_BUDGET = 256
+
+# Vertex clustering rarely lands on the budget first time, the grid is refined a few times at most
+MAX_CLUSTER_PASSES = 8
+
+
+def lod_budget(source_triangles: int, max_triangles: int = None, stage_triangles: int = None, stage_total: int = None):
+    """
+    Resolves the triangle budget of one mesh from a per-prim cap and a per-stage cap, the latter split
+    across meshes in proportion to their size. Returns None when the mesh should be sent at full resolution.
+    """
+    budget = source_triangles
+    if max_triangles:
+        budget = min(budget, max_triangles)
+    if stage_triangles and stage_total and stage_total > stage_triangles:
+        budget = min(budget, source_triangles * stage_triangles // stage_total)
+    if budget >= source_triangles:
+        return None
+
+    budget = max(MIN_TRIANGLE_BUDGET, 1 << (max(budget, 1).bit_length() - 1))
+    return budget if budget < source_triangles else None
+
+
+def decimate_mesh(points, indices, max_triangles: int):
+    """
+    Simplifies a triangle mesh to at most roughly max_triangles with uniform-grid vertex clustering.
+    Vertices falling in the same cell collapse onto their centroid, triangles that degenerate or
+    duplicate another are dropped. Winding of the surviving triangles is preserved.
+    """
+    triangles = indices[:len(indices) - len(indices) % 3].reshape(-1, 3)
+    if len(triangles) <= max_triangles:
+        return points, indices
+
+    # A clustered surface keeps about two triangles per occupied cell and occupied cells grow with
+    # the square of the resolution. Start above the budget and shrink the grid until it fits.
+    resolution = max(2, int(np.sqrt(max_triangles / 2)))
+    for _ in range(MAX_CLUSTER_PASSES):
+        lod_points, lod_triangles = _cluster_vertices(points, triangles, resolution)
+        if len(lod_triangles) <= max_triangles or resolution == 2:
+            break
+        resolution = max(2, int(resolution * np.sqrt(max_triangles / len(lod_triangles)) * 0.95))
+    return lod_points, lod_triangles.reshape(-1)
+
+
+def _cluster_vertices(points, triangles, resolution: int):
+    lower = points.min(axis=0)
+    extent = np.maximum(points.max(axis=0) - lower, 1e-12)
+    cell_size = extent.max() / resolution
+    dims = np.maximum(np.ceil(extent / cell_size).astype(np.int64), 1)
+
+    cells = np.minimum(((points - lower) / cell_size).astype(np.int64), dims - 1)
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    cell_keys, vertex_cell = np.unique(keys, return_inverse=True)
+
+    # Centroid of each occupied cell becomes its representative vertex
+    members = np.bincount(vertex_cell, minlength=len(cell_keys))
+    cell_points = np.empty((len(cell_keys), 3), dtype="<f4")
+    for axis in range(3):
+        cell_points[:, axis] = np.bincount(vertex_cell, weights=points[:, axis], minlength=len(cell_keys)) / members
+
+    clustered = vertex_cell[triangles]
+    a, b, c = clustered[:, 0], clustered[:, 1], clustered[:, 2]
+    clustered = clustered[(a != b) & (b != c) & (a != c)]
+
+    # Several source triangles usually collapse onto the same cell triple, keep the first of each
+    ordered = np.sort(clustered, axis=1)
+    if len(cell_keys) < (1 << 21):
+        packed = (ordered[:, 0] << 42) | (ordered[:, 1] << 21) | ordered[:, 2]
+        _, first = np.unique(packed, return_index=True)
+    else:
+        _, first = np.unique(ordered, axis=0, return_index=True)
+    clustered = clustered[np.sort(first)]
+
+    # Cells only referenced by dropped triangles are compacted away
+    used, compact = np.unique(clustered, return_inverse=True)
+    return cell_points[used], compact.reshape(-1, 3).astype("<u4")
+
+
+def load_or_build_lod(filepath: str, prim_path: str, budget: int, source_signature: tuple, build):
+    """
+    Returns the (points, indices) LOD of a mesh from the hidden cache folder next to filepath, calling
+    build() and storing its result when there is no entry for the current source layers.
+    """
+    cache_dir = os.path.join(os.path.dirname(filepath), LOD_CACHE_DIR)
+    digest = hashlib.sha1(f"{os.path.basename(filepath)}:{prim_path}".encode()).hexdigest()[:16]
+    cache_path = os.path.join(cache_dir, f"{digest}_{budget}.npz")
+    source_key = hashlib.sha1(repr(source_signature).encode()).hexdigest()
+
+    try:
+        with np.load(cache_path) as cached:
+            if str(cached["source"]) == source_key:
+                return cached["points"], cached["indices"]
+    except (OSError, KeyError, ValueError):
+        pass
+
+    points, indices = build()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        write_atomic(cache_path, lambda f: np.savez(f, points=points, indices=indices, source=np.array(source_key)), binary=True)
+    except OSError as e:
+        print(f"Could not write LOD cache {cache_path}: {e}")
+    return points, indices
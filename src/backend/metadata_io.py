@@ -0,0 +1,87 @@
+import os
+import threading
+from collections import OrderedDict
+
+import yaml
+
+# libyaml's C parser and emitter are an order of magnitude faster than PyYAML's pure Python ones,
+# wheels ship them on every common platform but a source build without libyaml lacks them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    HAS_LIBYAML = False
+
+# Parsed cards kept in memory, enough for the cards of a few large projects
+MAX_MEMOIZED_CARDS = 20000
+
+_cards = OrderedDict()  # path -> (mtime_ns, size, data)
+_cards_lock = threading.Lock()
+
+
+def load_yaml(stream):
+    """yaml.safe_load with the C loader when available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump_yaml(data, stream=None, **kwargs):
+    """yaml.safe_dump with the C dumper when available, keyword arguments are passed through."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def read_card(path: str):
+    """
+    Returns the parsed YAML file at path ({} when empty or unreadable, None when missing). Results are
+    memoized by (path, mtime, size), so unchanged files are never parsed twice. The returned data is
+    shared between callers and must not be mutated.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        with _cards_lock:
+            _cards.pop(path, None)
+        return None
+
+    with _cards_lock:
+        cached = _cards.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _cards.move_to_end(path)
+            return cached[2]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = load_yaml(f) or {}
+    except Exception:
+        data = {}
+
+    with _cards_lock:
+        _cards[path] = (st.st_mtime_ns, st.st_size, data)
+        _cards.move_to_end(path)
+        while len(_cards) > MAX_MEMOIZED_CARDS:
+            _cards.popitem(last=False)
+    return data
+
+
+def write_card(path: str, data, **kwargs):
+    """Writes data as YAML to path, atomically so concurrent readers never see a partial card."""
+    write_atomic(path, lambda f: dump_yaml(data, f, **kwargs))
+
+
+def write_atomic(path: str, write, binary: bool = False):
+    """
+    Calls write(file) on a temporary file next to path and renames it over path, so concurrent
+    readers (other threads, server workers or hosts) see either the old or the new file, never
+    a partial one. The temporary file is removed if writing fails.
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") if binary else open(temp_path, "w", encoding="utf-8") as f:
+            write(f)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
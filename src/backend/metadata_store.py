@@ -0,0 +1,97 @@
+import os
+import pickle
+import sqlite3
+
+from .shared_state import project_state_path
+
+# Per-project database mirroring the YAML cards, kept with the server state rather than in the project
+METADATA_DB = "metadata.db"
+
+# Bump when the stored encoding changes, older databases are then rebuilt from the YAML cards
+SCHEMA_VERSION = 2
+
+
+class MetadataStore:
+    """SQLite mirror of a project's folder.yaml and metadata.yaml cards.
+
+    The YAML cards stay the source of truth. Each stored row remembers the mtime and size of the
+    card it was parsed from and is used only while both still match, so editing a card by hand
+    simply re-parses it. The database lives under the server's state directory, so reading a
+    project's tree never writes into the project. When nothing can be written (full disk, no
+    permissions), the store does nothing and every card is parsed as before.
+
+    Cards are stored pickled, so a card read back is equal to the one PyYAML parsed, non-string keys
+    (frame numbers) and timestamps included. The database is the server's own, never a project file.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._rows = {}   # relative path -> (mtime_ns, size, pickled data), loaded once
+        self._dirty = {}  # relative path -> (mtime_ns, size, pickled data) or None to delete
+        self._db = None
+        try:
+            self._db = self._connect(project_state_path(root, METADATA_DB))
+            self._rows = {path: (mtime, size, data) for path, mtime, size, data in self._db.execute("SELECT path, mtime_ns, size, data FROM cards")}
+        except (OSError, sqlite3.Error) as e:
+            print(f"Metadata store disabled for {root}: {e}")
+            self._db = None
+
+    def lookup(self, path: str, mtime_ns: int, size: int):
+        """Returns the stored card data when it was parsed from this exact version of the file, else None."""
+        row = self._rows.get(self._key(path))
+        if row is None or row[0] != mtime_ns or row[1] != size:
+            return None
+        try:
+            return pickle.loads(row[2])
+        except Exception:
+            return None
+
+    def put(self, path: str, mtime_ns: int, size: int, data):
+        if self._db is None:
+            return
+        try:
+            blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        row = (mtime_ns, size, blob)
+        key = self._key(path)
+        self._rows[key] = row
+        self._dirty[key] = row
+
+    def remove(self, path: str):
+        key = self._key(path)
+        if self._rows.pop(key, None) is not None and self._db is not None:
+            self._dirty[key] = None
+
+    def flush(self):
+        """Writes pending changes in a single transaction."""
+        if self._db is None or not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, {}
+        try:
+            with self._db:
+                self._db.executemany(
+                    "INSERT INTO cards (path, mtime_ns, size, data) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (path) DO UPDATE SET mtime_ns = excluded.mtime_ns, size = excluded.size, data = excluded.data",
+                    [(key, *row) for key, row in dirty.items() if row is not None]
+                )
+                self._db.executemany("DELETE FROM cards WHERE path = ?", [(key,) for key, row in dirty.items() if row is None])
+        except sqlite3.Error as e:
+            print(f"Failed to update metadata store of {self.root}: {e}")
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(path, self.root)
+
+    @staticmethod
+    def _connect(db_path: str):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        db = sqlite3.connect(db_path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        (version,) = db.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            db.execute("DROP TABLE IF EXISTS cards")
+            db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        db.execute("CREATE TABLE IF NOT EXISTS cards (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, data BLOB NOT NULL)")
+        db.commit()
+        return db
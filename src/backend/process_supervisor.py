@@ -0,0 +1,381 @@
+import os
+import time
+import uuid
+import shlex
+import socket
+import tempfile
+import subprocess
+import threading
+from collections import deque
+from datetime import datetime
+
+from .shared_state import state_backend
+
+# Heavy DCC sessions a host runs at once, over every application. More launches wait in a queue.
+MAX_HOST_SESSIONS = int(os.environ.get("STUDIOTOOLS_MAX_DCC_SESSIONS", "4"))
+
+# Per application caps, e.g. STUDIOTOOLS_MAX_HOUDINI_SESSIONS=2, default to the host cap
+MAX_APP_SESSIONS_ENV = "STUDIOTOOLS_MAX_{}_SESSIONS"
+
+# How often exits are reaped and queued launches retried
+REAP_INTERVAL = 0.5
+
+# Exited sessions still reported by the status API
+MAX_FINISHED_SESSIONS = 50
+
+# A terminal has this long to start the DCC and report its PID before the launch counts as failed
+PIDFILE_TIMEOUT = 30.0
+
+# PID and exit code files written by the terminal wrapper of each session
+RUN_DIR = os.path.join(tempfile.gettempdir(), f"studiotools-dcc-{os.getuid()}")
+
+HOST = socket.gethostname()
+
+
+def _app_cap(app_type: str) -> int:
+    return int(os.environ.get(MAX_APP_SESSIONS_ENV.format(app_type.upper()), str(MAX_HOST_SESSIONS)))
+
+
+def _process_table() -> dict:
+    """{pid: parent pid} of every process, read from /proc."""
+    parents = {}
+    try:
+        pids = [int(name) for name in os.listdir("/proc") if name.isdigit()]
+    except OSError:
+        return parents
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name is parenthesized and may contain spaces, fields resume after the last ")"
+        fields = stat[stat.rindex(b")") + 2:].split()
+        parents[pid] = int(fields[1])
+    return parents
+
+
+def _rss_bytes(pid: int):
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return 0
+
+
+def _process_start(pid: int):
+    """Start time of a live process in clock ticks since boot, None once it is gone or a zombie."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    fields = stat[stat.rindex(b")") + 2:].split()
+    if fields[0] in (b"Z", b"X"):
+        return None
+    return int(fields[19])
+
+
+def _terminal_command(terminal: str, title: str, command: list, pid_file: str, exit_file: str) -> list:
+    """
+    Wraps command to run inside a persistent terminal. The DCC runs in a subshell that writes its PID
+    and then execs it, so the PID reported is the DCC's own. Terminals like gnome-terminal return at
+    once and others stay open until the artist closes them, neither outlives the DCC one to one.
+    """
+    cmd_str = " ".join(shlex.quote(arg) for arg in command)
+    bash_cmd = (
+        f"(echo $BASHPID > {shlex.quote(pid_file)}; exec {cmd_str}); code=$?; echo $code > {shlex.quote(exit_file)}; "
+        f"echo; echo '[StudioTools] {title} exited with code '$code; read -p 'Press Enter to close terminal...'"
+    )
+    if os.path.basename(terminal) in ["xterm"]:
+        return [terminal, "-T", f"StudioTools: {title}", "-e", "bash", "-c", bash_cmd]
+    return [terminal, "-T", f"StudioTools: {title}", "--", "bash", "-c", bash_cmd]
+
+
+def _tree_rss(pid: int, parents: dict):
+    """Resident memory of pid and all its descendants, the DCC usually runs inside a terminal and a shell."""
+    own = _rss_bytes(pid)
+    if own is None:
+        return None
+    tree = {pid}
+    changed = True
+    while changed:
+        changed = False
+        for child, parent in parents.items():
+            if parent in tree and child not in tree:
+                tree.add(child)
+                changed = True
+    tree.discard(pid)
+    return own + sum(_rss_bytes(member) or 0 for member in tree)
+
+
+class _Session:
+    __slots__ = ("id", "app_name", "app_type", "task_path", "key", "command", "env", "terminal", "state", "process",
+                 "pid", "pid_start", "slots", "queued_at", "started_at", "started_clock", "exited_at", "returncode", "error")
+
+    def __init__(self, app_name, app_type, task_path, key, command, env, terminal):
+        self.id = uuid.uuid4().hex[:12]
+        self.app_name = app_name
+        self.app_type = app_type
+        self.task_path = task_path
+        self.key = key
+        self.command = command
+        self.env = env
+        self.terminal = terminal
+        self.state = "queued"
+        self.process = None  # what was spawned: the DCC itself, or the terminal running it
+        self.pid = None      # the DCC, once known
+        self.pid_start = None
+        self.slots = []
+        self.queued_at = datetime.now().isoformat()
+        self.started_at = None
+        self.started_clock = None
+        self.exited_at = None
+        self.returncode = None
+        self.error = None
+
+    @property
+    def pid_file(self) -> str:
+        return os.path.join(RUN_DIR, f"{self.id}.pid")
+
+    @property
+    def exit_file(self) -> str:
+        return os.path.join(RUN_DIR, f"{self.id}.exit")
+
+
+class ProcessSupervisor:
+    """Spawns DCC sessions, tracks them by task and reaps them when they exit.
+
+    A launch takes a host slot and a slot of its application. Slots are claims on the shared state
+    backend, so the caps hold across every server worker of the host. Launches that find no free
+    slot wait in a FIFO queue that is retried whenever the reaper runs. Launching the same file for
+    the same task while it is already running or queued returns the existing session instead of
+    spawning a duplicate (the double-click case).
+
+    Sessions track the DCC process itself. DCCs started inside a terminal emulator report their PID
+    through a pidfile, the terminal's own lifetime says nothing about the DCC's.
+    """
+
+    def __init__(self, max_host_sessions: int = MAX_HOST_SESSIONS):
+        self.max_host_sessions = max_host_sessions
+        self._lock = threading.Lock()
+        self._active = {}  # session id -> _Session, queued or running
+        self._queue = deque()
+        self._finished = deque(maxlen=MAX_FINISHED_SESSIONS)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def launch(self, app_name: str, app_type: str, task_path: str, command: list, env: dict, key: str = None, terminal: str = None) -> dict:
+        """
+        Starts command now if a slot is free, queues it otherwise. Returns the session status. With a
+        terminal the DCC runs inside that terminal emulator, which stays open after it exits.
+        """
+        key = key or " ".join(command)
+        with self._lock:
+            for session in self._active.values():
+                if session.app_type == app_type and session.task_path == task_path and session.key == key:
+                    return {**self._status(session, None), "duplicate": True}
+
+            session = _Session(app_name, app_type, task_path, key, command, env, terminal)
+            self._active[session.id] = session
+            self._queue.append(session)
+            startable = self._take_startable()
+        self._spawn(startable)
+        self._ensure_reaper()
+        with self._lock:
+            if session.state == "failed":
+                raise OSError(session.error)
+            return self._status(session, None)
+
+    def cancel(self, session_id: str) -> bool:
+        """Removes a queued launch, running sessions belong to the artist and are left alone."""
+        with self._lock:
+            session = self._active.get(session_id)
+            if session is None or session.state != "queued":
+                return False
+            self._queue.remove(session)
+            self._finish(session, "cancelled")
+            return True
+
+    def sessions(self) -> list:
+        """Status of queued, running and recently finished sessions, with live PID, RSS and uptime."""
+        parents = _process_table()
+        with self._lock:
+            startable = self._reap()
+        self._spawn(startable)
+        with self._lock:
+            sessions = list(self._active.values()) + list(reversed(self._finished))
+            return [self._status(session, parents) for session in sessions]
+
+    def stats(self) -> dict:
+        with self._lock:
+            running = [s for s in self._active.values() if s.state != "queued"]
+            per_app = {}
+            for session in running:
+                per_app[session.app_type] = per_app.get(session.app_type, 0) + 1
+            return {
+                "host": HOST,
+                "maxHostSessions": self.max_host_sessions,
+                "running": len(running),
+                "queued": len(self._queue),
+                "perApp": {app: {"running": count, "max": _app_cap(app)} for app, count in per_app.items()}
+            }
+
+    def shutdown(self):
+        """Stops reaping. Running DCCs are not killed, artists keep their sessions across server restarts."""
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=1.0)
+
+    # --- Internals, called with the lock held unless noted ---
+
+    def _take_startable(self) -> list:
+        """Claims slots for the queued launches that fit and marks them starting, _spawn runs them."""
+        startable = []
+        for session in list(self._queue):
+            slots = self._claim_slots(session.app_type)
+            if slots is None:
+                # Keep FIFO order per application, later launches of other apps may still fit
+                continue
+            self._queue.remove(session)
+            session.slots = slots
+            session.state = "starting"
+            startable.append(session)
+        return startable
+
+    def _spawn(self, sessions: list):
+        # Not under the lock, forking a process can take a while on a loaded host
+        for session in sessions:
+            command = session.command
+            if session.terminal:
+                os.makedirs(RUN_DIR, exist_ok=True)
+                command = _terminal_command(session.terminal, session.app_name, command, session.pid_file, session.exit_file)
+            try:
+                process = subprocess.Popen(command, env=session.env, shell=False, start_new_session=True)
+            except OSError as e:
+                with self._lock:
+                    session.error = str(e)
+                    self._finish(session, "failed")
+                continue
+            with self._lock:
+                session.process = process
+                session.started_at = datetime.now().isoformat()
+                session.started_clock = time.monotonic()
+                session.env = None  # no longer needed, don't keep a copy of the environment per session
+                if not session.terminal:
+                    self._track(session, process.pid)
+
+    def _track(self, session: _Session, pid: int):
+        session.pid = pid
+        session.pid_start = _process_start(pid)
+        session.state = "running"
+
+    def _claim_slots(self, app_type: str):
+        host_slot = self._claim_one("host", self.max_host_sessions)
+        if host_slot is None:
+            return None
+        app_slot = self._claim_one(app_type, _app_cap(app_type))
+        if app_slot is None:
+            state_backend.release(host_slot)
+            return None
+        return [host_slot, app_slot]
+
+    @staticmethod
+    def _claim_one(scope: str, cap: int):
+        for index in range(cap):
+            name = f"dcc-slot:{HOST}:{scope}:{index}"
+            if state_backend.claim(name):
+                return name
+        return None
+
+    def _reap(self) -> list:
+        """Finishes sessions whose DCC exited and returns the queued launches that fit now, for _spawn."""
+        for session in [s for s in self._active.values() if s.process is not None]:
+            # Polling also reaps an exited terminal, so it never lingers as a zombie
+            returncode = session.process.poll()
+            if not session.terminal:
+                if returncode is not None:
+                    session.returncode = returncode
+                    self._finish(session, "exited")
+                continue
+
+            if session.pid is None:
+                pid = self._read_int(session.pid_file)
+                if pid is not None:
+                    self._track(session, pid)
+                elif time.monotonic() - session.started_clock > PIDFILE_TIMEOUT or (returncode is not None and returncode != 0):
+                    session.error = f"{session.app_name} did not start in its terminal"
+                    self._finish(session, "failed")
+                continue
+
+            start = _process_start(session.pid)
+            if start is None or start != session.pid_start:
+                session.returncode = self._read_int(session.exit_file)
+                self._finish(session, "exited")
+        return self._take_startable() if self._queue else []
+
+    @staticmethod
+    def _read_int(path: str):
+        try:
+            with open(path, "r") as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _finish(self, session: _Session, state: str):
+        session.state = state
+        session.exited_at = datetime.now().isoformat()
+        for slot in session.slots:
+            state_backend.release(slot)
+        session.slots = []
+        self._active.pop(session.id, None)
+        self._finished.append(session)
+        if session.terminal:
+            for path in (session.pid_file, session.exit_file):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _status(self, session: _Session, parents):
+        pid = session.pid
+        running = session.state == "running"
+        return {
+            "id": session.id,
+            "appName": session.app_name,
+            "appType": session.app_type,
+            "taskPath": session.task_path,
+            "state": session.state,
+            "pid": pid,
+            "terminalPid": session.process.pid if session.terminal and session.process is not None else None,
+            "rss": _tree_rss(pid, parents) if running and parents is not None else None,
+            "uptime": round(time.monotonic() - session.started_clock, 1) if session.started_clock is not None and session.exited_at is None else None,
+            "queuedAt": session.queued_at,
+            "startedAt": session.started_at,
+            "exitedAt": session.exited_at,
+            "returncode": session.returncode,
+            "error": session.error,
+            "queuePosition": self._queue.index(session) + 1 if session.state == "queued" else None
+        }
+
+    def _ensure_reaper(self):
+        # Called without the lock, takes it itself
+        with self._lock:
+            if self._thread is not None or self._stop.is_set():
+                return
+            self._thread = threading.Thread(target=self._run, name="studiotools-dcc-reaper", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(REAP_INTERVAL):
+            with self._lock:
+                startable = self._reap()
+            self._spawn(startable)
+
+
+process_supervisor = ProcessSupervisor()
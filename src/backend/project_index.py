@@ -0,0 +1,441 @@
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+
+from .thumbnail_queue import thumbnail_queue
+from .version_index import task_versions
+from .metadata_store import MetadataStore
+from .metadata_io import load_yaml
+from .usd_summary import read_summary, SUMMARY_DIR
+
+# Task subfolders scanned for workspace files, and folders never treated as tree nodes
+TASK_FILE_FOLDERS = ["wip", "versions", "published"]
+SKIPPED_CHILDREN = ["__pycache__", "wip", "versions", "published"]
+USD_EXTENSIONS = ["usd", "usda", "usdc"]
+
+# Polls arriving within this window are answered from memory without touching the disk
+REVALIDATE_INTERVAL = 1.0
+
+# Shared by every non-task node so their memoized signatures stay stable; never mutated
+NO_FILES = []
+
+# Serialized responses kept per tree version, one per (subtree, depth) combination asked for
+MAX_CACHED_PAYLOADS = 256
+
+BLEND_BACKUP_RE = re.compile(r"\.blend\d+$")
+VERSION_SUFFIX_RE = re.compile(r"_v\d+$")
+
+
+class ProjectIndex:
+    """In-memory index of a project's folder/task hierarchy.
+
+    Every directory listing and YAML card is cached against its mtime, and each tree node is
+    memoized against the listings and cards it was built from. A revalidation pass therefore
+    only stats known paths, re-reads the directories that actually changed, and reuses every
+    untouched node object as-is. When nothing changed the previous tree is returned unchanged.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.version = 0
+        self._lock = threading.RLock()
+        self._listings = {}  # dir path -> (mtime_ns, [(name, is_dir), ...])
+        self._cards = {}     # yaml path -> (mtime_ns, size, data)
+        self._store = MetadataStore(root)
+        self._nodes = {}     # node path -> (signature, node)
+        self._dir_files = {} # task subfolder -> (signature, [file items])
+        self._task_files_cache = {} # task path -> (signature, [file items])
+        self._summaries = {}  # publish folder -> (listing mtimes, {file name: USD summary})
+        self._tree = None
+        self._checked_at = 0.0
+        self._payload_tree = None
+        self._payloads = {}  # (subtree path, depth) -> (json bytes, etag), valid for _payload_tree only
+        self._seen = set()    # paths read by the current revalidation pass
+
+    def get_tree(self) -> dict:
+        """Returns the current tree, revalidating against the disk at most once per interval."""
+        with self._lock:
+            now = time.monotonic()
+            if self._tree is not None and now - self._checked_at < REVALIDATE_INTERVAL:
+                return self._tree
+
+            self._seen = set()
+            tree = self._build_node(self.root)
+            self._forget_unseen()
+            self._store.flush()
+            if tree is not self._tree:
+                self._tree = tree
+                self.version += 1
+            self._checked_at = time.monotonic()
+            return self._tree
+
+    def get_tree_json(self, subtree_path: str = None, depth: int = None):
+        """
+        Returns (serialized JSON bytes, ETag) of the tree, or of the branch rooted at subtree_path cut
+        to depth levels. Both are computed once per tree version. Returns (None, None) for unknown paths.
+        """
+        tree = self.get_tree()
+        if subtree_path:
+            subtree_path = os.path.realpath(subtree_path)
+        key = (subtree_path, depth)
+        with self._lock:
+            if self._payload_tree is not tree:
+                self._payload_tree = tree
+                self._payloads = {}
+            cached = self._payloads.get(key)
+            if cached is not None:
+                return cached
+
+        node = find_node(tree, subtree_path) if subtree_path else tree
+        if node is None:
+            return None, None
+        if depth is not None:
+            node = prune_tree(node, depth)
+        # Same encoding as FastAPI's JSONResponse, so clients see identical bodies either way
+        body = json.dumps(node, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        payload = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+
+        with self._lock:
+            if self._payload_tree is tree:
+                if len(self._payloads) >= MAX_CACHED_PAYLOADS:
+                    self._payloads.clear()
+                self._payloads[key] = payload
+        return payload
+
+    def invalidate(self, path: str = None):
+        """Forces the next get_tree() call to revalidate, forgetting cached listings at and above path."""
+        with self._lock:
+            self._checked_at = 0.0
+            if path is None:
+                return
+            # Coarse filesystem timestamps can hide a change made within the same tick
+            stale = {os.path.abspath(path), os.path.dirname(os.path.abspath(path))}
+            for cache in (self._listings, self._dir_files, self._summaries):
+                for key in [k for k in cache if os.path.abspath(k) in stale]:
+                    del cache[key]
+
+    def _forget_unseen(self):
+        """Drops the cached reads and nodes of paths the last pass no longer reached, such as deleted folders."""
+        for cache in (self._listings, self._cards, self._nodes, self._dir_files, self._task_files_cache, self._summaries):
+            for key in [key for key in cache if key not in self._seen]:
+                del cache[key]
+                if cache is self._cards:
+                    self._store.remove(key)
+
+    # --- Cached filesystem reads ---
+
+    def _list_dir(self, path: str):
+        """Returns [(name, is_dir)] for path, re-reading the directory only when its mtime moved."""
+        self._seen.add(path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self._listings.pop(path, None)
+            return None
+
+        cached = self._listings.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        entries = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    entries.append((entry.name, is_dir))
+        except OSError:
+            entries = []
+        entries.sort()
+        # Keep the previous list object when the contents are identical so memoized nodes survive
+        if cached and cached[1] == entries:
+            entries = cached[1]
+        self._listings[path] = (mtime, entries)
+        return entries
+
+    def _load_card(self, path: str):
+        """Returns the parsed YAML card at path, re-parsing only when its mtime or size moved."""
+        self._seen.add(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._cards.pop(path, None)
+            self._store.remove(path)
+            return None
+
+        cached = self._cards.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        # Cards parsed by an earlier run come from the metadata store instead of PyYAML
+        data = self._store.lookup(path, st.st_mtime_ns, st.st_size)
+        if data is None:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = load_yaml(f) or {}
+            except Exception:
+                data = {}
+            self._store.put(path, st.st_mtime_ns, st.st_size, data)
+        if cached and cached[2] == data:
+            data = cached[2]
+        self._cards[path] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
+    # --- Tree building ---
+
+    def _memoized(self, cache: dict, key: str, signature: tuple):
+        """Returns the cached value for key if it was built from the very same input objects."""
+        cached = cache.get(key)
+        if cached and len(cached[0]) == len(signature) and all(a is b for a, b in zip(cached[0], signature)):
+            return cached[1]
+        return None
+
+    def _build_node(self, current_path: str, entries: list = None) -> dict:
+        name = os.path.basename(current_path)
+        if not name:
+            name = current_path
+
+        if entries is None:
+            entries = self._list_dir(current_path) or []
+        names = {entry_name for entry_name, _ in entries}
+
+        node_type = "folder"
+        subtype = "custom"
+        card = None
+        if "project.yaml" in names:
+            node_type = "project"
+        elif "folder.yaml" in names:
+            card = self._load_card(os.path.join(current_path, "folder.yaml"))
+            if card:
+                node_type = card.get("type", "folder")
+                subtype = card.get("subtype", "custom")
+
+        files = self._task_files(current_path, names) if node_type == "task" else NO_FILES
+
+        children = []
+        for item, is_dir in entries:
+            # Ignore hidden directories and build outputs
+            if not is_dir or item.startswith(".") or item in SKIPPED_CHILDREN:
+                continue
+            item_path = os.path.join(current_path, item)
+            # Only folders carrying a folder.yaml or project.yaml are part of the hierarchy
+            child_entries = self._list_dir(item_path) or []
+            if any(n in ("folder.yaml", "project.yaml") for n, _ in child_entries):
+                children.append(self._build_node(item_path, child_entries))
+
+        # Signatures hold the input objects themselves, keeping them alive for identity checks
+        signature = (entries, card, files, *children)
+        node = self._memoized(self._nodes, current_path, signature)
+        if node is not None:
+            return node
+
+        node = {
+            "name": name,
+            "path": current_path,
+            "type": node_type,
+            "subtype": subtype,
+            "children": children,
+            "files": files
+        }
+        if node_type == "task":
+            # Any change under wip/<app> changes files too, so this is never stale on a memoized node
+            node["latestVersions"] = task_versions.latest_versions(current_path)
+        self._nodes[current_path] = (signature, node)
+        return node
+
+    def _task_files(self, task_path: str, names: set) -> list:
+        """Collects the workspace files under a task's wip/versions/published folders."""
+        parts = []
+        for sub in TASK_FILE_FOLDERS:
+            if sub in names:
+                self._collect_files(task_path, sub, os.path.join(task_path, sub), parts)
+
+        signature = tuple(parts)
+        files = self._memoized(self._task_files_cache, task_path, signature)
+        if files is None:
+            files = [item for part in parts for item in part]
+            self._task_files_cache[task_path] = (signature, files)
+        return files
+
+    def _collect_files(self, task_path: str, category: str, directory: str, parts: list):
+        entries = self._list_dir(directory)
+        if entries is None:
+            return
+        if category == "wip" and os.path.dirname(directory) == os.path.join(task_path, "wip"):
+            # Hand the fresh listing to the version index, saving it a directory read
+            task_versions.record(directory, self._listings[directory][0], [name for name, _ in entries])
+
+        meta = None
+        summaries = None
+        if category == "published":
+            if any(n == "metadata.yaml" for n, _ in entries):
+                meta = self._load_card(os.path.join(directory, "metadata.yaml"))
+            if any(n == SUMMARY_DIR for n, _ in entries):
+                summaries = self._load_summaries(directory, entries)
+
+        signature = (entries, meta, summaries)
+        items = self._memoized(self._dir_files, directory, signature)
+        if items is None:
+            items = self._file_items(task_path, category, directory, entries, meta, summaries)
+            self._dir_files[directory] = (signature, items)
+        parts.append(items)
+
+        for name, is_dir in entries:
+            # Hidden folders hold derived caches (preview LODs and the like), not deliverables
+            if is_dir and not name.startswith("."):
+                self._collect_files(task_path, category, os.path.join(directory, name), parts)
+
+    def _load_summaries(self, directory: str, entries: list):
+        """
+        Returns {file name: summary} of the USD files in a publish folder that have a current summary
+        sidecar. Sidecars are only re-read when the publish folder or its summary folder changed.
+        """
+        summary_dir = os.path.join(directory, SUMMARY_DIR)
+        if self._list_dir(summary_dir) is None:
+            return None
+        key = (self._listings[directory][0], self._listings[summary_dir][0])
+        cached = self._summaries.get(directory)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        summaries = {}
+        for name, is_dir in entries:
+            if not is_dir and os.path.splitext(name)[-1].lstrip(".") in USD_EXTENSIONS:
+                summary = read_summary(os.path.join(directory, name))
+                if summary is not None:
+                    summaries[name] = summary
+        # Keep the previous dict when nothing changed so memoized file items survive
+        if cached and cached[1] == summaries:
+            summaries = cached[1]
+        self._summaries[directory] = (key, summaries)
+        return summaries
+
+    def _file_items(self, task_path: str, category: str, directory: str, entries: list, meta, summaries=None) -> list:
+        items = []
+        for f, is_dir in entries:
+            # Skip pipeline metadata cards, hidden files and Blender backup files from being shown in workspace lists
+            if is_dir or f.startswith(".") or f.endswith((".yaml", ".yml")) or BLEND_BACKUP_RE.search(f):
+                continue
+            full_f = os.path.join(directory, f)
+            ext = os.path.splitext(f)[-1].lstrip(".")
+
+            file_item = {
+                "name": f,
+                "relativePath": os.path.relpath(full_f, task_path),
+                "absolutePath": full_f,
+                "category": category,
+                "ext": ext
+            }
+
+            # Queue a background thumbnail render for published USD deliverables that lack one
+            if category == "published" and ext in USD_EXTENSIONS:
+                app, app_version, shape = publish_details(meta)
+                file_item["application"] = app
+                file_item["appVersion"] = app_version if app_version else None
+
+                # The summary sidecar knows the stage's actual geometry, better than guessing from metadata
+                summary = summaries.get(f) if summaries else None
+                file_item["summary"] = summary
+                if summary and summary.get("dominantGeometry"):
+                    shape = summary["dominantGeometry"]
+
+                thumb_path = os.path.join(directory, "thumbnail.png")
+                if any(n == "thumbnail.png" for n, _ in entries):
+                    file_item["thumbnailPath"] = thumb_path
+                    file_item["thumbnailState"] = "ready"
+                else:
+                    file_item["thumbnailState"] = thumbnail_queue.submit(thumb_path, shape=shape, asset_name=clean_asset_name(f), app_name=app, usd_path=full_f)
+
+            items.append(file_item)
+        return items
+
+
+def find_node(tree: dict, path: str):
+    """Returns the node of tree at path, walking down only the branch that contains it."""
+    node = tree
+    while node["path"] != path:
+        node = next((child for child in node["children"]
+                     if path == child["path"] or path.startswith(child["path"] + os.sep)), None)
+        if node is None:
+            return None
+    return node
+
+
+def prune_tree(node: dict, depth: int) -> dict:
+    """Copies node down to depth levels of children. Cut nodes keep their childCount so clients can expand them later."""
+    if depth <= 0:
+        return {**node, "children": [], "childCount": len(node["children"])}
+    return {**node, "children": [prune_tree(child, depth - 1) for child in node["children"]]}
+
+
+def publish_details(meta) -> tuple:
+    """
+    Resolves (application, application_version, shape) from a publish metadata.yaml card. The shape is
+    only a guess from the exported object names, used until the file's summary sidecar exists.
+    """
+    app = "blender"
+    app_version = ""
+    shape = "mesh"
+    if meta:
+        app = meta.get("application", "blender")
+        app_version = meta.get("application_version", "")
+        # Guess shape based on exported objects
+        objs = meta.get("exported_root_objects", [])
+        if objs:
+            obj0 = str(objs[0]).lower()
+            for candidate in ["sphere", "cube", "cylinder", "cone"]:
+                if candidate in obj0:
+                    shape = candidate
+                    break
+    return app, app_version, shape
+
+
+def clean_asset_name(file_name: str) -> str:
+    """Base asset name from a publish filename with its _v### suffix removed, for HUD display."""
+    return VERSION_SUFFIX_RE.sub("", os.path.splitext(file_name)[0])
+
+
+# --- Per-project index registry ---
+
+_INDEXES = {}
+_INDEXES_LOCK = threading.Lock()
+_INVALIDATION_LISTENERS = []
+
+
+def get_project_index(path: str) -> ProjectIndex:
+    """Returns the shared index for a project root, building it on first use."""
+    # "/show", "/show/", relative and symlinked spellings all share one index
+    path = os.path.realpath(path)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(path)
+        if index is None:
+            index = ProjectIndex(path)
+            _INDEXES[path] = index
+        return index
+
+
+def add_invalidation_listener(callback):
+    """Registers callback(index) to run whenever invalidate_path marks an index as stale."""
+    _INVALIDATION_LISTENERS.append(callback)
+
+
+def invalidate_path(path: str):
+    """Marks every project index containing path as stale so the next poll sees the change."""
+    target = os.path.realpath(path)
+    with _INDEXES_LOCK:
+        indexes = list(_INDEXES.values())
+    for index in indexes:
+        root = index.root
+        if target == root or target.startswith(root + os.sep):
+            index.invalidate(target)
+            for callback in _INVALIDATION_LISTENERS:
+                callback(index)
+
+
+# Finished renders (or failures) re-list their publish folder on the next poll
+thumbnail_queue.add_listener(lambda thumb_path: invalidate_path(os.path.dirname(thumb_path)))
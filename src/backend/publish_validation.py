@@ -0,0 +1,271 @@
+import os
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+from .usd_utils import compute_usd_stats
+from .project_index import get_project_index, USD_EXTENSIONS
+from .shared_state import project_state_path
+from .executors import spawn_process_pool
+
+# Report database, next to the metadata store in the server's per-project state
+VALIDATION_DB = "validation.db"
+
+# Workers of each run. Stage opens are CPU and memory heavy, leave room for the API and the thumbnail renders
+MAX_WORKERS = int(os.environ.get("STUDIOTOOLS_VALIDATION_WORKERS", "0")) or max(1, min(8, (os.cpu_count() or 2) // 2))
+
+# Readable publishes beyond these limits are reported as warnings
+MAX_FACES = int(os.environ.get("STUDIOTOOLS_VALIDATION_MAX_FACES", "10000000"))
+MAX_FILE_MB = int(os.environ.get("STUDIOTOOLS_VALIDATION_MAX_FILE_MB", "2048"))
+MAX_OPEN_SECONDS = float(os.environ.get("STUDIOTOOLS_VALIDATION_MAX_OPEN_SECONDS", "30"))
+
+# Stats columns of the report, in the camelCase used by the API
+STAT_COLUMNS = ("primCount", "meshCount", "pointCount", "faceCount", "layerCount", "payloadCount", "fileSize", "openSeconds")
+SORTABLE_COLUMNS = ("path", "status", "validatedAt", *STAT_COLUMNS)
+REPORT_STATUSES = ("ok", "warning", "error")
+
+
+def published_usd_files(tree: dict) -> list:
+    """Absolute paths of every published USD file in a project tree."""
+    paths = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        for item in node["files"]:
+            if item["category"] == "published" and item["ext"] in USD_EXTENSIONS:
+                paths.append(item["absolutePath"])
+        stack.extend(node["children"])
+    return sorted(paths)
+
+
+def classify(stats: dict) -> tuple:
+    """(status, message) of one validated file."""
+    if "error" in stats:
+        return "error", stats["error"]
+    problems = []
+    if stats["faceCount"] > MAX_FACES:
+        problems.append(f"{stats['faceCount']} faces exceed the {MAX_FACES} face limit")
+    if stats["fileSize"] > MAX_FILE_MB * 1024 * 1024:
+        problems.append(f"{stats['fileSize'] // (1024 * 1024)} MB exceeds the {MAX_FILE_MB} MB file limit")
+    if stats["openSeconds"] > MAX_OPEN_SECONDS:
+        problems.append(f"opening took {stats['openSeconds']:.1f}s, over {MAX_OPEN_SECONDS:.0f}s")
+    return ("warning", "; ".join(problems)) if problems else ("ok", None)
+
+
+class ValidationReport:
+    """Per-project SQLite table of validation results, one row per published USD.
+
+    Rows remember the mtime and size of the file they were computed from, which is what makes runs
+    incremental. Results are committed one by one as workers finish, so an interrupted run keeps
+    everything validated so far.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+        db_path = project_state_path(root, VALIDATION_DB)
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, status TEXT NOT NULL, message TEXT, "
+            "validatedAt TEXT NOT NULL, " + ", ".join(f"{column} {'REAL' if column == 'openSeconds' else 'INTEGER'}" for column in STAT_COLUMNS) + ")"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_status ON results (status)")
+        self._db.commit()
+
+    def signatures(self) -> dict:
+        """{absolute path: (mtime_ns, size)} of every stored result."""
+        with self._lock:
+            rows = self._db.execute("SELECT path, mtime_ns, size FROM results").fetchall()
+        return {os.path.join(self.root, path): (mtime, size) for path, mtime, size in rows}
+
+    def store(self, path: str, mtime_ns: int, size: int, stats: dict):
+        status, message = classify(stats)
+        values = [stats.get(column) for column in STAT_COLUMNS]
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (path, mtime_ns, size, status, message, validatedAt, " + ", ".join(STAT_COLUMNS) + ") "
+                "VALUES (?, ?, ?, ?, ?, ?, " + ", ".join("?" * len(STAT_COLUMNS)) + ")",
+                (os.path.relpath(path, self.root), mtime_ns, size, status, message, datetime.now().isoformat(), *values)
+            )
+        return status
+
+    def remove(self, paths):
+        with self._lock, self._db:
+            self._db.executemany("DELETE FROM results WHERE path = ?", [(os.path.relpath(path, self.root),) for path in paths])
+
+    def query(self, status: str = None, sort: str = "path", descending: bool = False, limit: int = 100, offset: int = 0) -> dict:
+        if sort not in SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort by {sort}")
+        where, params = ("WHERE status = ?", [status]) if status else ("", [])
+        with self._lock:
+            total = self._db.execute(f"SELECT COUNT(*) FROM results {where}", params).fetchone()[0]
+            cursor = self._db.execute(
+                f"SELECT * FROM results {where} ORDER BY {sort} {'DESC' if descending else 'ASC'}, path LIMIT ? OFFSET ?",
+                [*params, limit, offset]
+            )
+            columns = [column[0] for column in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        for row in rows:
+            row["path"] = os.path.join(self.root, row["path"])
+            del row["mtime_ns"], row["size"]
+        return {"total": total, "offset": offset, "results": rows}
+
+    def summary(self) -> dict:
+        with self._lock:
+            counts = dict(self._db.execute("SELECT status, COUNT(*) FROM results GROUP BY status").fetchall())
+            totals = self._db.execute(f"SELECT {', '.join(f'SUM({column})' for column in STAT_COLUMNS[:-1])} FROM results").fetchone()
+        return {
+            "files": sum(counts.values()),
+            **{status: counts.get(status, 0) for status in REPORT_STATUSES},
+            "totals": {column: int(value or 0) for column, value in zip(STAT_COLUMNS[:-1], totals)}
+        }
+
+
+class PublishValidator:
+    """Runs batch validation of a project's published USD files in a pool of worker processes.
+
+    One run per project at a time. A run walks the published files through the project index,
+    re-validates only files whose mtime or size changed since their stored result (or every file
+    when forced), and drops results of files that disappeared. Every run gets its own pool, so a
+    stage crashing a worker only ever breaks the run that opened it.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executors = set()  # pools of the runs in progress
+        self._reports = {}  # project root -> ValidationReport
+        self._runs = {}     # project root -> status dict of the last or current run
+
+    def start(self, project_path: str, force: bool = False) -> dict:
+        """Starts a run in the background unless one is already going, returns its status."""
+        root = os.path.abspath(project_path)
+        with self._lock:
+            run = self._runs.get(root)
+            if run is not None and run["state"] == "running":
+                return dict(run)
+            run = self._runs[root] = {
+                "projectPath": root, "state": "running", "force": force,
+                "started": datetime.now().isoformat(), "finished": None,
+                "total": 0, "validated": 0, "skipped": 0, "removed": 0,
+                "ok": 0, "warning": 0, "error": 0, "failure": None
+            }
+        threading.Thread(target=self._run, args=(root, run, force), name="studiotools-validation", daemon=True).start()
+        return dict(run)
+
+    def status(self, project_path: str):
+        with self._lock:
+            run = self._runs.get(os.path.abspath(project_path))
+            return dict(run) if run is not None else None
+
+    def report(self, project_path: str) -> ValidationReport:
+        root = os.path.abspath(project_path)
+        with self._lock:
+            report = self._reports.get(root)
+            if report is None:
+                report = self._reports[root] = ValidationReport(root)
+            return report
+
+    def shutdown(self):
+        with self._lock:
+            executors, self._executors = self._executors, set()
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _open_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        executor = spawn_process_pool(max_workers)
+        with self._lock:
+            self._executors.add(executor)
+        return executor
+
+    def _close_executor(self, executor: ProcessPoolExecutor):
+        with self._lock:
+            self._executors.discard(executor)
+        executor.shutdown(wait=False)
+
+    def _run(self, root: str, run: dict, force: bool):
+        failure = None
+        try:
+            report = self.report(root)
+            files = published_usd_files(get_project_index(root).get_tree())
+            present = set(files)
+            stored = report.signatures()
+            vanished = [path for path in stored if path not in present]
+            report.remove(vanished)
+
+            pending = {}
+            skipped = 0
+            for path in files:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                signature = (st.st_mtime_ns, st.st_size)
+                if not force and stored.get(path) == signature:
+                    skipped += 1
+                else:
+                    pending[path] = signature
+            with self._lock:
+                run["total"] = len(files)
+                run["skipped"] = skipped
+                run["removed"] = len(vanished)
+
+            def record(path, stats):
+                status = report.store(path, *pending[path], stats)
+                with self._lock:
+                    run["validated"] += 1
+                    run[status] += 1
+
+            crashed = []
+            if pending:
+                executor = self._open_executor(self.max_workers)
+                try:
+                    futures = {executor.submit(compute_usd_stats, path): path for path in pending}
+                    for future in as_completed(futures):
+                        try:
+                            record(futures[future], future.result())
+                        except BrokenProcessPool:
+                            crashed.append(futures[future])
+                finally:
+                    self._close_executor(executor)
+            if crashed:
+                self._validate_isolated(crashed, record)
+            state = "done"
+        except Exception as e:
+            print(f"Publish validation of {root} failed: {e}")
+            failure = str(e)
+            state = "failed"
+        with self._lock:
+            run["failure"] = failure
+            run["state"] = state
+            run["finished"] = datetime.now().isoformat()
+
+    def _validate_isolated(self, paths: list, record):
+        """
+        A stage crashing its worker breaks the whole pool and fails every file in flight with it.
+        Those files are retried one at a time in a single worker, so only the culprit is reported.
+        """
+        executor = None
+        try:
+            for path in paths:
+                if executor is None:
+                    executor = self._open_executor(1)
+                try:
+                    stats = executor.submit(compute_usd_stats, path).result()
+                except BrokenProcessPool:
+                    stats = {"error": "The USD library crashed while opening this file"}
+                    self._close_executor(executor)
+                    executor = None
+                record(path, stats)
+        finally:
+            if executor is not None:
+                self._close_executor(executor)
+
+
+publish_validator = PublishValidator()
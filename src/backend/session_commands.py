@@ -0,0 +1,246 @@
+import os
+import time
+import sqlite3
+import threading
+from collections import deque
+
+from .shared_state import state_backend
+
+# Commands a session can hold before new ones are refused, a DCC that stopped polling must not grow the queue forever
+MAX_COMMANDS_PER_SESSION = int(os.environ.get("STUDIOTOOLS_SESSION_MAX_COMMANDS", "256"))
+
+# Sessions that have not polled for this long are dropped together with their pending commands
+SESSION_TTL = float(os.environ.get("STUDIOTOOLS_SESSION_TTL", "3600"))
+
+# Expired sessions are swept lazily, at most this often
+SWEEP_INTERVAL = 60.0
+
+# Set to a file path to keep queued commands across server restarts. A shared state backend always
+# keeps them on disk, as every worker has to see the same queues.
+SESSION_DB = os.environ.get("STUDIOTOOLS_SESSION_DB") or state_backend.path("sessions.db")
+
+
+class SessionQueueFull(Exception):
+    """Raised when a session already holds MAX_COMMANDS_PER_SESSION commands."""
+
+    def __init__(self, key: str, limit: int):
+        super().__init__(f"Session {key} already has {limit} pending commands")
+        self.key = key
+        self.limit = limit
+
+
+class _Session:
+    __slots__ = ("commands", "last_active")
+
+    def __init__(self, now: float):
+        self.commands = deque()
+        self.last_active = now
+
+
+class SessionCommandStore:
+    """In-memory command queues of running DCC sessions, keyed by "appType:taskPath".
+
+    Enqueue and drain are atomic under one lock, so a command queued while a session is polled
+    lands either in that poll's answer or in the next one, never in neither. A session stays alive
+    while it polls: one that has not polled for the TTL is dropped together with its commands.
+    """
+
+    # Whether calls touch the disk, the API then makes them on a worker thread
+    persistent = False
+
+    def __init__(self, max_commands: int = MAX_COMMANDS_PER_SESSION, ttl: float = SESSION_TTL):
+        self.max_commands = max_commands
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._sessions = {}  # session key -> _Session
+        self._last_sweep = time.monotonic()
+        self.enqueued = 0
+        self.delivered = 0
+        self.rejected = 0
+        self.expired = 0
+
+    def enqueue(self, key: str, command: dict):
+        now = time.monotonic()
+        with self._lock:
+            self._sweep(now)
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._sessions[key] = _Session(now)
+            if len(session.commands) >= self.max_commands:
+                self.rejected += 1
+                raise SessionQueueFull(key, self.max_commands)
+            session.commands.append(command)
+            self.enqueued += 1
+
+    def drain(self, key: str) -> list:
+        """Removes and returns every pending command of a session, oldest first."""
+        now = time.monotonic()
+        with self._lock:
+            self._sweep(now)
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._sessions[key] = _Session(now)
+            session.last_active = now
+            commands = list(session.commands)
+            session.commands.clear()
+            self.delivered += len(commands)
+            return commands
+
+    def stats(self) -> dict:
+        with self._lock:
+            depths = {key: len(session.commands) for key, session in self._sessions.items()}
+            return self._stats(depths)
+
+    def _stats(self, depths: dict) -> dict:
+        return {
+            "persistent": self.persistent,
+            "sessions": len(depths),
+            "pending": sum(depths.values()),
+            "maxCommandsPerSession": self.max_commands,
+            "ttl": self.ttl,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "rejected": self.rejected,
+            "expired": self.expired,
+            "depths": depths
+        }
+
+    def _sweep(self, now: float):
+        if now - self._last_sweep < SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        for key in [key for key, session in self._sessions.items() if now - session.last_active > self.ttl]:
+            self.expired += len(self._sessions.pop(key).commands)
+
+
+class SQLiteSessionCommandStore(SessionCommandStore):
+    """Session command queues kept in an append-only SQLite table in WAL mode.
+
+    Queued commands survive a server restart. Enqueue and drain each run in a single write
+    transaction, which waits for the database lock while another server worker writes and can hit
+    the disk at a WAL checkpoint, so the API calls this store from the filesystem pool.
+    """
+
+    persistent = True
+
+    def __init__(self, db_path: str, max_commands: int = MAX_COMMANDS_PER_SESSION, ttl: float = SESSION_TTL):
+        super().__init__(max_commands, ttl)
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS sessions (key TEXT PRIMARY KEY, last_active REAL NOT NULL)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS commands ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT NOT NULL, command TEXT NOT NULL, argument TEXT NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS commands_key ON commands (key, id)")
+        # Wall clock, unlike the in-memory store, as timestamps outlive the process
+        self._last_sweep = 0.0
+        self._watcher = None
+        self._watch_stop = threading.Event()
+
+    def enqueue(self, key: str, command: dict):
+        now = time.time()
+        with self._lock, self._transaction():
+            self._sweep(now)
+            self._db.execute("INSERT OR IGNORE INTO sessions (key, last_active) VALUES (?, ?)", (key, now))
+            (depth,) = self._db.execute("SELECT COUNT(*) FROM commands WHERE key = ?", (key,)).fetchone()
+            if depth >= self.max_commands:
+                self.rejected += 1
+                raise SessionQueueFull(key, self.max_commands)
+            self._db.execute(
+                "INSERT INTO commands (key, command, argument) VALUES (?, ?, ?)",
+                (key, command["command"], command["argument"])
+            )
+            self.enqueued += 1
+
+    def drain(self, key: str) -> list:
+        now = time.time()
+        with self._lock, self._transaction():
+            self._sweep(now)
+            self._db.execute(
+                "INSERT INTO sessions (key, last_active) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET last_active = excluded.last_active",
+                (key, now)
+            )
+            rows = self._db.execute("SELECT id, command, argument FROM commands WHERE key = ? ORDER BY id", (key,)).fetchall()
+            if rows:
+                self._db.execute("DELETE FROM commands WHERE key = ? AND id <= ?", (key, rows[-1][0]))
+            self.delivered += len(rows)
+            return [{"command": command, "argument": argument} for _, command, argument in rows]
+
+    def stats(self) -> dict:
+        with self._lock:
+            depths = {key: 0 for (key,) in self._db.execute("SELECT key FROM sessions")}
+            depths.update(self._db.execute("SELECT key, COUNT(*) FROM commands GROUP BY key"))
+            return self._stats(depths)
+
+    def watch(self, on_commands, interval: float):
+        """Calls on_commands(keys) from a daemon thread after another connection changed the queues.
+
+        keys are the sessions that hold commands at that moment. The thread reads PRAGMA data_version
+        on its own connection every interval seconds, which costs no write, no lock and no pool thread;
+        the queue table is only read when the version moved.
+        """
+        if self._watcher is not None:
+            return
+        # The starting version is read before returning, so no command queued after this call is missed
+        db = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        (version,) = db.execute("PRAGMA data_version").fetchone()
+        self._watch_stop.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(db, version, on_commands, interval), name="session-command-watcher", daemon=True)
+        self._watcher.start()
+
+    def unwatch(self):
+        if self._watcher is None:
+            return
+        self._watch_stop.set()
+        self._watcher.join()
+        self._watcher = None
+
+    def _watch(self, db, version: int, on_commands, interval: float):
+        try:
+            while not self._watch_stop.wait(interval):
+                try:
+                    (current,) = db.execute("PRAGMA data_version").fetchone()
+                    if current == version:
+                        continue
+                    version = current
+                    keys = [key for (key,) in db.execute("SELECT DISTINCT key FROM commands")]
+                except sqlite3.OperationalError as e:
+                    print(f"Session command watcher: {e}")
+                    continue
+                if keys:
+                    on_commands(keys)
+        finally:
+            db.close()
+
+    def _sweep(self, now: float):
+        if now - self._last_sweep < SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        cutoff = now - self.ttl
+        cursor = self._db.execute("DELETE FROM commands WHERE key IN (SELECT key FROM sessions WHERE last_active < ?)", (cutoff,))
+        self.expired += max(cursor.rowcount, 0)
+        self._db.execute("DELETE FROM sessions WHERE last_active < ?", (cutoff,))
+
+    def _transaction(self):
+        return _Transaction(self._db)
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back when the block raises."""
+
+    def __init__(self, db):
+        self._db = db
+
+    def __enter__(self):
+        self._db.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, exc, tb):
+        self._db.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+        return False
+
+
+session_commands = SQLiteSessionCommandStore(SESSION_DB) if SESSION_DB else SessionCommandStore()
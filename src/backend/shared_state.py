@@ -0,0 +1,130 @@
+import os
+import hashlib
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# "memory" keeps mutable state inside the server process, which is only correct with a single
+# worker. "sqlite" moves it to files under STATE_DIR so several uvicorn workers share it.
+STATE_BACKEND = os.environ.get("STUDIOTOOLS_STATE_BACKEND", "memory")
+STATE_DIR = os.environ.get("STUDIOTOOLS_STATE_DIR", os.path.expanduser("~/.studiotools/state"))
+
+
+class MemoryStateBackend:
+    """Shared state for a single server process: locks and claims are plain thread locks."""
+
+    shared = False
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        self._locks = {}  # name -> threading.Lock
+        self._claims = set()
+
+    def path(self, name: str):
+        """File backing a piece of shared state, None when it lives in memory."""
+        return None
+
+    @contextmanager
+    def lock(self, name: str):
+        """Serializes read-modify-write sequences on the state called name."""
+        with self._guard:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            yield
+
+    def claim(self, name: str) -> bool:
+        """Takes exclusive ownership of a piece of work without waiting, False if someone else owns it."""
+        with self._guard:
+            if name in self._claims:
+                return False
+            self._claims.add(name)
+            return True
+
+    def release(self, name: str):
+        with self._guard:
+            self._claims.discard(name)
+
+
+class SQLiteStateBackend(MemoryStateBackend):
+    """Shared state for several worker processes on one host.
+
+    Data goes to SQLite databases in WAL mode under the state directory. Locks and claims are
+    flock()ed lock files there. The kernel drops a flock when its holder dies, so a crashed
+    worker never leaves a stale claim behind.
+    """
+
+    shared = True
+
+    def __init__(self, state_dir: str = STATE_DIR):
+        super().__init__()
+        if not HAS_FCNTL:
+            raise RuntimeError("The sqlite state backend needs fcntl (POSIX hosts only)")
+        self.state_dir = state_dir
+        self._lock_dir = os.path.join(state_dir, "locks")
+        os.makedirs(self._lock_dir, exist_ok=True)
+        self._claim_files = {}  # name -> open file holding the flock
+
+    def path(self, name: str):
+        return os.path.join(self.state_dir, name)
+
+    @contextmanager
+    def lock(self, name: str):
+        # The thread lock keeps threads of this process from queueing on the same file lock
+        with super().lock(name), open(self._lock_path(name), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def claim(self, name: str) -> bool:
+        if not super().claim(name):
+            return False
+        f = open(self._lock_path(name), "a")
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            super().release(name)
+            return False
+        with self._guard:
+            self._claim_files[name] = f
+        return True
+
+    def release(self, name: str):
+        with self._guard:
+            f = self._claim_files.pop(name, None)
+        if f is not None:
+            f.close()
+        super().release(name)
+
+    def _lock_path(self, name: str) -> str:
+        # Names can be file paths, hash them into flat, fixed length lock file names
+        return os.path.join(self._lock_dir, hashlib.sha1(name.encode()).hexdigest() + ".lock")
+
+
+def project_state_path(project_root: str, name: str) -> str:
+    """
+    File of per-project server state (caches, reports) under STATE_DIR, projects are told apart by their
+    real path. Only derived data that belongs to a publish is kept next to it in the show, in hidden
+    folders: USD summaries in .summary/ (usd_summary) and preview LODs in .lod/ (mesh_lod).
+    """
+    real_root = os.path.realpath(project_root)
+    digest = hashlib.sha1(real_root.encode()).hexdigest()[:16]
+    return os.path.join(STATE_DIR, "projects", f"{os.path.basename(real_root) or 'root'}-{digest}", name)
+
+
+def create_state_backend(name: str = STATE_BACKEND):
+    if name == "memory":
+        return MemoryStateBackend()
+    if name == "sqlite":
+        return SQLiteStateBackend()
+    raise ValueError(f"Unknown state backend: {name}")
+
+
+state_backend = create_state_backend()
@@ -0,0 +1,321 @@
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    from pxr import Usd
+    HAS_USD = True
+except ImportError:
+    HAS_USD = False
+
+# Budgets can be tuned per host, a layout stage can hold gigabytes once composed
+MAX_ENTRIES = int(os.environ.get("STUDIOTOOLS_STAGE_CACHE_ENTRIES", "8"))
+MAX_BYTES = int(os.environ.get("STUDIOTOOLS_STAGE_CACHE_MB", "2048")) * 1024 * 1024
+
+# Load policies a stage can be opened with. "none" leaves every payload unloaded until asked for.
+LOAD_POLICIES = ("all", "none")
+
+# Composed stages take several times their on-disk layer size in memory (crate files are compressed)
+LAYER_MEMORY_FACTOR = 4
+
+
+class _Entry:
+    __slots__ = ("cache_id", "stage", "layers", "approx_bytes", "derived", "generation")
+
+    def __init__(self, cache_id, stage, layers, approx_bytes):
+        self.cache_id = cache_id
+        self.stage = stage
+        self.layers = layers  # [(Sdf.Layer, real path, mtime_ns)]
+        self.approx_bytes = approx_bytes
+        self.derived = {}  # values computed from the composed stage, see StageCache.derived
+        self.generation = 0  # bumped whenever the composed stage changes
+
+    def update_layers(self, layers):
+        self.layers = layers
+        self.approx_bytes = StageCache._approx_bytes(layers)
+        self.derived = {}
+        self.generation += 1
+
+
+class _AccessLock:
+    """Many readers or one writer, waiting writers go first. A thread can nest shared sections."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+        self._local = threading.local()
+
+    def held(self) -> bool:
+        """Whether the calling thread is inside a shared section."""
+        return getattr(self._local, "depth", 0) > 0
+
+    @contextmanager
+    def shared(self):
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            with self._cond:
+                while self._writer or self._writers_waiting:
+                    self._cond.wait()
+                self._readers += 1
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            if depth == 0:
+                with self._cond:
+                    self._readers -= 1
+                    if self._readers == 0:
+                        self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        if self.held():
+            raise RuntimeError("Stage cache write requested inside a read of the same thread")
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class StageCache:
+    """Process-wide cache of opened USD stages.
+
+    Stages are owned by a Usd.StageCache and keyed by resolved path and load policy. Every lookup
+    stats the stage's used layers: layers edited on disk are reloaded in place, and a stage whose
+    layers disappeared is dropped and reopened. Entries are evicted least recently used first once either the entry budget
+    or the approximate memory budget is exceeded.
+
+    Cached stages are shared between threads, so they are only used inside reading() or writing().
+    Readers run side by side. Reloads and writers wait until every reader is done and keep new
+    readers out meanwhile. This lock covers all stages: Sdf layers are shared process-wide, so
+    reloading a layer recomposes every cached stage that uses it.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._usd_cache = Usd.StageCache() if HAS_USD else None
+        self._entries = OrderedDict()  # (resolved path, load policy) -> _Entry
+        self._lock = threading.RLock()
+        self._access = _AccessLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reloads = 0
+
+    @contextmanager
+    def reading(self, filepath: str, load: str = "all"):
+        """
+        Yields the cached stage for filepath, opening it on a miss, or None if it cannot be opened.
+        The stage is neither reloaded nor has its load state changed until the block exits.
+        """
+        stage = self._open(filepath, load)
+        with self._access.shared():
+            yield stage
+
+    @contextmanager
+    def writing(self, filepath: str, load: str = "all"):
+        """
+        Yields the cached stage for filepath with every reader of any cached stage shut out, for
+        changing its load state. The used layers are re-read when the block exits.
+        """
+        stage = self._open(filepath, load)
+        with self._access.exclusive():
+            try:
+                yield stage
+            finally:
+                if stage is not None:
+                    self._refresh((os.path.realpath(filepath), load), stage)
+
+    def _open(self, filepath: str, load: str):
+        if load not in LOAD_POLICIES:
+            raise ValueError(f"Unknown load policy: {load}")
+        key = (os.path.realpath(filepath), load)
+        with self._lock:
+            entry = self._entries.get(key)
+            changed = self._changed_layers(key, entry) if entry is not None else None
+            if changed == []:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.stage
+        if changed:
+            # Reload outside the cache lock: waiting for readers must not hold up lookups
+            stage = self._reload(key, entry, changed)
+            if stage is not None:
+                return stage
+        with self._lock:
+            self.misses += 1
+
+        # Opening can take seconds on big stages, don't hold up lookups of other files meanwhile.
+        # It reads layers other stages may share, so it must not overlap a reload.
+        with self._access.shared():
+            stage = Usd.Stage.Open(key[0], Usd.Stage.LoadAll if load == "all" else Usd.Stage.LoadNone)
+        if not stage:
+            return None
+        layers = self._layer_signature(stage)
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Another request opened it in the meantime, keep a single copy
+                return existing.stage
+            entry = _Entry(self._usd_cache.Insert(stage), stage, layers, self._approx_bytes(layers))
+            self._entries[key] = entry
+            self._evict()
+        return stage
+
+    def _refresh(self, key: tuple, stage):
+        """Re-reads the used layers of a cached stage after its load state changed (payloads loaded or unloaded)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stage is stage:
+                entry.update_layers(self._layer_signature(stage))
+                self._evict()
+
+    def signature(self, filepath: str, load: str = "all") -> tuple:
+        """(real path, mtime_ns) of every used layer of a cached stage, identifies what its composition was built from."""
+        with self._lock:
+            entry = self._entries.get((os.path.realpath(filepath), load))
+            if entry is None:
+                return ()
+            return tuple(sorted((real_path, mtime) for _, real_path, mtime in entry.layers))
+
+    def derived(self, filepath: str, load: str, name: str, compute):
+        """
+        Memoizes compute(stage) on a cached stage. Values are dropped whenever the stage's layers
+        change on disk or its load state changes, and a value computed from a stage that changed
+        meanwhile is returned but not kept.
+        """
+        key = (os.path.realpath(filepath), load)
+        with self.reading(filepath, load) as stage:
+            if stage is None:
+                return None
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry.stage is not stage:
+                    return compute(stage)
+                if name in entry.derived:
+                    return entry.derived[name]
+                generation = entry.generation
+            value = compute(stage)
+            with self._lock:
+                if entry.generation == generation and self._entries.get(key) is entry:
+                    entry.derived[name] = value
+            return value
+
+    def invalidate(self, filepath: str = None):
+        """Drops the entries for filepath (under any load policy), or every entry when no path is given."""
+        with self._lock:
+            real_path = os.path.realpath(filepath) if filepath is not None else None
+            keys = [key for key in self._entries if real_path is None or key[0] == real_path]
+            for key in keys:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._usd_cache.Erase(entry.cache_id)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+                "approxBytes": sum(entry.approx_bytes for entry in self._entries.values()),
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "reloads": self.reloads,
+                "stages": [{"path": path, "load": load} for path, load in self._entries]
+            }
+
+    def _changed_layers(self, key: tuple, entry: _Entry):
+        """
+        Layers of an entry edited on disk since they were read. Returns None, after dropping the
+        entry, when one of them vanished. Called with the cache lock held.
+        """
+        changed = []
+        for layer, real_path, mtime in entry.layers:
+            try:
+                current = os.stat(real_path).st_mtime_ns
+            except OSError:
+                # A sublayer or reference vanished, recompose from scratch
+                self._entries.pop(key, None)
+                self._usd_cache.Erase(entry.cache_id)
+                return None
+            if current != mtime:
+                changed.append(layer)
+        return changed
+
+    def _reload(self, key: tuple, entry: _Entry, changed: list):
+        """Reloads edited layers of an entry once no thread is reading and returns its stage, None if it was dropped."""
+        if self._access.held():
+            # A nested lookup inside a read of this thread, the reload waits for its next request
+            return entry.stage
+        with self._access.exclusive():
+            with self._lock:
+                # Dropped, replaced or a layer vanished while waiting for the readers
+                if self._entries.get(key) is not entry:
+                    return None
+                changed = self._changed_layers(key, entry)
+                if changed is None:
+                    return None
+            for layer in changed:
+                layer.Reload()
+            with self._lock:
+                if changed:
+                    self.reloads += 1
+                # Edits can add or remove sublayers and references, so the used-layer set is re-read
+                entry.update_layers(self._layer_signature(entry.stage))
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self._evict()
+        return entry.stage
+
+    def _evict(self):
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or sum(entry.approx_bytes for entry in self._entries.values()) > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._usd_cache.Erase(entry.cache_id)
+            self.evictions += 1
+
+    @staticmethod
+    def _layer_signature(stage) -> list:
+        layers = []
+        for layer in stage.GetUsedLayers():
+            real_path = layer.realPath
+            # Anonymous session layers have nothing on disk to watch
+            if not real_path:
+                continue
+            try:
+                layers.append((layer, real_path, os.stat(real_path).st_mtime_ns))
+            except OSError:
+                continue
+        return layers
+
+    @staticmethod
+    def _approx_bytes(layers) -> int:
+        total = 0
+        for _, real_path, _ in layers:
+            try:
+                total += os.path.getsize(real_path)
+            except OSError:
+                continue
+        return total * LAYER_MEMORY_FACTOR
+
+
+stage_cache = StageCache() if HAS_USD else None
@@ -0,0 +1,147 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .thumbnail_generator import generate_usd_thumbnail
+from .usd_summary import read_summary
+from .shared_state import state_backend
+from .executors import spawn_process_pool
+
+# Rendering is CPU bound, keep half the cores free for the API and the DCCs on the same host.
+# Every server worker has its own pool, multi-worker deployments lower this per process.
+MAX_WORKERS = int(os.environ.get("STUDIOTOOLS_THUMBNAIL_WORKERS", "0")) or max(1, min(4, (os.cpu_count() or 2) // 2))
+
+# Failed renders remembered so the tree doesn't requeue them on every poll, oldest are forgotten first
+MAX_REMEMBERED_FAILURES = 1000
+
+
+def _file_signature(path: str):
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def render_publish_thumbnail(thumb_path: str, usd_path: str = None, shape: str = "mesh", asset_name: str = "asset", app_name: str = "blender"):
+    """
+    Worker side of a job. The dominant geometry of the publish's summary sidecar decides the shape
+    drawn, the stage itself is never opened here. Without a sidecar (publish validation writes them)
+    the shape guessed from the publish metadata is drawn.
+    """
+    summary = read_summary(usd_path) if usd_path else None
+    if summary and summary.get("dominantGeometry"):
+        shape = summary["dominantGeometry"]
+    generate_usd_thumbnail(thumb_path, shape=shape, asset_name=asset_name, app_name=app_name)
+
+
+class ThumbnailQueue:
+    """Background render queue for publish thumbnails.
+
+    Jobs run in a bounded process pool so rendering never blocks request handlers. Requests for a
+    thumbnail that is already queued or rendering are folded into the existing job, and listeners
+    are notified with the thumbnail path whenever a job finishes (successfully or not). With a shared
+    state backend a job is claimed host-wide first, so only one server worker renders a thumbnail.
+
+    A worker crash breaks the whole pool and fails every job in flight with it, those jobs are run
+    once more on a fresh pool. Failures are remembered against the publish file's mtime and size,
+    republishing the file retries its thumbnail.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = {}  # thumbnail path -> (job arguments, executor running it, retried)
+        self._failed = OrderedDict()  # thumbnail path -> (publish file signature, error message)
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """Registers callback(thumb_path) to run after every finished job."""
+        self._listeners.append(callback)
+
+    def submit(self, thumb_path: str, shape: str, asset_name: str, app_name: str, force: bool = False, usd_path: str = None) -> str:
+        """Queues a render of the publish at usd_path unless one is already in flight and returns the thumbnail state."""
+        signature = _file_signature(usd_path)
+        with self._lock:
+            if thumb_path in self._pending:
+                return "pending"
+            failure = self._failed.get(thumb_path)
+            if failure is not None and failure[0] == signature and not force:
+                return "failed"
+            self._failed.pop(thumb_path, None)
+            claim = f"thumbnail:{thumb_path}"
+            if not state_backend.claim(claim):
+                # Another worker is rendering it, the file shows up in the tree once written
+                return "pending"
+            if not force and os.path.exists(thumb_path):
+                # Written by another worker since this one listed the folder
+                state_backend.release(claim)
+                return "pending"
+
+            job = (thumb_path, usd_path, shape, asset_name, app_name)
+            try:
+                future = self._start(job)
+            except Exception:
+                state_backend.release(claim)
+                raise
+            self._pending[thumb_path] = (job, self._executor, False)
+
+        future.add_done_callback(lambda fut: self._finished(thumb_path, fut))
+        return "pending"
+
+    def _start(self, job: tuple):
+        # Called with the lock held
+        try:
+            return self._get_executor().submit(render_publish_thumbnail, *job)
+        except BrokenProcessPool:
+            # A crashed worker poisons the whole pool, start a fresh one
+            self._executor = None
+            return self._get_executor().submit(render_publish_thumbnail, *job)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = spawn_process_pool(self.max_workers)
+        return self._executor
+
+    def _finished(self, thumb_path: str, future):
+        error = future.exception() if not future.cancelled() else None
+        with self._lock:
+            job, executor, retried = self._pending.pop(thumb_path, (None, None, True))
+            if isinstance(error, BrokenProcessPool) and not retried:
+                # Most likely another job's crash took this one down, give it a fresh pool
+                if self._executor is executor:
+                    self._executor = None
+                try:
+                    retry = self._start(job)
+                except Exception as e:
+                    error = e
+                else:
+                    self._pending[thumb_path] = (job, self._executor, True)
+                    retry.add_done_callback(lambda fut: self._finished(thumb_path, fut))
+                    return
+
+            state_backend.release(f"thumbnail:{thumb_path}")
+            if error is not None:
+                self._failed[thumb_path] = (_file_signature(job[1]) if job else None, str(error))
+                while len(self._failed) > MAX_REMEMBERED_FAILURES:
+                    self._failed.popitem(last=False)
+        if error is not None:
+            print(f"Failed to generate thumbnail {thumb_path}: {error}")
+
+        for callback in self._listeners:
+            try:
+                callback(thumb_path)
+            except Exception as e:
+                print(f"Thumbnail listener failed for {thumb_path}: {e}")
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+thumbnail_queue = ThumbnailQueue()
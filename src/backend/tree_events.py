@@ -0,0 +1,141 @@
+import asyncio
+
+from .project_index import get_project_index, add_invalidation_listener
+from .executors import filesystem_pool
+
+# How often a watched project is revalidated while at least one client is subscribed
+WATCH_INTERVAL = 2.0
+
+# Comment frames keep idle streams open through proxies and surface disconnected clients
+KEEPALIVE_INTERVAL = 15.0
+
+# Node keys compared when diffing, children and files are diffed separately
+NODE_FIELDS = ("name", "type", "subtype", "latestVersions")
+
+
+def diff_trees(old: dict, new: dict) -> list:
+    """
+    Returns the changes turning tree old into tree new. Unchanged subtrees are the very same
+    objects in both (the project index memoizes nodes), so they are skipped without being walked.
+    """
+    changes = []
+    _diff_node(old, new, changes)
+    return changes
+
+
+def _diff_node(old: dict, new: dict, changes: list):
+    if old is new:
+        return
+
+    if any(old.get(field) != new.get(field) for field in NODE_FIELDS):
+        changes.append({"op": "updateNode", "path": new["path"], "node": {field: new.get(field) for field in NODE_FIELDS}})
+
+    if old["files"] is not new["files"]:
+        old_files = {f["absolutePath"]: f for f in old["files"]}
+        new_files = {f["absolutePath"]: f for f in new["files"]}
+        added = [f for path, f in new_files.items() if path not in old_files]
+        removed = [path for path in old_files if path not in new_files]
+        changed = [f for path, f in new_files.items() if path in old_files and old_files[path] != f]
+        if added or removed or changed:
+            changes.append({"op": "files", "path": new["path"], "added": added, "removed": removed, "changed": changed})
+
+    if old["children"] is not new["children"]:
+        old_children = {child["path"]: child for child in old["children"]}
+        new_paths = {child["path"] for child in new["children"]}
+        for path in old_children:
+            if path not in new_paths:
+                changes.append({"op": "removeNode", "path": path})
+        for position, child in enumerate(new["children"]):
+            previous = old_children.get(child["path"])
+            if previous is None:
+                changes.append({"op": "addNode", "parentPath": new["path"], "index": position, "node": child})
+            else:
+                _diff_node(previous, child, changes)
+
+
+class ProjectWatcher:
+    """Revalidates one project index on behalf of every subscribed client and fans out tree deltas.
+
+    However many tabs are open on a project, the server scans it at most once per interval, and
+    not at all once the last subscriber disconnects. Invalidations from API writes or finished
+    thumbnails wake the watcher immediately instead of waiting for the next tick.
+    """
+
+    def __init__(self, index, loop):
+        self.index = index
+        self._loop = loop
+        self._subscribers = set()
+        self._wake = asyncio.Event()
+        self._start_lock = asyncio.Lock()
+        self._task = None
+        self._tree = None
+
+    async def subscribe(self):
+        """Returns (queue of delta payloads, current tree) for a new client."""
+        async with self._start_lock:
+            if self._task is None:
+                self._tree = await filesystem_pool.run(self.index.get_tree)
+                self._task = asyncio.create_task(self._run())
+            queue = asyncio.Queue()
+            self._subscribers.add(queue)
+            # Deltas queued from here on apply on top of exactly this tree
+            return queue, self._tree
+
+    def unsubscribe(self, queue):
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def wake(self):
+        """Thread safe, asks for a revalidation as soon as possible."""
+        self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), WATCH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                tree = await filesystem_pool.run(self.index.get_tree)
+            except Exception as e:
+                print(f"Project watcher failed to revalidate {self.index.root}: {e}")
+                continue
+            if tree is self._tree:
+                continue
+
+            changes = diff_trees(self._tree, tree)
+            self._tree = tree
+            if changes:
+                payload = {"version": self.index.version, "changes": changes}
+                for queue in self._subscribers:
+                    queue.put_nowait(payload)
+
+
+_WATCHERS = {}  # ProjectIndex -> ProjectWatcher
+
+
+def get_project_watcher(path: str) -> ProjectWatcher:
+    """Returns the watcher of a project, must be called from the event loop."""
+    index = get_project_index(path)
+    watcher = _WATCHERS.get(index)
+    if watcher is None:
+        watcher = ProjectWatcher(index, asyncio.get_running_loop())
+        _WATCHERS[index] = watcher
+    return watcher
+
+
+def _wake_watcher(index):
+    watcher = _WATCHERS.get(index)
+    if watcher is not None:
+        try:
+            watcher.wake()
+        except RuntimeError:
+            # The loop is gone (server shutting down), nobody is listening anymore
+            pass
+
+
+add_invalidation_listener(_wake_watcher)
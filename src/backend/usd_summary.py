@@ -0,0 +1,114 @@
+import os
+import json
+import hashlib
+
+from .metadata_io import write_atomic
+
+# Hidden folder next to the USD files holding their summaries, the project index skips hidden entries
+SUMMARY_DIR = ".summary"
+
+# Bumped whenever the sidecar layout or the summary fields change, sidecars of another format are rebuilt
+SUMMARY_FORMAT = 2
+
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def summary_path(usd_path: str) -> str:
+    """Sidecar file of usd_path: <publish folder>/.summary/<file name>.json"""
+    return os.path.join(os.path.dirname(usd_path), SUMMARY_DIR, os.path.basename(usd_path) + ".json")
+
+
+def file_hash(path: str) -> str:
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def _load_sidecar(usd_path: str):
+    try:
+        with open(summary_path(usd_path), "r", encoding="utf-8") as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return sidecar if sidecar.get("format") == SUMMARY_FORMAT else None
+
+
+def _stale_layers(sidecar: dict):
+    """Layers of a sidecar whose mtime or size moved on disk, None when one of them is gone."""
+    stale = []
+    for layer in sidecar["layers"]:
+        try:
+            st = os.stat(layer["path"])
+        except OSError:
+            return None
+        if (st.st_mtime_ns, st.st_size) != (layer["mtimeNs"], layer["size"]):
+            stale.append((layer, st))
+    return stale
+
+
+def read_summary(usd_path: str):
+    """
+    Returns the stored summary of usd_path, or None when there is no sidecar for the stage as it is
+    now. A summary describes the composed stage, so it is only current while every layer the stage
+    used (the file itself, its sublayers, references and payloads) keeps its mtime and size. Only
+    stats the layers, never hashes or writes, cheap enough for tree builds.
+    """
+    sidecar = _load_sidecar(usd_path)
+    if sidecar is None or _stale_layers(sidecar) != []:
+        return None
+    return sidecar["summary"]
+
+
+def load_or_build_summary(usd_path: str, build) -> dict:
+    """
+    Returns the summary of usd_path from its sidecar, calling build() and storing its result when
+    the sidecar is missing or stale. build() returns (summary, used layer paths), the summary having
+    an "error" key on failure. Failures are passed through and never stored.
+
+    Layers whose mtime moved with the same size (a touch, an rsync or a restore) are hashed, and
+    the sidecar is re-stamped instead of rebuilt when their content is unchanged.
+    """
+    sidecar = _load_sidecar(usd_path)
+    if sidecar is not None:
+        stale = _stale_layers(sidecar)
+        if stale == []:
+            return sidecar["summary"]
+        if stale and all(st.st_size == layer["size"] for layer, st in stale):
+            try:
+                unchanged = all(file_hash(layer["path"]) == layer["sha1"] for layer, _ in stale)
+            except OSError:
+                unchanged = False
+            if unchanged:
+                for layer, st in stale:
+                    layer["mtimeNs"] = st.st_mtime_ns
+                _write_sidecar(usd_path, sidecar)
+                return sidecar["summary"]
+
+    summary, layer_paths = build()
+    if "error" in summary:
+        return summary
+
+    layers = []
+    try:
+        for path in layer_paths:
+            st = os.stat(path)
+            layers.append({"path": path, "mtimeNs": st.st_mtime_ns, "size": st.st_size, "sha1": file_hash(path)})
+            # Rewritten while being hashed, the next call summarizes the new content
+            if os.stat(path).st_mtime_ns != st.st_mtime_ns:
+                return summary
+    except OSError:
+        return summary
+
+    _write_sidecar(usd_path, {"format": SUMMARY_FORMAT, "layers": layers, "summary": summary})
+    return summary
+
+
+def _write_sidecar(usd_path: str, sidecar: dict):
+    path = summary_path(usd_path)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, lambda f: json.dump(sidecar, f, separators=(",", ":")))
+    except OSError as e:
+        print(f"Could not write USD summary {path}: {e}")
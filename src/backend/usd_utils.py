@@ -1,6 +1,9 @@
 import os
 import sys
+import time
 import traceback
+import numpy as np
+from collections import Counter
 
 # Import USD bindings safely
 try:
@@ -9,6 +12,10 @@ try:
 except ImportError:
     HAS_USD = False
 
+from .stage_cache import stage_cache
+from .mesh_lod import lod_budget, decimate_mesh, load_or_build_lod
+from .usd_summary import load_or_build_summary
+
 def inspect_usd_stage(filepath: str) -> dict:
     """
     Opens a USD stage and extracts its Prim hierarchy, specifiers, active status,
@@ -22,33 +29,35 @@ def inspect_usd_stage(filepath: str) -> dict:
         return get_mock_usd_stage(filepath)
 
     try:
-        stage = Usd.Stage.Open(filepath)
-        if not stage:
-            return {"error": "Failed to open USD Stage."}
+        with _open_stage(filepath) as stage:
+            if not stage:
+                return {"error": "Failed to open USD Stage."}
 
-        root_prim = stage.GetPseudoRoot()
+            root_prim = stage.GetPseudoRoot()
         
-        # Metadata
-        metadata = {
-            "filePath": filepath,
-            "upAxis": str(UsdGeom.GetStageUpAxis(stage)),
-            "startTimeCode": stage.GetStartTimeCode(),
-            "endTimeCode": stage.GetEndTimeCode(),
-            "framesPerSecond": stage.GetFramesPerSecond(),
-            "hasUSD": True
-        }
+            # Metadata
+            metadata = {
+                "filePath": filepath,
+                "upAxis": str(UsdGeom.GetStageUpAxis(stage)),
+                "startTimeCode": stage.GetStartTimeCode(),
+                "endTimeCode": stage.GetEndTimeCode(),
+                "framesPerSecond": stage.GetFramesPerSecond(),
+                "hasUSD": True
+            }
 
-        # Create an XformCache for global coordinate evaluation
-        time = stage.GetStartTimeCode()
-        xform_cache = UsdGeom.XformCache(time)
+            # Create an XformCache for global coordinate evaluation
+            time = stage.GetStartTimeCode()
+            xform_cache = UsdGeom.XformCache(time)
 
-        # Recursively parse the Prim tree
-        hierarchy = _parse_prim_recursive(root_prim, xform_cache)
+            # Recursively parse the Prim tree
+            hierarchy = _parse_prim_recursive(root_prim, xform_cache)
         
-        return {
-            "metadata": metadata,
-            "hierarchy": hierarchy
-        }
+            return {
+                "metadata": metadata,
+                "hierarchy": hierarchy,
+                # The stage is fully loaded already, summarizing it here keeps the sidecar current
+                "summary": get_usd_summary(filepath, stage)
+            }
     except Exception as e:
         return {
             "error": f"USD stage parsing error: {str(e)}",
@@ -58,6 +67,29 @@ def inspect_usd_stage(filepath: str) -> dict:
 
 def _parse_prim_recursive(prim, xform_cache=None) -> dict:
     """Recursively converts a USD Prim and its properties into a dictionary."""
+    node = _prim_summary(prim, xform_cache)
+    if node["geomData"].get("shape") == "mesh":
+        # The served viewer bundle still draws meshes from inline lists, the lazy endpoints stream buffers
+        node["geomData"].update(_inline_mesh_geometry(UsdGeom.Mesh(prim)))
+    node.update(_prim_details(prim))
+    node["children"] = [_parse_prim_recursive(child, xform_cache) for child in prim.GetChildren()]
+    return node
+
+def _inline_mesh_geometry(mesh) -> dict:
+    """Points and fan triangulated indices as JSON lists, in authored winding (the viewer flips leftHanded meshes itself)."""
+    points_attr = mesh.GetPointsAttr().Get()
+    counts_attr = mesh.GetFaceVertexCountsAttr().Get()
+    indices_attr = mesh.GetFaceVertexIndicesAttr().Get()
+    if indices_attr and counts_attr:
+        indices = _triangulate_faces(counts_attr, indices_attr).tolist()
+    elif indices_attr:
+        indices = list(indices_attr)
+    else:
+        indices = list(range(len(points_attr)))
+    return {"points": np.asarray(points_attr).reshape(-1, 3).tolist(), "indices": indices}
+
+def _prim_summary(prim, xform_cache=None) -> dict:
+    """Name, type, status and viewport geometry of a prim, everything the hierarchy tree needs."""
     prim_path = str(prim.GetPath())
     raw_name = prim.GetName()
     prim_name = raw_name if raw_name else "/"
@@ -105,38 +137,32 @@ def _parse_prim_recursive(prim, xform_cache=None) -> dict:
             elif prim_type == "Mesh":
                 mesh = UsdGeom.Mesh(prim)
                 points_attr = mesh.GetPointsAttr().Get()
-                indices_attr = mesh.GetFaceVertexIndicesAttr().Get()
                 counts_attr = mesh.GetFaceVertexCountsAttr().Get()
+                indices_attr = mesh.GetFaceVertexIndicesAttr().Get()
                 orient_attr = mesh.GetOrientationAttr().Get()
                 if points_attr:
+                    # Points and triangles are served as binary buffers by read_mesh_buffers,
+                    # the hierarchy only references them by prim path
                     geom_data["shape"] = "mesh"
-                    geom_data["points"] = [list(pt) for pt in points_attr]
                     geom_data["orientation"] = orient_attr if orient_attr else "rightHanded"
-                    
-                    if indices_attr and counts_attr:
-                        # Triangulate USD polygon faces (fan triangulation)
-                        # Three.js requires purely triangulated face index arrays.
-                        triangulated_indices = []
-                        index_offset = 0
-                        for count in counts_attr:
-                            face_indices = indices_attr[index_offset : index_offset + count]
-                            index_offset += count
-                            
-                            # Fan triangulation split
-                            # Poly face [v0, v1, v2, ..., v_n] -> Triangles: [v0, v1, v2], [v0, v2, v3]...
-                            for i in range(1, count - 1):
-                                triangulated_indices.append(face_indices[0])
-                                triangulated_indices.append(face_indices[i])
-                                triangulated_indices.append(face_indices[i + 1])
-                                
-                        geom_data["indices"] = triangulated_indices
-                    elif indices_attr:
-                        geom_data["indices"] = list(indices_attr)
-                    else:
-                        geom_data["indices"] = list(range(len(points_attr)))
+                    geom_data["pointCount"] = len(points_attr)
+                    geom_data["indexCount"] = _triangulated_index_count(counts_attr, indices_attr, len(points_attr))
         except Exception as e:
             print(f"Xform/geom error on prim {prim.GetPath()}: {e}")
 
+    return {
+        "name": prim_name,
+        "path": prim_path,
+        "type": prim_type if prim_type else "Scope",
+        "specifier": specifier,
+        "active": is_active,
+        "hasPayload": prim.HasAuthoredPayloads(),
+        "loaded": prim.IsLoaded(),
+        "geomData": geom_data
+    }
+
+def _prim_details(prim) -> dict:
+    """Variant sets, composition arcs and attribute values of a single prim."""
     # Variant sets
     variant_sets = {}
     if hasattr(prim, "GetVariantSets"):
@@ -178,10 +204,11 @@ def _parse_prim_recursive(prim, xform_cache=None) -> dict:
         if attr.HasValue():
             val = attr.Get()
             if isinstance(val, (Vt.Vec3fArray, Vt.Vec3dArray, Vt.Vec3hArray, Vt.FloatArray, Vt.DoubleArray, Vt.IntArray)):
-                # Convert array types to plain lists for JSON
-                value = list(val)
-                if len(value) > 10: # Truncate large arrays
-                    value = value[:10] + [f"... ({len(value) - 10} more items)"]
+                # Convert array types to plain lists for JSON, slicing before conversion
+                # so large point arrays are never materialized as Python objects
+                value = [val[i] for i in range(min(len(val), 10))]
+                if len(val) > 10: # Truncate large arrays
+                    value.append(f"... ({len(val) - 10} more items)")
             elif hasattr(val, '__str__') and not isinstance(val, (str, int, float, bool, list, dict)):
                 value = str(val)
             else:
@@ -194,23 +221,393 @@ def _parse_prim_recursive(prim, xform_cache=None) -> dict:
             "variability": str(attr.GetVariability()).split(".")[-1]
         })
 
-    children = []
-    for child in prim.GetChildren():
-        children.append(_parse_prim_recursive(child, xform_cache))
-
     return {
-        "name": prim_name,
-        "path": prim_path,
-        "type": prim_type if prim_type else "Scope",
-        "specifier": specifier,
-        "active": is_active,
         "variantSets": variant_sets,
         "references": references,
-        "attributes": attributes,
-        "children": children,
-        "geomData": geom_data
+        "attributes": attributes
+    }
+
+# --- Lazy Stage Inspection ---
+
+# Children returned per hierarchy page when the caller does not ask for a size, and the hard cap
+DEFAULT_CHILDREN_PAGE = 200
+MAX_CHILDREN_PAGE = 1000
+
+# The inspector opens stages with every payload unloaded, heavy asset geometry is only composed on request
+INSPECT_LOAD_POLICY = "none"
+
+if HAS_USD:
+    # Like the default predicate but keeps unloaded payload prims, they are listed as placeholders
+    HIERARCHY_PREDICATE = Usd.PrimIsActive & Usd.PrimIsDefined & ~Usd.PrimIsAbstract
+
+def _open_stage(filepath: str, load: str = "all"):
+    """Reads the stage for filepath from the process-wide stage cache, use as `with _open_stage(...) as stage`."""
+    return stage_cache.reading(filepath, load)
+
+def _xform_cache(stage):
+    # XformCache is not thread safe, every request evaluates transforms with its own
+    return UsdGeom.XformCache(stage.GetStartTimeCode())
+
+def _stage_metadata(stage, filepath: str, load: str) -> dict:
+    return {
+        "filePath": filepath,
+        "upAxis": str(UsdGeom.GetStageUpAxis(stage)),
+        "startTimeCode": stage.GetStartTimeCode(),
+        "endTimeCode": stage.GetEndTimeCode(),
+        "framesPerSecond": stage.GetFramesPerSecond(),
+        "loadPolicy": load,
+        "hasUSD": True
     }
 
+def _lazy_summary(prim, xform_cache) -> dict:
+    node = _prim_summary(prim, xform_cache)
+    node["childCount"] = len(prim.GetFilteredChildrenNames(HIERARCHY_PREDICATE))
+    return node
+
+def _children_page(prim, xform_cache, offset: int, limit: int) -> dict:
+    # Child names are cheap to list, prims are only built for the requested page
+    names = prim.GetFilteredChildrenNames(HIERARCHY_PREDICATE)
+    children = [_lazy_summary(prim.GetChild(name), xform_cache) for name in names[offset:offset + limit]]
+    return {"path": str(prim.GetPath()), "offset": offset, "total": len(names), "children": children}
+
+def _clamp_page(offset: int, limit) -> tuple:
+    if limit is None:
+        limit = DEFAULT_CHILDREN_PAGE
+    return max(0, offset), max(1, min(limit, MAX_CHILDREN_PAGE))
+
+def open_usd_stage(filepath: str, limit: int = None, load: str = INSPECT_LOAD_POLICY) -> dict:
+    """
+    Opens (or reuses) a USD stage and returns its metadata, the pseudo-root and the first page
+    of root prims. Deeper levels are fetched with get_prim_children, attributes with get_prim_details.
+    """
+    if not os.path.exists(filepath):
+        return {"error": f"File does not exist: {filepath}"}
+
+    if not HAS_USD:
+        mock = get_mock_usd_stage(filepath)
+        return {"metadata": mock["metadata"], "hierarchy": _lazy_mock_node(mock["hierarchy"], 0, limit)}
+
+    try:
+        with _open_stage(filepath, load) as stage:
+            if not stage:
+                return {"error": "Failed to open USD Stage."}
+
+            xform_cache = _xform_cache(stage)
+            root_prim = stage.GetPseudoRoot()
+            page = _children_page(root_prim, xform_cache, *_clamp_page(0, limit))
+            hierarchy = _prim_summary(root_prim, xform_cache)
+            hierarchy["childCount"] = page["total"]
+            hierarchy["children"] = page["children"]
+            return {
+                "metadata": _stage_metadata(stage, filepath, load),
+                "hierarchy": hierarchy
+            }
+    except Exception as e:
+        return {
+            "error": f"USD stage parsing error: {str(e)}",
+            "traceback": traceback.format_exc(),
+            "hasUSD": HAS_USD
+        }
+
+def get_prim_children(filepath: str, prim_path: str, offset: int = 0, limit: int = None, load: str = INSPECT_LOAD_POLICY) -> dict:
+    """Returns one page of a prim's children as summaries carrying their own childCount."""
+    if not os.path.exists(filepath):
+        return {"error": f"File does not exist: {filepath}"}
+
+    offset, limit = _clamp_page(offset, limit)
+    if not HAS_USD:
+        node = _find_mock_prim(filepath, prim_path)
+        if node is None:
+            return {"error": f"No prim at {prim_path}"}
+        children = node.get("children", [])
+        return {
+            "path": prim_path,
+            "offset": offset,
+            "total": len(children),
+            "children": [_lazy_mock_node(child) for child in children[offset:offset + limit]]
+        }
+
+    try:
+        with _open_stage(filepath, load) as stage:
+            if not stage:
+                return {"error": "Failed to open USD Stage."}
+            prim = stage.GetPrimAtPath(prim_path)
+            if not prim:
+                return {"error": f"No prim at {prim_path}"}
+            return _children_page(prim, _xform_cache(stage), offset, limit)
+    except Exception as e:
+        return {"error": f"USD stage parsing error: {str(e)}"}
+
+def get_prim_details(filepath: str, prim_path: str, load: str = INSPECT_LOAD_POLICY) -> dict:
+    """Returns variant sets, composition arcs and attributes of a single prim."""
+    if not os.path.exists(filepath):
+        return {"error": f"File does not exist: {filepath}"}
+
+    if not HAS_USD:
+        node = _find_mock_prim(filepath, prim_path)
+        if node is None:
+            return {"error": f"No prim at {prim_path}"}
+        return {
+            "path": prim_path,
+            "variantSets": node.get("variantSets", {}),
+            "references": node.get("references", []),
+            "attributes": node.get("attributes", [])
+        }
+
+    try:
+        with _open_stage(filepath, load) as stage:
+            if not stage:
+                return {"error": "Failed to open USD Stage."}
+            prim = stage.GetPrimAtPath(prim_path)
+            if not prim:
+                return {"error": f"No prim at {prim_path}"}
+            details = _prim_details(prim)
+            details["path"] = prim_path
+            return details
+    except Exception as e:
+        return {"error": f"USD stage parsing error: {str(e)}"}
+
+def set_payload_loaded(filepath: str, prim_path: str, loaded: bool, load: str = INSPECT_LOAD_POLICY) -> dict:
+    """
+    Loads or unloads the payloads at and below prim_path on the cached stage and returns the prim's
+    refreshed summary. The load state is shared by everyone inspecting the same stage, the change
+    waits for every request reading a cached stage and holds new ones back until it is done.
+    """
+    if not os.path.exists(filepath):
+        return {"error": f"File does not exist: {filepath}"}
+    if not HAS_USD:
+        return {"error": "USD bindings are not available on the server."}
+
+    try:
+        # Payload layers joining or leaving the stage are picked up by the cache when the block exits
+        with stage_cache.writing(filepath, load) as stage:
+            if not stage:
+                return {"error": "Failed to open USD Stage."}
+            prim = stage.GetPrimAtPath(prim_path)
+            if not prim:
+                return {"error": f"No prim at {prim_path}"}
+
+            if loaded:
+                stage.Load(prim.GetPath())
+            else:
+                stage.Unload(prim.GetPath())
+            return _lazy_summary(stage.GetPrimAtPath(prim_path), _xform_cache(stage))
+    except Exception as e:
+        return {"error": f"USD payload {'load' if loaded else 'unload'} error: {str(e)}"}
+
+def read_mesh_buffers(filepath: str, prim_path: str, load: str = INSPECT_LOAD_POLICY,
+                      max_triangles: int = None, stage_triangles: int = None) -> dict:
+    """
+    Reads a Mesh prim's points and triangulated face indices as little-endian float32 (N, 3)
+    and uint32 arrays. Values are taken straight from the Vt arrays through the buffer protocol,
+    without creating a Python object per element.
+
+    With max_triangles (per prim) or stage_triangles (shared by every loaded mesh of the stage
+    in proportion to their size) a decimated preview LOD is returned instead, cached on disk
+    next to the USD file.
+    """
+    if not os.path.exists(filepath):
+        return {"error": f"File does not exist: {filepath}"}
+    if not HAS_USD:
+        return {"error": "USD bindings are not available on the server."}
+
+    try:
+        with _open_stage(filepath, load) as stage:
+            if not stage:
+                return {"error": "Failed to open USD Stage."}
+            prim = stage.GetPrimAtPath(prim_path)
+            if not prim or prim.GetTypeName() != "Mesh":
+                return {"error": f"No Mesh prim at {prim_path}"}
+
+            mesh = UsdGeom.Mesh(prim)
+            counts_attr = mesh.GetFaceVertexCountsAttr().Get()
+            indices_attr = mesh.GetFaceVertexIndicesAttr().Get()
+            if indices_attr:
+                source_triangles = _triangulated_index_count(counts_attr, indices_attr, 0) // 3
+            else:
+                points_attr = mesh.GetPointsAttr().Get()
+                source_triangles = len(points_attr) // 3 if points_attr else 0
+
+            stage_total = None
+            if stage_triangles:
+                stage_total = stage_cache.derived(filepath, load, "triangleCount", _stage_triangle_count)
+            budget = lod_budget(source_triangles, max_triangles, stage_triangles, stage_total)
+
+            if budget is None:
+                buffers = _mesh_buffers(mesh, counts_attr, indices_attr)
+                if buffers is None:
+                    return {"error": f"Mesh {prim_path} has no points"}
+                points, indices = buffers
+            else:
+                def build():
+                    buffers = _mesh_buffers(mesh, counts_attr, indices_attr)
+                    if buffers is None:
+                        raise ValueError(f"Mesh {prim_path} has no points")
+                    return decimate_mesh(*buffers, budget)
+                points, indices = load_or_build_lod(filepath, prim_path, budget, stage_cache.signature(filepath, load), build)
+
+            return {"points": points, "indices": indices, "sourceTriangles": source_triangles, "lodBudget": budget}
+    except Exception as e:
+        return {"error": f"USD geometry read error: {str(e)}"}
+
+def _mesh_buffers(mesh, counts_attr, indices_attr):
+    """Full resolution (points, triangle indices) of a mesh, None when it has no points."""
+    points_attr = mesh.GetPointsAttr().Get()
+    if not points_attr:
+        return None
+    points = np.asarray(points_attr).astype("<f4", copy=False).reshape(-1, 3)
+
+    if indices_attr and counts_attr:
+        indices = _triangulate_faces(counts_attr, indices_attr)
+    elif indices_attr:
+        indices = np.asarray(indices_attr).astype("<u4")
+    else:
+        indices = np.arange(len(points), dtype="<u4")
+
+    # Three.js expects counter-clockwise triangles, flip winding for leftHanded meshes
+    if mesh.GetOrientationAttr().Get() == "leftHanded":
+        triangles = indices[:len(indices) - len(indices) % 3].reshape(-1, 3)
+        triangles[:, [1, 2]] = triangles[:, [2, 1]]
+    return points, indices
+
+def _stage_triangle_count(stage) -> int:
+    """Triangles of every loaded Mesh on the stage once fan triangulated."""
+    total = 0
+    for prim in stage.Traverse():
+        if prim.GetTypeName() == "Mesh":
+            mesh = UsdGeom.Mesh(prim)
+            total += _triangulated_index_count(mesh.GetFaceVertexCountsAttr().Get(), mesh.GetFaceVertexIndicesAttr().Get(), 0) // 3
+    return total
+
+def _triangulate_faces(counts, indices):
+    """
+    Fan triangulates USD polygon faces into a flat uint32 index array in one vectorized pass.
+    Poly face [v0, v1, v2, ..., v_n] -> Triangles: [v0, v1, v2], [v0, v2, v3]...
+    Faces with fewer than three vertices emit nothing, and faces running past the end of
+    the index array are dropped.
+    """
+    counts = np.maximum(np.asarray(counts, dtype=np.int64), 0)
+    indices = np.asarray(indices).astype("<u4", copy=False)
+
+    # First vertex of every face, and how many triangles each face fans into
+    face_starts = np.cumsum(counts) - counts
+    tri_counts = np.maximum(counts - 2, 0)
+    complete = face_starts + counts <= len(indices)
+    tri_counts[~complete] = 0
+
+    # Per triangle: the face it belongs to and its position k within that face's fan
+    tri_face_starts = np.repeat(face_starts, tri_counts)
+    tri_offsets = np.arange(len(tri_face_starts)) - np.repeat(np.cumsum(tri_counts) - tri_counts, tri_counts)
+
+    triangles = np.empty((len(tri_face_starts), 3), dtype="<u4")
+    triangles[:, 0] = indices[tri_face_starts]
+    triangles[:, 1] = indices[tri_face_starts + tri_offsets + 1]
+    triangles[:, 2] = indices[tri_face_starts + tri_offsets + 2]
+    return triangles.reshape(-1)
+
+def _triangulated_index_count(counts, indices, point_count: int) -> int:
+    """Number of indices read_mesh_buffers will return for a mesh, without triangulating it."""
+    if indices and counts:
+        counts = np.maximum(np.asarray(counts, dtype=np.int64), 0)
+        complete = np.cumsum(counts) <= len(indices)
+        return int(np.maximum(counts - 2, 0)[complete].sum()) * 3
+    if indices:
+        return len(indices)
+    return point_count
+
+# --- Publish Validation ---
+
+def compute_usd_stats(filepath: str) -> dict:
+    """
+    Opens a published USD fully loaded and measures it: prim, mesh, point and face totals, used
+    layers, payload arcs, file size and open time. Meant for validation worker processes, so the
+    stage is opened outside the shared stage cache and released on return.
+    """
+    if not os.path.exists(filepath):
+        return {"error": f"File does not exist: {filepath}"}
+    if not HAS_USD:
+        return {"error": "USD bindings are not available"}
+
+    try:
+        start = time.perf_counter()
+        stage = Usd.Stage.Open(filepath, Usd.Stage.LoadAll)
+        open_seconds = time.perf_counter() - start
+        if not stage:
+            return {"error": "Failed to open USD Stage."}
+
+        stats = {"primCount": 0, "meshCount": 0, "pointCount": 0, "faceCount": 0, "payloadCount": 0}
+        for prim in stage.Traverse():
+            stats["primCount"] += 1
+            if prim.HasAuthoredPayloads():
+                stats["payloadCount"] += 1
+            if prim.GetTypeName() == "Mesh":
+                mesh = UsdGeom.Mesh(prim)
+                points = mesh.GetPointsAttr().Get()
+                counts = mesh.GetFaceVertexCountsAttr().Get()
+                stats["meshCount"] += 1
+                stats["pointCount"] += len(points) if points else 0
+                stats["faceCount"] += len(counts) if counts else 0
+
+        stats["layerCount"] = len(stage.GetUsedLayers())
+        stats["fileSize"] = os.path.getsize(filepath)
+        stats["openSeconds"] = round(open_seconds, 4)
+        # Validation runs leave every published file with a current summary sidecar
+        get_usd_summary(filepath, stage)
+        return stats
+    except Exception as e:
+        return {"error": f"Failed to validate USD Stage: {str(e)}"}
+
+# --- Stage Summaries ---
+
+def _stage_summary(stage) -> dict:
+    """Compact facts about a fully loaded stage, persisted next to the file by usd_summary."""
+    prim_count = 0
+    geometry = Counter()
+    for prim in stage.Traverse():
+        prim_count += 1
+        if prim.IsA(UsdGeom.Gprim):
+            geometry[prim.GetTypeName()] += 1
+
+    bbox_cache = UsdGeom.BBoxCache(stage.GetStartTimeCode(), [UsdGeom.Tokens.default_, UsdGeom.Tokens.render], useExtentsHint=True)
+    bounds = bbox_cache.ComputeWorldBound(stage.GetPseudoRoot()).ComputeAlignedRange()
+    default_prim = stage.GetDefaultPrim()
+    return {
+        "primCount": prim_count,
+        "bbox": None if bounds.IsEmpty() else {"min": list(bounds.GetMin()), "max": list(bounds.GetMax())},
+        # Lowercase type name of the most common Gprim type, the shape the thumbnailer draws
+        "dominantGeometry": geometry.most_common(1)[0][0].lower() if geometry else None,
+        "defaultPrim": str(default_prim.GetPath()) if default_prim else None,
+        "upAxis": str(UsdGeom.GetStageUpAxis(stage)),
+        "startTimeCode": stage.GetStartTimeCode(),
+        "endTimeCode": stage.GetEndTimeCode(),
+        "framesPerSecond": stage.GetFramesPerSecond()
+    }
+
+def get_usd_summary(filepath: str, stage=None) -> dict:
+    """
+    Returns the summary of a USD file (prim count, bounding box, dominant geometry type, default prim,
+    time range) from its sidecar. The stage is only opened when no sidecar matches the layers it
+    is composed from, fully loaded and outside the stage cache. Callers already holding a fully
+    loaded stage pass it in. Thumbnail and tree code only ever read sidecars, see usd_summary.
+    """
+    if not os.path.exists(filepath):
+        return {"error": f"File does not exist: {filepath}"}
+    if not HAS_USD:
+        return {"error": "USD bindings are not available"}
+
+    def build():
+        try:
+            opened = stage if stage is not None else Usd.Stage.Open(filepath, Usd.Stage.LoadAll)
+            if not opened:
+                return {"error": "Failed to open USD Stage."}, None
+            # The summary is current as long as none of the layers it was composed from change
+            layers = [layer.realPath for layer in opened.GetUsedLayers() if layer.realPath]
+            return _stage_summary(opened), layers
+        except Exception as e:
+            return {"error": f"Failed to summarize USD Stage: {str(e)}"}, None
+
+    return load_or_build_summary(filepath, build)
+
 def create_empty_usd(filepath: str) -> dict:
     """Creates a simple base USD stage with a root Xform."""
     if not HAS_USD:
@@ -327,3 +724,25 @@ def get_mock_usd_stage(filepath: str) -> dict:
             ]
         }
     }
+
+def _lazy_mock_node(node: dict, offset: int = None, limit: int = None) -> dict:
+    """Mock prim summary in the lazy hierarchy shape, optionally with a first page of children."""
+    children = node.get("children", [])
+    summary = {key: node[key] for key in ("name", "path", "type", "specifier", "active")}
+    summary["hasPayload"] = False
+    summary["loaded"] = True
+    summary["geomData"] = node.get("geomData", {})
+    summary["childCount"] = len(children)
+    if offset is not None:
+        offset, limit = _clamp_page(offset, limit)
+        summary["children"] = [_lazy_mock_node(child) for child in children[offset:offset + limit]]
+    return summary
+
+def _find_mock_prim(filepath: str, prim_path: str):
+    node = get_mock_usd_stage(filepath)["hierarchy"]
+    while node["path"] != prim_path:
+        node = next((child for child in node.get("children", [])
+                     if prim_path == child["path"] or prim_path.startswith(child["path"] + "/")), None)
+        if node is None:
+            return None
+    return node
@@ -0,0 +1,141 @@
+import os
+import re
+import threading
+
+# Version tokens in work file names: scene_v012.blend, shot.v3.hip, comp-V004.nk
+VERSION_RE = re.compile(r"[._-]?v(\d+)", re.IGNORECASE)
+
+# Version used when a task has no versioned work file yet
+FIRST_VERSION = 1
+
+
+def parse_version(file_name: str):
+    """Returns (extension, version) for a versioned file name, None when it carries no version."""
+    match = VERSION_RE.search(file_name)
+    if match is None:
+        return None
+    return os.path.splitext(file_name)[-1].lstrip("."), int(match.group(1))
+
+
+class _AppFolder:
+    __slots__ = ("mtime", "parsed", "versions")
+
+    def __init__(self):
+        self.mtime = None
+        self.parsed = {}    # file name -> (extension, version), versioned names only
+        self.versions = {}  # extension -> highest version
+
+
+class TaskVersionIndex:
+    """Highest work file version per application folder and extension of every known task.
+
+    Each wip/<app> folder is indexed against its mtime. When a folder changes only the names that
+    appeared or disappeared are parsed, and answering a query costs a stat per application folder
+    plus dictionary lookups, however many autosaves a task piled up. The project index feeds the
+    listings it reads anyway, so tasks visible in the tree are usually indexed already.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._folders = {}  # wip/<app> folder path -> _AppFolder
+        self._wip = {}      # wip folder path -> (mtime_ns, [app folder names])
+
+    def record(self, folder: str, mtime_ns: int, names):
+        """Brings the index of one wip/<app> folder up to date with a listing of its entry names."""
+        with self._lock:
+            entry = self._folders.get(folder)
+            if entry is None:
+                entry = self._folders[folder] = _AppFolder()
+            if entry.mtime == mtime_ns:
+                return
+            entry.mtime = mtime_ns
+
+            names = set(names)
+            stale = set()
+            for name in [name for name in entry.parsed if name not in names]:
+                ext, version = entry.parsed.pop(name)
+                if entry.versions.get(ext) == version:
+                    stale.add(ext)
+            for name in names:
+                if name not in entry.parsed:
+                    parsed = parse_version(name)
+                    if parsed is not None:
+                        entry.parsed[name] = parsed
+                        ext, version = parsed
+                        if version > entry.versions.get(ext, 0):
+                            entry.versions[ext] = version
+
+            # Only deleting the highest version of an extension needs a rescan of the parsed names
+            for ext in stale:
+                remaining = [version for e, version in entry.parsed.values() if e == ext]
+                if remaining:
+                    entry.versions[ext] = max(remaining)
+                else:
+                    entry.versions.pop(ext, None)
+
+    def latest_versions(self, task_path: str) -> dict:
+        """Returns {app folder: {extension: highest version}} for the wip files of a task."""
+        wip_dir = os.path.join(task_path, "wip")
+        result = {}
+        for app in self._app_folders(wip_dir):
+            folder = os.path.join(wip_dir, app)
+            versions = self._folder_versions(folder)
+            if versions:
+                result[app] = versions
+        return result
+
+    def latest_version(self, task_path: str) -> int:
+        """Highest version across every application and extension of a task, FIRST_VERSION if none."""
+        versions = [version for per_app in self.latest_versions(task_path).values() for version in per_app.values()]
+        return max([FIRST_VERSION, *versions])
+
+    def _app_folders(self, wip_dir: str) -> list:
+        try:
+            mtime = os.stat(wip_dir).st_mtime_ns
+        except OSError:
+            return []
+        with self._lock:
+            cached = self._wip.get(wip_dir)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+        apps = []
+        try:
+            with os.scandir(wip_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            apps.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return []
+        apps.sort()
+        with self._lock:
+            self._wip[wip_dir] = (mtime, apps)
+        return apps
+
+    def _folder_versions(self, folder: str) -> dict:
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._folders.pop(folder, None)
+            return {}
+
+        with self._lock:
+            entry = self._folders.get(folder)
+            if entry is not None and entry.mtime == mtime:
+                return dict(entry.versions)
+
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return {}
+        self.record(folder, mtime, names)
+        with self._lock:
+            entry = self._folders.get(folder)
+            return dict(entry.versions) if entry is not None else {}
+
+
+task_versions = TaskVersionIndex()
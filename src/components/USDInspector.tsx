@@ -17,20 +17,89 @@ interface PrimNode {
   type: string;
   specifier: string;
   active: boolean;
+  hasPayload?: boolean;
+  loaded?: boolean; // False for payload prims left unloaded, they are shown as placeholders
+  geomData?: any;
+  childCount: number;
+  children?: PrimNode[]; // Pages loaded so far, undefined until the prim is first expanded
+}
+
+interface PrimDetails {
+  path: string;
   variantSets: Record<string, { selected: string; options: string[] }>;
   references: Array<{ assetPath: string; primPath: string; type: string }>;
   attributes: Array<{ name: string; type: string; value: any; variability: string }>;
-  children: PrimNode[];
 }
 
+// Per-file facts read from the summary sidecar next to the USD, without composing the stage
+interface UsdSummary {
+  primCount: number;
+  bbox: { min: number[]; max: number[] } | null;
+  dominantGeometry: string | null;
+  defaultPrim: string | null;
+  upAxis: string;
+  startTimeCode: number;
+  endTimeCode: number;
+  framesPerSecond: number;
+}
+
+// Children fetched per request when expanding a prim or clicking "load more"
+const CHILDREN_PAGE_SIZE = 200;
+
+// Returns a copy of the tree with the node at path replaced, only cloning the nodes along the way
+const replaceNode = (node: PrimNode, path: string, update: (target: PrimNode) => PrimNode): PrimNode => {
+  if (node.path === path) return update(node);
+  if (!node.children) return node;
+  const prefix = node.path === '/' ? '/' : `${node.path}/`;
+  if (!path.startsWith(prefix)) return node;
+  return { ...node, children: node.children.map(child => replaceNode(child, path, update)) };
+};
+
 declare const THREE: any;
 
+interface MeshBuffers {
+  positions: Float32Array;
+  indices: Uint32Array;
+}
+
+// Preview triangle budgets, the server sends decimated LODs of meshes above them
+const PREVIEW_PRIM_TRIANGLES = 200000;
+const PREVIEW_STAGE_TRIANGLES = 1000000;
+
+// Mesh buffers of the inspected file, keyed by prim path. Kept across viewer rebuilds
+// (selection changes) and cleared whenever the inspector (re)loads a stage.
+const meshBufferCache = new Map<string, Promise<MeshBuffers>>();
+
+// Fetches a mesh's raw preview geometry: little-endian float32 xyz points followed by uint32 triangle indices
+const fetchMeshBuffers = (filePath: string, primPath: string): Promise<MeshBuffers> => {
+  let pending = meshBufferCache.get(primPath);
+  if (!pending) {
+    pending = fetch(`/api/usd/geometry?path=${encodeURIComponent(filePath)}&primPath=${encodeURIComponent(primPath)}&maxTriangles=${PREVIEW_PRIM_TRIANGLES}&stageTriangles=${PREVIEW_STAGE_TRIANGLES}`)
+      .then(async (response) => {
+        if (!response.ok) {
+          const err = await response.json();
+          throw new Error(err.detail || 'Failed to load mesh geometry');
+        }
+        const pointCount = parseInt(response.headers.get('X-Point-Count') || '0', 10);
+        const buffer = await response.arrayBuffer();
+        return {
+          positions: new Float32Array(buffer, 0, pointCount * 3),
+          indices: new Uint32Array(buffer, pointCount * 12)
+        };
+      });
+    pending.catch(() => meshBufferCache.delete(primPath));
+    meshBufferCache.set(primPath, pending);
+  }
+  return pending;
+};
+
 interface USD3DViewerProps {
+  filePath: string;
   hierarchy: PrimNode;
   selectedPath: string;
 }
 
-function USD3DViewer({ hierarchy, selectedPath }: USD3DViewerProps) {
+function USD3DViewer({ filePath, hierarchy, selectedPath }: USD3DViewerProps) {
   const mountRef = React.useRef<HTMLDivElement>(null);
 
   useEffect(() => {
@@ -83,6 +152,41 @@ function USD3DViewer({ hierarchy, selectedPath }: USD3DViewerProps) {
     const meshesGroup = new THREE.Group();
     scene.add(meshesGroup);
 
+    // Set on cleanup so geometry arriving after a rebuild is dropped
+    let disposed = false;
+
+    const addMesh = (geometry: any, geomData: any, isSelected: boolean) => {
+      // Shaded Material - Solid Clay White (Artist MatCap Style)
+      const material = new THREE.MeshStandardMaterial({ 
+        color: isSelected ? 0x00f0ff : 0xf3f4f6, // Solid neon cyan if selected, sleek premium clay white if unselected
+        roughness: 0.35, 
+        metalness: 0.05,
+        transparent: false,
+        side: THREE.DoubleSide // Ensure high-fidelity double-sided rendering for shell planes
+      });
+
+      const mesh = new THREE.Mesh(geometry, material);
+
+      // Wireframe Overlay
+      const wireGeo = new THREE.WireframeGeometry(geometry);
+      const wireMat = new THREE.MeshBasicMaterial({ 
+        color: isSelected ? 0xffffff : 0x0f172a, 
+        transparent: true, 
+        opacity: isSelected ? 0.6 : 0.25 
+      });
+      const wireframe = new THREE.LineSegments(wireGeo, wireMat);
+      mesh.add(wireframe);
+
+      // Apply World Transform matrix
+      if (geomData.transform) {
+        const matrix = new THREE.Matrix4();
+        matrix.fromArray(geomData.transform);
+        mesh.applyMatrix4(matrix);
+      }
+
+      meshesGroup.add(mesh);
+    };
+
     // Recursively add meshes to the group
     const addGeometryNode = (node: any) => {
       if (node.geomData && node.geomData.shape) {
@@ -100,64 +204,22 @@ function USD3DViewer({ hierarchy, selectedPath }: USD3DViewerProps) {
           geometry = new THREE.CylinderGeometry(geomData.radius, geomData.radius, geomData.height, 32);
         } else if (geomData.shape === 'cone') {
           geometry = new THREE.ConeGeometry(geomData.radius, geomData.height, 32);
-        } else if (geomData.shape === 'mesh' && geomData.points) {
-          geometry = new THREE.BufferGeometry();
-          const vertices = new Float32Array(geomData.points.flat());
-          geometry.setAttribute('position', new THREE.BufferAttribute(vertices, 3));
-          if (geomData.indices) {
-            // USD face orientation is rightHanded (CCW) by default, matching Three.js's winding order.
-            // We only swap index 1 and index 2 of every triangle to invert the winding order if orientation is leftHanded (CW).
-            // This corrects the normal computation and guarantees faces shade properly in WebGL.
-            const finalIndices = [];
-            const needSwap = geomData.orientation === 'leftHanded';
-            for (let i = 0; i < geomData.indices.length; i += 3) {
-              if (i + 2 < geomData.indices.length) {
-                if (needSwap) {
-                  finalIndices.push(geomData.indices[i]);
-                  finalIndices.push(geomData.indices[i + 2]);
-                  finalIndices.push(geomData.indices[i + 1]);
-                } else {
-                  finalIndices.push(geomData.indices[i]);
-                  finalIndices.push(geomData.indices[i + 1]);
-                  finalIndices.push(geomData.indices[i + 2]);
-                }
-              }
-            }
-            geometry.setIndex(finalIndices);
-          }
-          geometry.computeVertexNormals();
+        } else if (geomData.shape === 'mesh' && geomData.pointCount) {
+          // Winding is already flipped server side for leftHanded meshes, buffers go straight to the GPU
+          fetchMeshBuffers(filePath, node.path)
+            .then(({ positions, indices }) => {
+              if (disposed) return;
+              const meshGeometry = new THREE.BufferGeometry();
+              meshGeometry.setAttribute('position', new THREE.BufferAttribute(positions, 3));
+              meshGeometry.setIndex(new THREE.BufferAttribute(indices, 1));
+              meshGeometry.computeVertexNormals();
+              addMesh(meshGeometry, geomData, isSelected);
+            })
+            .catch((err) => console.error(`Failed to load geometry for ${node.path}:`, err));
         }
 
         if (geometry) {
-          // Shaded Material - Solid Clay White (Artist MatCap Style)
-          const material = new THREE.MeshStandardMaterial({ 
-            color: isSelected ? 0x00f0ff : 0xf3f4f6, // Solid neon cyan if selected, sleek premium clay white if unselected
-            roughness: 0.35, 
-            metalness: 0.05,
-            transparent: false,
-            side: THREE.DoubleSide // Ensure high-fidelity double-sided rendering for shell planes
-          });
-
-          const mesh = new THREE.Mesh(geometry, material);
-
-          // Wireframe Overlay
-          const wireGeo = new THREE.WireframeGeometry(geometry);
-          const wireMat = new THREE.MeshBasicMaterial({ 
-            color: isSelected ? 0xffffff : 0x0f172a, 
-            transparent: true, 
-            opacity: isSelected ? 0.6 : 0.25 
-          });
-          const wireframe = new THREE.LineSegments(wireGeo, wireMat);
-          mesh.add(wireframe);
-
-          // Apply World Transform matrix
-          if (geomData.transform) {
-            const matrix = new THREE.Matrix4();
-            matrix.fromArray(geomData.transform);
-            mesh.applyMatrix4(matrix);
-          }
-
-          meshesGroup.add(mesh);
+          addMesh(geometry, geomData, isSelected);
         }
       }
 
@@ -190,6 +252,7 @@ function USD3DViewer({ hierarchy, selectedPath }: USD3DViewerProps) {
 
     // Clean up
     return () => {
+      disposed = true;
       cancelAnimationFrame(animationFrameId);
       window.removeEventListener('resize', handleResize);
       controls.dispose();
@@ -211,7 +274,7 @@ function USD3DViewer({ hierarchy, selectedPath }: USD3DViewerProps) {
       }
       renderer.dispose();
     };
-  }, [hierarchy, selectedPath]);
+  }, [filePath, hierarchy, selectedPath]);
 
   return <div ref={mountRef} style={{ width: '100%', height: '100%' }} />;
 }
@@ -237,25 +300,72 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
     hierarchy: PrimNode;
   } | null>(null);
 
+  const [summary, setSummary] = useState<UsdSummary | null>(null);
   const [selectedPrim, setSelectedPrim] = useState<PrimNode | null>(null);
+  const [primDetails, setPrimDetails] = useState<PrimDetails | null>(null);
   const [searchQuery, setSearchQuery] = useState('');
   const [expandedNodes, setExpandedNodes] = useState<Record<string, boolean>>({ '/': true });
+  const [loadingChildren, setLoadingChildren] = useState<Record<string, boolean>>({});
+  const [payloadBusy, setPayloadBusy] = useState(false);
 
   useEffect(() => {
     fetchUsdData();
   }, [filePath]);
 
+  // The stage info bar is filled from the summary sidecar, usually long before the stage is open
+  useEffect(() => {
+    setSummary(null);
+    let cancelled = false;
+    fetch(`/api/usd/summary?path=${encodeURIComponent(filePath)}`)
+      .then((response) => (response.ok ? response.json() : null))
+      .then((data: UsdSummary | null) => {
+        if (!cancelled) setSummary(data);
+      })
+      .catch((err) => console.error(`Failed to load summary for ${filePath}:`, err));
+    return () => {
+      cancelled = true;
+    };
+  }, [filePath]);
+
+  // Attributes, variants and composition arcs are only fetched for the selected prim
+  useEffect(() => {
+    setPrimDetails(null);
+    if (!selectedPrim) return;
+
+    let cancelled = false;
+    fetch(`/api/usd/prim?path=${encodeURIComponent(filePath)}&primPath=${encodeURIComponent(selectedPrim.path)}`)
+      .then(async (response) => {
+        if (!response.ok) {
+          const err = await response.json();
+          throw new Error(err.detail || 'Failed to load prim details');
+        }
+        return response.json();
+      })
+      .then((details: PrimDetails) => {
+        if (!cancelled) setPrimDetails(details);
+      })
+      .catch((err) => {
+        if (!cancelled) console.error(`Failed to load details for ${selectedPrim.path}:`, err);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [filePath, selectedPrim?.path]);
+
   const fetchUsdData = async () => {
     setLoading(true);
     setError(null);
+    meshBufferCache.clear();
     try {
-      const response = await fetch(`/api/usd/inspect?path=${encodeURIComponent(filePath)}`);
+      const response = await fetch(`/api/usd/stage?path=${encodeURIComponent(filePath)}&limit=${CHILDREN_PAGE_SIZE}`);
       if (!response.ok) {
         const err = await response.json();
         throw new Error(err.detail || 'Failed to inspect USD file');
       }
       const data = await response.json();
       setUsdData(data);
+      setExpandedNodes({ '/': true });
+      setLoadingChildren({});
       // Select the first root child by default if available
       if (data.hierarchy && data.hierarchy.children && data.hierarchy.children.length > 0) {
         setSelectedPrim(data.hierarchy.children[0]);
@@ -312,27 +422,92 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
     return <Folder size={14} style={{ color: 'var(--text-muted)' }} />;
   };
 
-  const toggleExpand = (path: string, e: React.MouseEvent) => {
+  // Fetches the next page of a prim's children from the stage kept open on the server
+  const loadChildren = async (node: PrimNode) => {
+    if (loadingChildren[node.path]) return;
+    const offset = node.children ? node.children.length : 0;
+    setLoadingChildren(prev => ({ ...prev, [node.path]: true }));
+    try {
+      const response = await fetch(`/api/usd/children?path=${encodeURIComponent(filePath)}&primPath=${encodeURIComponent(node.path)}&offset=${offset}&limit=${CHILDREN_PAGE_SIZE}`);
+      if (!response.ok) {
+        const err = await response.json();
+        throw new Error(err.detail || 'Failed to load prim children');
+      }
+      const page = await response.json();
+      setUsdData(prev => prev && {
+        ...prev,
+        hierarchy: replaceNode(prev.hierarchy, node.path, target => ({
+          ...target,
+          childCount: page.total,
+          children: [...(target.children || []), ...page.children]
+        }))
+      });
+    } catch (err: any) {
+      console.error(`Failed to load children of ${node.path}:`, err);
+    } finally {
+      setLoadingChildren(prev => {
+        const next = { ...prev };
+        delete next[node.path];
+        return next;
+      });
+    }
+  };
+
+  // Loads or unloads a payload on the server-side stage, then refetches whatever is expanded below it
+  const togglePayload = async (node: PrimNode) => {
+    setPayloadBusy(true);
+    try {
+      const response = await fetch('/api/usd/payload', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ path: filePath, primPath: node.path, loaded: !node.loaded })
+      });
+      if (!response.ok) {
+        const err = await response.json();
+        throw new Error(err.detail || 'Payload request failed');
+      }
+      const summary: PrimNode = await response.json();
+      // Composition below the prim changed, drop its loaded pages
+      setUsdData(prev => prev && {
+        ...prev,
+        hierarchy: replaceNode(prev.hierarchy, node.path, () => ({ ...summary, children: undefined }))
+      });
+      setSelectedPrim(prev => (prev && prev.path === node.path ? summary : prev));
+      if (expandedNodes[node.path] && summary.childCount > 0) {
+        loadChildren(summary);
+      }
+    } catch (err: any) {
+      alert(`Failed to ${node.loaded ? 'unload' : 'load'} payload: ${err.message}`);
+    } finally {
+      setPayloadBusy(false);
+    }
+  };
+
+  const toggleExpand = (node: PrimNode, e: React.MouseEvent) => {
     e.stopPropagation();
+    if (!expandedNodes[node.path] && node.childCount > 0 && !node.children) {
+      loadChildren(node);
+    }
     setExpandedNodes(prev => ({
       ...prev,
-      [path]: !prev[path]
+      [node.path]: !prev[node.path]
     }));
   };
 
-  // Filters the tree based on search query
+  // Filters the loaded part of the tree based on search query
   const matchesSearch = (node: PrimNode): boolean => {
     if (node.name.toLowerCase().includes(searchQuery.toLowerCase()) || 
         node.type.toLowerCase().includes(searchQuery.toLowerCase())) {
       return true;
     }
-    return node.children.some(child => matchesSearch(child));
+    return (node.children || []).some(child => matchesSearch(child));
   };
 
   const renderPrimTree = (node: PrimNode, depth = 0) => {
     const isExpanded = !!expandedNodes[node.path];
     const isSelected = selectedPrim?.path === node.path;
-    const hasChildren = node.children && node.children.length > 0;
+    const hasChildren = node.childCount > 0;
+    const loadedChildren = node.children || [];
     
     if (searchQuery && !matchesSearch(node)) {
       return null;
@@ -350,7 +525,7 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
         >
           {hasChildren && (
             <span 
-              onClick={(e) => toggleExpand(node.path, e)} 
+              onClick={(e) => toggleExpand(node, e)} 
               style={{ 
                 cursor: 'pointer', 
                 fontSize: '10px', 
@@ -366,6 +541,9 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
           {!hasChildren && <span style={{ width: '12px' }} />}
           {getPrimIcon(node.type)}
           <span style={{ fontWeight: isSelected ? '600' : '400' }}>{node.name}</span>
+          {node.hasPayload && !node.loaded && (
+            <span style={{ fontSize: '9px', color: 'hsl(260, 95%, 70%)', fontStyle: 'italic' }}>unloaded</span>
+          )}
           <span style={{ fontSize: '9px', color: 'var(--text-muted)', marginLeft: 'auto' }}>
             {node.type}
           </span>
@@ -373,7 +551,17 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
         
         {hasChildren && (isExpanded || searchQuery) && (
           <div style={{ borderLeft: '1px solid var(--border)', marginLeft: '8px' }}>
-            {node.children.map(child => renderPrimTree(child, depth + 1))}
+            {loadedChildren.map(child => renderPrimTree(child, depth + 1))}
+            {loadingChildren[node.path] ? (
+              <div style={{ padding: '4px 8px', fontSize: '11px', color: 'var(--text-muted)' }}>Loading prims...</div>
+            ) : loadedChildren.length < node.childCount && !searchQuery && (
+              <div
+                onClick={() => loadChildren(node)}
+                style={{ padding: '4px 8px', fontSize: '11px', color: 'var(--color-usd)', cursor: 'pointer' }}
+              >
+                Load more ({node.childCount - loadedChildren.length} remaining)
+              </div>
+            )}
           </div>
         )}
       </div>
@@ -459,7 +647,7 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
                 <Search size={14} style={{ color: 'var(--text-muted)', marginRight: '6px' }} />
                 <input 
                   type="text" 
-                  placeholder="Filter prims..." 
+                  placeholder="Filter loaded prims..." 
                   value={searchQuery}
                   onChange={(e) => setSearchQuery(e.target.value)}
                   style={{ background: 'transparent', border: 'none', color: '#fff', fontSize: '12px', outline: 'none', width: '100%' }}
@@ -469,9 +657,20 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
 
             {/* Stage Info */}
             <div style={{ padding: '8px 12px', fontSize: '11px', background: 'var(--bg-card)', borderBottom: '1px solid var(--border)', color: 'var(--text-secondary)', display: 'flex', gap: '12px' }}>
-              <span>Up Axis: <strong style={{ color: '#fff' }}>{usdData.metadata.upAxis}</strong></span>
-              <span>Frames: <strong style={{ color: '#fff' }}>{usdData.metadata.startTimeCode} - {usdData.metadata.endTimeCode}</strong></span>
-              <span>FPS: <strong style={{ color: '#fff' }}>{usdData.metadata.framesPerSecond}</strong></span>
+              <span>Up Axis: <strong style={{ color: '#fff' }}>{(summary ?? usdData.metadata).upAxis}</strong></span>
+              <span>Frames: <strong style={{ color: '#fff' }}>{(summary ?? usdData.metadata).startTimeCode} - {(summary ?? usdData.metadata).endTimeCode}</strong></span>
+              <span>FPS: <strong style={{ color: '#fff' }}>{(summary ?? usdData.metadata).framesPerSecond}</strong></span>
+              {summary && (
+                <>
+                  <span>Prims: <strong style={{ color: '#fff' }}>{summary.primCount}</strong></span>
+                  {summary.defaultPrim && <span>Default: <strong style={{ color: '#fff' }}>{summary.defaultPrim}</strong></span>}
+                  {summary.bbox && (
+                    <span>Size: <strong style={{ color: '#fff' }}>
+                      {summary.bbox.max.map((v, i) => (v - summary.bbox!.min[i]).toFixed(2)).join(' x ')}
+                    </strong></span>
+                  )}
+                </>
+              )}
             </div>
 
             {/* Hierarchy Tree */}
@@ -491,7 +690,7 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
                     <span style={{ fontSize: '10px', color: 'var(--text-muted)' }}>Drag to orbit | Right-drag to pan | Scroll to zoom</span>
                   </div>
                   <div style={{ height: '280px', border: '1px solid var(--border)', borderRadius: '8px', overflow: 'hidden', background: '#0a0b10', position: 'relative' }}>
-                    <USD3DViewer hierarchy={usdData.hierarchy} selectedPath={selectedPrim?.path || ''} />
+                    <USD3DViewer filePath={filePath} hierarchy={usdData.hierarchy} selectedPath={selectedPrim?.path || ''} />
                   </div>
                 </div>
 
@@ -515,6 +714,23 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
                     </h3>
                   </div>
                   <div style={{ display: 'flex', gap: '8px' }}>
+                    {selectedPrim.hasPayload && (
+                      <button
+                        className="btn"
+                        onClick={() => togglePayload(selectedPrim)}
+                        disabled={payloadBusy}
+                        style={{
+                          padding: '4px 10px',
+                          fontSize: '11px',
+                          background: 'rgba(167, 139, 250, 0.15)',
+                          border: '1px solid rgba(167, 139, 250, 0.4)',
+                          color: 'hsl(260, 95%, 70%)'
+                        }}
+                        title={selectedPrim.loaded ? 'Unload this payload on the server stage' : 'Compose this payload into the server stage'}
+                      >
+                        {payloadBusy ? 'Working...' : selectedPrim.loaded ? 'Unload Payload' : 'Load Payload'}
+                      </button>
+                    )}
                     <span style={{ 
                       fontSize: '11px', 
                       background: selectedPrim.active ? 'rgba(74, 222, 128, 0.1)' : 'rgba(239, 68, 68, 0.1)', 
@@ -529,13 +745,13 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
                 </div>
 
                 {/* Composition Arcs */}
-                {selectedPrim.references.length > 0 && (
+                {primDetails && primDetails.references.length > 0 && (
                   <div className="panel" style={{ background: 'var(--bg-card)' }}>
                     <div className="panel-header" style={{ height: '36px', padding: '0 12px' }}>
                       <span style={{ fontSize: '11px', fontWeight: 600, color: 'var(--text-secondary)', textTransform: 'uppercase', letterSpacing: '0.04em' }}>Composition Layers (References & Payloads)</span>
                     </div>
                     <div style={{ padding: '12px', display: 'flex', flexDirection: 'column', gap: '8px' }}>
-                      {selectedPrim.references.map((ref, idx) => (
+                      {primDetails.references.map((ref, idx) => (
                         <div key={idx} style={{ display: 'flex', alignItems: 'center', gap: '8px', fontSize: '12px', fontFamily: 'var(--font-mono)', background: 'var(--bg-panel)', padding: '6px 10px', borderRadius: '4px', border: '1px solid var(--border)' }}>
                           <span style={{ 
                             fontSize: '9px', 
@@ -561,13 +777,13 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
                 )}
 
                 {/* Variant Sets */}
-                {Object.keys(selectedPrim.variantSets).length > 0 && (
+                {primDetails && Object.keys(primDetails.variantSets).length > 0 && (
                   <div className="panel" style={{ background: 'var(--bg-card)' }}>
                     <div className="panel-header" style={{ height: '36px', padding: '0 12px' }}>
                       <span style={{ fontSize: '11px', fontWeight: 600, color: 'var(--text-secondary)', textTransform: 'uppercase', letterSpacing: '0.04em' }}>USD Variant Sets</span>
                     </div>
                     <div style={{ padding: '12px', display: 'flex', flexWrap: 'wrap', gap: '16px' }}>
-                      {Object.entries(selectedPrim.variantSets).map(([vsetName, details]) => (
+                      {Object.entries(primDetails.variantSets).map(([vsetName, details]) => (
                         <div key={vsetName} style={{ display: 'flex', flexDirection: 'column', gap: '4px' }}>
                           <span style={{ fontSize: '11px', color: 'var(--text-secondary)', fontFamily: 'var(--font-mono)' }}>{vsetName}:</span>
                           <select 
@@ -589,7 +805,11 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
                 {/* Attributes Table */}
                 <div>
                   <h4 style={{ fontSize: '13px', fontWeight: 600, color: 'var(--text-secondary)', textTransform: 'uppercase', letterSpacing: '0.05em', marginBottom: '10px' }}>USD Properties & Attributes</h4>
-                  {selectedPrim.attributes.length > 0 ? (
+                  {!primDetails ? (
+                    <div style={{ padding: '16px', border: '1px dashed var(--border)', borderRadius: '6px', textAlign: 'center', color: 'var(--text-muted)', fontSize: '12px' }}>
+                      Loading attributes...
+                    </div>
+                  ) : primDetails.attributes.length > 0 ? (
                     <div style={{ border: '1px solid var(--border)', borderRadius: '6px', overflow: 'hidden', background: 'var(--bg-card)' }}>
                       <table style={{ width: '100%', borderCollapse: 'collapse', fontSize: '12px', fontFamily: 'var(--font-sans)', textAlign: 'left' }}>
                         <thead>
@@ -601,8 +821,8 @@ export default function USDInspector({ filePath, onClose }: USDInspectorProps) {
                           </tr>
                         </thead>
                         <tbody>
-                          {selectedPrim.attributes.map((attr, idx) => (
-                            <tr key={idx} style={{ borderBottom: idx < selectedPrim.attributes.length - 1 ? '1px solid var(--border)' : 'none' }}>
+                          {primDetails.attributes.map((attr, idx) => (
+                            <tr key={idx} style={{ borderBottom: idx < primDetails.attributes.length - 1 ? '1px solid var(--border)' : 'none' }}>
                               <td style={{ padding: '8px 12px', fontFamily: 'var(--font-mono)', color: '#fff' }}>{attr.name}</td>
                               <td style={{ padding: '8px 12px', color: 'var(--color-usd)', fontFamily: 'var(--font-mono)', fontSize: '11px' }}>{attr.type}</td>
                               <td style={{ padding: '8px 12px', color: 'var(--text-primary)', fontFamily: 'var(--font-mono)' }}>
@@ -0,0 +1,11 @@
+import pytest
+
+from src.backend import shared_state
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    """Keeps per-project server state (metadata mirrors, reports) out of the user's ~/.studiotools."""
+    path = tmp_path / "state"
+    monkeypatch.setattr(shared_state, "STATE_DIR", str(path))
+    return path
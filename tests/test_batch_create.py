@@ -0,0 +1,68 @@
+import os
+
+from fastapi.testclient import TestClient
+
+from src.backend import main
+from src.backend.main import app
+
+client = TestClient(app)
+
+
+def _hierarchy(*shots) -> list:
+    return [{
+        "name": "seq010",
+        "children": [{
+            "name": shot,
+            "type": "taskarea",
+            "subtype": "shot",
+            "children": [{"name": task, "type": "task", "subtype": task} for task in ("layout", "anim", "fx")]
+        } for shot in shots]
+    }, {"name": "assets"}]
+
+
+def _tree(root) -> list:
+    return sorted(os.path.relpath(os.path.join(dirpath, name), root)
+                  for dirpath, dirnames, filenames in os.walk(root) for name in dirnames + filenames)
+
+
+def test_batch_creates_every_node(tmp_path):
+    response = client.post("/api/batch/create", json={"parentPath": str(tmp_path), "nodes": _hierarchy("sh010", "sh020")})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 10
+    assert all(result["status"] == "created" for result in body["results"])
+    assert (tmp_path / "seq010" / "sh020" / "fx" / "published").is_dir()
+    assert (tmp_path / "assets" / "folder.yaml").is_file()
+
+
+def test_failed_node_rolls_back_the_whole_batch(tmp_path, monkeypatch):
+    (tmp_path / "existing").mkdir()
+    (tmp_path / "existing" / "keep.txt").write_text("untouched", encoding="utf-8")
+    before = _tree(tmp_path)
+    create_task_folder = main.create_task_folder
+
+    def failing(path: str, name: str, subtype: str):
+        if path.endswith(os.path.join("sh020", "anim")):
+            raise OSError("disk full")
+        create_task_folder(path, name, subtype)
+
+    monkeypatch.setattr(main, "create_task_folder", failing)
+    response = client.post("/api/batch/create", json={"parentPath": str(tmp_path), "nodes": _hierarchy("sh010", "sh020")})
+    assert response.status_code == 500
+    results = {os.path.relpath(result["path"], tmp_path): result for result in response.json()["detail"]["results"]}
+    assert results[os.path.join("seq010", "sh020", "anim")] == {
+        "path": str(tmp_path / "seq010" / "sh020" / "anim"), "type": "task", "status": "error", "detail": "disk full"
+    }
+    assert results["seq010"]["status"] == "rolledBack"
+    assert _tree(tmp_path) == before
+
+
+def test_invalid_batch_touches_nothing(tmp_path):
+    (tmp_path / "seq010").mkdir()
+    before = _tree(tmp_path)
+    nodes = _hierarchy("sh010") + [{"name": "bad/name"}, {"name": "odd", "type": "project"}]
+    response = client.post("/api/batch/create", json={"parentPath": str(tmp_path), "nodes": nodes})
+    assert response.status_code == 400
+    details = {result["path"]: result.get("detail") for result in response.json()["detail"]["results"] if result["status"] == "error"}
+    assert set(details) == {str(tmp_path / "seq010"), str(tmp_path / "bad/name"), str(tmp_path / "odd")}
+    assert _tree(tmp_path) == before
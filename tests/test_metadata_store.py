@@ -0,0 +1,66 @@
+import datetime
+
+import pytest
+
+from src.backend.metadata_io import load_yaml
+from src.backend.metadata_store import MetadataStore
+from src.backend import project_index
+from src.backend.project_index import ProjectIndex
+
+CARD = """\
+type: task
+subtype: anim
+date: 2024-03-01
+frames:
+  1001: {camera: cam_a}
+  1050: {camera: cam_b}
+"""
+
+
+def test_round_trip_keeps_yaml_types(tmp_path):
+    card = tmp_path / "folder.yaml"
+    card.write_text(CARD, encoding="utf-8")
+    data = load_yaml(CARD)
+    store = MetadataStore(str(tmp_path))
+    store.put(str(card), 1, len(CARD), data)
+    store.flush()
+
+    stored = MetadataStore(str(tmp_path)).lookup(str(card), 1, len(CARD))
+    assert stored == data
+    assert list(stored["frames"]) == [1001, 1050]
+    assert stored["date"] == datetime.date(2024, 3, 1)
+    # Another version of the file is parsed again
+    assert MetadataStore(str(tmp_path)).lookup(str(card), 2, len(CARD)) is None
+
+
+def test_cold_index_reads_the_same_cards(tmp_path, monkeypatch):
+    root = tmp_path / "show"
+    root.mkdir()
+    (root / "project.yaml").write_text("name: show\n", encoding="utf-8")
+    (root / "sh010").mkdir()
+    card = root / "sh010" / "folder.yaml"
+    card.write_text(CARD, encoding="utf-8")
+
+    warm = ProjectIndex(str(root))
+    warm.get_tree()
+    # A second index starts cold and takes the card from the mirror without parsing it
+    monkeypatch.setattr(project_index, "load_yaml", lambda f: pytest.fail("parsed again"))
+    cold = ProjectIndex(str(root))
+    cold.get_tree()
+    assert cold._cards[str(card)][2] == warm._cards[str(card)][2] == load_yaml(CARD)
+
+
+def test_deleted_cards_leave_the_mirror(tmp_path):
+    root = tmp_path / "show"
+    (root / "sh010").mkdir(parents=True)
+    (root / "project.yaml").write_text("name: show\n", encoding="utf-8")
+    card = root / "sh010" / "folder.yaml"
+    card.write_text(CARD, encoding="utf-8")
+    index = ProjectIndex(str(root))
+    index.get_tree()
+
+    card.unlink()
+    (root / "sh010").rmdir()
+    index.invalidate(str(root / "sh010"))
+    index.get_tree()
+    assert MetadataStore(str(root))._rows == {}
@@ -0,0 +1,80 @@
+import os
+import shutil
+
+from src.backend import project_index
+from src.backend.project_index import ProjectIndex, get_project_index, invalidate_path
+
+
+def _card(path, name: str, card: str = "folder.yaml", node_type: str = "folder"):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / card).write_text(f"name: {name}\ntype: {node_type}\n", encoding="utf-8")
+    return path
+
+
+def _names(node: dict) -> list:
+    return [child["name"] for child in node["children"]]
+
+
+def test_write_shows_up_after_invalidation(tmp_path, monkeypatch):
+    monkeypatch.setattr(project_index, "_INDEXES", {})
+    root = _card(tmp_path / "show", "show", "project.yaml")
+    _card(root / "seq010", "seq010")
+    index = get_project_index(str(root))
+    tree = index.get_tree()
+    version = index.version
+    assert _names(tree) == ["seq010"]
+
+    # Inside the revalidation window the index answers from memory until told about the write
+    _card(root / "seq020", "seq020")
+    assert index.get_tree() is tree
+    invalidate_path(str(root / "seq020"))
+    assert _names(index.get_tree()) == ["seq010", "seq020"]
+    assert index.version == version + 1
+
+
+def test_unchanged_nodes_are_reused(tmp_path):
+    root = _card(tmp_path / "show", "show", "project.yaml")
+    _card(root / "seq010", "seq010")
+    _card(root / "seq010" / "sh010", "sh010", node_type="task")
+    _card(root / "seq020", "seq020")
+    index = ProjectIndex(str(root))
+    before = index.get_tree()
+
+    _card(root / "seq020" / "sh020", "sh020")
+    index.invalidate(str(root / "seq020" / "sh020"))
+    after = index.get_tree()
+    assert after is not before
+    assert after["children"][0] is before["children"][0]
+    assert _names(after["children"][1]) == ["sh020"]
+
+
+def test_path_spellings_share_one_index(tmp_path, monkeypatch):
+    root = _card(tmp_path / "show", "show", "project.yaml")
+    os.symlink(root, tmp_path / "link")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(project_index, "_INDEXES", {})
+    index = get_project_index(str(root))
+    assert get_project_index(str(root) + "/") is index
+    assert get_project_index("show") is index
+    assert get_project_index(str(tmp_path / "link")) is index
+
+    _card(root / "seq010", "seq010")
+    invalidate_path(str(tmp_path / "link" / "seq010"))
+    assert _names(index.get_tree()) == ["seq010"]
+
+
+def test_deleted_folders_are_forgotten(tmp_path):
+    root = _card(tmp_path / "show", "show", "project.yaml")
+    for seq in ("seq010", "seq020"):
+        _card(root / seq, seq)
+        _card(root / seq / "sh010", "sh010", node_type="task")
+        (root / seq / "sh010" / "wip").mkdir()
+    index = ProjectIndex(str(root))
+    index.get_tree()
+    assert str(root / "seq020" / "sh010" / "wip") in index._dir_files
+
+    shutil.rmtree(root / "seq020")
+    index.invalidate(str(root / "seq020"))
+    assert _names(index.get_tree()) == ["seq010"]
+    for cache in (index._listings, index._cards, index._nodes, index._dir_files, index._task_files_cache):
+        assert not [path for path in cache if path.startswith(str(root / "seq020"))]
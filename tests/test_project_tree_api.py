@@ -0,0 +1,69 @@
+from fastapi.testclient import TestClient
+
+from src.backend.main import app
+
+client = TestClient(app)
+
+
+def _card(path, name: str, card: str = "folder.yaml"):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / card).write_text(f"name: {name}\ntype: folder\n", encoding="utf-8")
+    return path
+
+
+def _show(tmp_path):
+    root = _card(tmp_path / "show", "show", "project.yaml")
+    _card(root / "seq010", "seq010")
+    _card(root / "seq010" / "sh010", "sh010")
+    _card(root / "seq010" / "sh010" / "layout", "layout")
+    _card(root / "seq020", "seq020")
+    return root
+
+
+def test_etag_round_trip(tmp_path):
+    root = _show(tmp_path)
+    first = client.get("/api/project-tree", params={"path": str(root)})
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.json()["name"] == "show"
+
+    again = client.get("/api/project-tree", params={"path": str(root)}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+    assert again.content == b""
+
+    created = client.post("/api/folders", json={"parentPath": str(root), "name": "seq030", "type": "folder", "subtype": "custom"})
+    assert created.status_code == 200
+    changed = client.get("/api/project-tree", params={"path": str(root)}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert [child["name"] for child in changed.json()["children"]] == ["seq010", "seq020", "seq030"]
+
+
+def test_subtree_and_depth(tmp_path):
+    root = _show(tmp_path)
+    response = client.get("/api/project-tree", params={"path": str(root), "subtreePath": str(root / "seq010"), "depth": 0})
+    assert response.status_code == 200
+    node = response.json()
+    assert node["path"] == str(root / "seq010")
+    assert node["children"] == []
+    assert node["childCount"] == 1
+
+    response = client.get("/api/project-tree", params={"path": str(root), "subtreePath": str(root / "seq010"), "depth": 1})
+    shot = response.json()["children"][0]
+    assert shot["name"] == "sh010"
+    assert shot["children"] == [] and shot["childCount"] == 1
+
+    full = client.get("/api/project-tree", params={"path": str(root), "subtreePath": str(root / "seq010")}).json()
+    assert full["children"][0]["children"][0]["name"] == "layout"
+
+
+def test_unknown_paths_are_404(tmp_path):
+    root = _show(tmp_path)
+    assert client.get("/api/project-tree", params={"path": str(tmp_path / "missing")}).status_code == 404
+    response = client.get("/api/project-tree", params={"path": str(root), "subtreePath": str(root / "seq999")})
+    assert response.status_code == 404
+    # A folder without a card is not part of the hierarchy
+    (root / "loose").mkdir()
+    response = client.get("/api/project-tree", params={"path": str(root), "subtreePath": str(root / "loose")})
+    assert response.status_code == 404
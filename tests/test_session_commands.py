@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+from src.backend import session_commands
+from src.backend.session_commands import SessionCommandStore, SQLiteSessionCommandStore, SessionQueueFull
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    def make(**kwargs):
+        if request.param == "memory":
+            return SessionCommandStore(**kwargs)
+        return SQLiteSessionCommandStore(str(tmp_path / "sessions.db"), **kwargs)
+    return make
+
+
+def _command(n: int) -> dict:
+    return {"command": "load", "argument": str(n)}
+
+
+def test_drain_returns_commands_once_in_order(make_store):
+    store = make_store()
+    for n in range(3):
+        store.enqueue("maya:/show/sh010", _command(n))
+    store.enqueue("nuke:/show/sh010", _command(9))
+    assert store.drain("maya:/show/sh010") == [_command(0), _command(1), _command(2)]
+    assert store.drain("maya:/show/sh010") == []
+    assert store.drain("nuke:/show/sh010") == [_command(9)]
+
+
+def test_queue_is_bounded(make_store):
+    store = make_store(max_commands=2)
+    store.enqueue("maya:/a", _command(0))
+    store.enqueue("maya:/a", _command(1))
+    with pytest.raises(SessionQueueFull):
+        store.enqueue("maya:/a", _command(2))
+    store.enqueue("maya:/b", _command(3))
+    assert store.stats()["rejected"] == 1
+    assert store.drain("maya:/a") == [_command(0), _command(1)]
+    store.enqueue("maya:/a", _command(4))
+
+
+def test_idle_sessions_expire(make_store, monkeypatch):
+    monkeypatch.setattr(session_commands, "SWEEP_INTERVAL", 0.0)
+    store = make_store(ttl=60.0)
+    store.enqueue("maya:/idle", _command(0))
+    store.drain("maya:/active")
+    store.enqueue("maya:/active", _command(1))
+    assert store.stats()["pending"] == 2
+
+    # Shrinking the TTL to nothing makes both sessions overdue, the next call sweeps them
+    store.ttl = -1.0
+    store.enqueue("maya:/fresh", _command(2))
+    stats = store.stats()
+    assert stats["expired"] == 2
+    assert stats["depths"] == {"maya:/fresh": 1}
+    assert store.drain("maya:/idle") == []
+
+
+def test_concurrent_enqueue_and_drain_lose_nothing(make_store):
+    store = make_store(max_commands=10000)
+    key = "houdini:/show/sh010"
+    per_thread = 200
+    drained = []
+    done = threading.Event()
+
+    def producer(base: int):
+        for n in range(per_thread):
+            store.enqueue(key, _command(base + n))
+
+    def consumer():
+        while not done.is_set():
+            drained.extend(store.drain(key))
+        drained.extend(store.drain(key))
+
+    reader = threading.Thread(target=consumer)
+    reader.start()
+    producers = [threading.Thread(target=producer, args=(i * per_thread,)) for i in range(4)]
+    for thread in producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    done.set()
+    reader.join()
+
+    arguments = [int(command["argument"]) for command in drained]
+    assert sorted(arguments) == list(range(4 * per_thread))
+    # Each producer's commands come out in the order it queued them
+    for i in range(4):
+        mine = [n for n in arguments if i * per_thread <= n < (i + 1) * per_thread]
+        assert mine == sorted(mine)
+
+
+def test_watcher_reports_commands_queued_elsewhere(tmp_path):
+    db_path = str(tmp_path / "sessions.db")
+    store = SQLiteSessionCommandStore(db_path)
+    other_worker = SQLiteSessionCommandStore(db_path)
+    woken = []
+    seen = threading.Event()
+    store.watch(lambda keys: (woken.append(keys), seen.set()), 0.01)
+    try:
+        other_worker.enqueue("maya:/show/sh010", _command(0))
+        assert seen.wait(5)
+        assert woken[0] == ["maya:/show/sh010"]
+    finally:
+        store.unwatch()
+    assert store.drain("maya:/show/sh010") == [_command(0)]
@@ -0,0 +1,136 @@
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("pxr")
+
+from src.backend.stage_cache import StageCache
+
+
+def _write_layer(path: str, radius: float):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'#usda 1.0\n\ndef Sphere "ball"\n{{\n    double radius = {radius}\n}}\n')
+
+
+def _bump_mtime(path: str):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _radius(stage) -> float:
+    return stage.GetPrimAtPath("/ball").GetAttribute("radius").Get()
+
+
+def test_edit_waits_for_readers(tmp_path):
+    path = str(tmp_path / "ball.usda")
+    _write_layer(path, 1.0)
+    cache = StageCache()
+    reading = threading.Event()
+    edited = threading.Event()
+    seen = []
+
+    def reader():
+        with cache.reading(path) as stage:
+            reading.set()
+            seen.append(_radius(stage))
+            # The edit lands on disk while this reader still walks the stage
+            edited.wait(5)
+            seen.append(_radius(stage))
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    reading.wait(5)
+    _write_layer(path, 2.0)
+    _bump_mtime(path)
+
+    def second_reader():
+        with cache.reading(path) as stage:
+            seen.append(("second", _radius(stage)))
+
+    second = threading.Thread(target=second_reader)
+    second.start()
+    second.join(0.2)
+    # The reload waits for the first reader, so the second one is still blocked
+    assert second.is_alive()
+    edited.set()
+    thread.join(5)
+    second.join(5)
+
+    assert seen == [1.0, 1.0, ("second", 2.0)]
+    assert cache.stats()["reloads"] == 1
+
+
+def test_derived_values_follow_edits(tmp_path):
+    path = str(tmp_path / "ball.usda")
+    _write_layer(path, 1.0)
+    cache = StageCache()
+    assert cache.derived(path, "all", "radius", _radius) == 1.0
+
+    _write_layer(path, 3.0)
+    _bump_mtime(path)
+    assert cache.derived(path, "all", "radius", _radius) == 3.0
+    assert cache.derived(path, "all", "radius", lambda stage: pytest.fail("recomputed")) == 3.0
+
+
+def test_nested_read_does_not_reload(tmp_path):
+    path = str(tmp_path / "ball.usda")
+    _write_layer(path, 1.0)
+    cache = StageCache()
+    with cache.reading(path) as stage:
+        _write_layer(path, 4.0)
+        _bump_mtime(path)
+        with cache.reading(path) as nested:
+            assert nested is stage
+            assert _radius(nested) == 1.0
+    with cache.reading(path) as stage:
+        assert _radius(stage) == 4.0
+
+
+def test_write_inside_read_is_refused(tmp_path):
+    path = str(tmp_path / "ball.usda")
+    _write_layer(path, 1.0)
+    cache = StageCache()
+    with cache.reading(path):
+        with pytest.raises(RuntimeError):
+            with cache.writing(path):
+                pass
+
+
+def test_payload_changes_wait_for_readers(tmp_path):
+    payload = tmp_path / "payload.usda"
+    payload.write_text('#usda 1.0\n(\n    defaultPrim = "geo"\n)\n\ndef Xform "geo"\n{\n    def Sphere "ball"\n    {\n    }\n}\n')
+    root = str(tmp_path / "shot.usda")
+    with open(root, "w", encoding="utf-8") as f:
+        f.write('#usda 1.0\n\ndef Xform "asset" (\n    payload = @./payload.usda@\n)\n{\n}\n')
+    cache = StageCache()
+    reading = threading.Event()
+    release = threading.Event()
+    seen = []
+
+    def reader():
+        with cache.reading(root, "none") as stage:
+            reading.set()
+            release.wait(5)
+            seen.append(bool(stage.GetPrimAtPath("/asset/ball")))
+
+    def loader():
+        with cache.writing(root, "none") as stage:
+            stage.Load("/asset")
+        seen.append("loaded")
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    reading.wait(5)
+    writer = threading.Thread(target=loader)
+    writer.start()
+    writer.join(0.2)
+    assert writer.is_alive()
+    release.set()
+    thread.join(5)
+    writer.join(5)
+
+    assert seen == [False, "loaded"]
+    with cache.reading(root, "none") as stage:
+        assert stage.GetPrimAtPath("/asset/ball")
+    assert str(payload) in {path for path, _ in cache.signature(root, "none")}
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from src.backend.usd_utils import _triangulate_faces, _triangulated_index_count, _mesh_buffers, _inline_mesh_geometry
+
+
+def test_fan_triangulation_drops_truncated_faces():
+    # The 5 vertex face runs past the 9 indices and is dropped, the quad and the triangle fan
+    triangles = _triangulate_faces([4, 2, 3, 5], [0, 1, 2, 3, 9, 9, 4, 5, 6])
+    assert triangles.dtype == np.dtype("<u4")
+    assert triangles.tolist() == [0, 1, 2, 0, 2, 3, 4, 5, 6]
+
+
+def test_negative_and_degenerate_counts_are_skipped():
+    triangles = _triangulate_faces([-3, 3, 1, 4], [0, 1, 2, 3, 4, 5, 6, 7])
+    assert triangles.tolist() == [0, 1, 2, 4, 5, 6, 4, 6, 7]
+
+
+def test_empty_input():
+    triangles = _triangulate_faces([], [])
+    assert triangles.dtype == np.dtype("<u4")
+    assert len(triangles) == 0
+
+
+@pytest.mark.parametrize("counts, indices", [
+    ([4, 2, 3, 5], [0, 1, 2, 3, 9, 9, 4, 5, 6]),
+    ([-3, 3, 1, 4], [0, 1, 2, 3, 4, 5, 6, 7]),
+    ([3, 4, 5, 8, 1, 2], list(range(23))),
+    ([6], list(range(6))),
+])
+def test_index_count_matches_triangulation(counts, indices):
+    assert _triangulated_index_count(counts, indices, 0) == len(_triangulate_faces(counts, indices))
+
+
+def test_index_count_without_faces():
+    assert _triangulated_index_count([], [0, 1, 2, 3, 4, 5], 0) == 6
+    assert _triangulated_index_count([], [], 9) == 9
+
+
+def _quad_mesh(orientation: str):
+    """One quad on an in-memory stage, the stage is returned too as the mesh does not keep it alive."""
+    pxr = pytest.importorskip("pxr")
+    stage = pxr.Usd.Stage.CreateInMemory()
+    mesh = pxr.UsdGeom.Mesh.Define(stage, "/quad")
+    mesh.CreatePointsAttr([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+    mesh.CreateFaceVertexCountsAttr([4])
+    mesh.CreateFaceVertexIndicesAttr([0, 1, 2, 3])
+    mesh.CreateOrientationAttr(orientation)
+    return stage, mesh
+
+
+@pytest.mark.parametrize("orientation, expected", [
+    ("rightHanded", [0, 1, 2, 0, 2, 3]),
+    ("leftHanded", [0, 2, 1, 0, 3, 2]),
+])
+def test_winding_follows_orientation(orientation, expected):
+    stage, mesh = _quad_mesh(orientation)
+    points, indices = _mesh_buffers(mesh, mesh.GetFaceVertexCountsAttr().Get(), mesh.GetFaceVertexIndicesAttr().Get())
+    assert points.shape == (4, 3)
+    assert indices.tolist() == expected
+
+
+def test_inline_geometry_keeps_authored_winding():
+    # /api/usd/inspect lists meshes inline for the bundled viewer, which flips leftHanded winding itself
+    stage, mesh = _quad_mesh("leftHanded")
+    geometry = _inline_mesh_geometry(mesh)
+    assert geometry["points"][2] == [1.0, 1.0, 0.0]
+    assert geometry["indices"] == [0, 1, 2, 0, 2, 3]
@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from src.backend.version_index import TaskVersionIndex, parse_version, FIRST_VERSION
+
+
+def _save(task, app: str, name: str):
+    folder = task / "wip" / app
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / name).write_bytes(b"")
+    # Coarse filesystem timestamps could hide a save made within the same tick as the last read
+    st = os.stat(folder)
+    os.utime(folder, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("scene_v012.blend", ("blend", 12)),
+    ("shot.v3.hip", ("hip", 3)),
+    ("comp-V004.nk", ("nk", 4)),
+    ("notes.txt", None),
+])
+def test_parse_version(name, expected):
+    assert parse_version(name) == expected
+
+
+def test_new_save_raises_latest_version(tmp_path):
+    task = tmp_path / "sh010" / "anim"
+    index = TaskVersionIndex()
+    assert index.latest_version(str(task)) == FIRST_VERSION
+
+    _save(task, "blender", "anim_v001.blend")
+    _save(task, "blender", "anim_v002.blend")
+    assert index.latest_version(str(task)) == 2
+
+    _save(task, "blender", "anim_v003.blend")
+    assert index.latest_version(str(task)) == 3
+    _save(task, "houdini", "anim_v007.hip")
+    assert index.latest_versions(str(task)) == {"blender": {"blend": 3}, "houdini": {"hip": 7}}
+    assert index.latest_version(str(task)) == 7
+
+
+def test_deleting_the_latest_version_falls_back(tmp_path):
+    task = tmp_path / "sh010" / "anim"
+    index = TaskVersionIndex()
+    for n in (1, 2, 5):
+        _save(task, "blender", f"anim_v00{n}.blend")
+    assert index.latest_version(str(task)) == 5
+
+    folder = task / "wip" / "blender"
+    (folder / "anim_v005.blend").unlink()
+    st = os.stat(folder)
+    os.utime(folder, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert index.latest_version(str(task)) == 2
+
+
+def test_listings_from_the_tree_feed_the_index(tmp_path):
+    task = tmp_path / "sh010" / "anim"
+    _save(task, "blender", "anim_v004.blend")
+    folder = str(task / "wip" / "blender")
+    index = TaskVersionIndex()
+    index.record(folder, os.stat(folder).st_mtime_ns, os.listdir(folder))
+    assert index.latest_version(str(task)) == 4